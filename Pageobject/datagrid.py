@@ -0,0 +1,187 @@
+import time
+from selenium.common import ElementClickInterceptedException, StaleElementReferenceException
+from Pageobject.waits import Deadline, wait_until, DEFAULT_TIMEOUT, DEFAULT_POLL
+from Utilities.logger import logger  # Import centralized logger
+
+# Reads the rendered part of a MUI DataGrid in one call: column fields/titles and one text list per row.
+# With arguments[1] = true it then scrolls the virtual scroller down one viewport, for streaming.
+GRID_SCRIPT = """
+const grid = arguments[0] ? document.querySelector(arguments[0]) : document.querySelector(".MuiDataGrid-root");
+if (!grid) return null;
+const headers = Array.from(grid.querySelectorAll(".MuiDataGrid-columnHeader[data-field]"));
+const fields = headers.map(header => header.getAttribute("data-field"));
+const titles = headers.map(header => {
+    const title = header.querySelector(".MuiDataGrid-columnHeaderTitle");
+    return (title ? title.textContent : header.textContent).trim();
+});
+const rows = Array.from(grid.querySelectorAll(".MuiDataGrid-row")).map((row, position) => {
+    const cells = {};
+    row.querySelectorAll(".MuiDataGrid-cell[data-field]").forEach(cell => {
+        cells[cell.getAttribute("data-field")] = cell.textContent.trim();
+    });
+    const rowIndex = row.getAttribute("data-rowindex");
+    return [rowIndex === null ? position : parseInt(rowIndex, 10), row.getAttribute("data-id"),
+            fields.map(field => field in cells ? cells[field] : null)];
+});
+const scroller = grid.querySelector(".MuiDataGrid-virtualScroller");
+let atEnd = true;
+if (scroller) {
+    atEnd = scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 1;
+    if (arguments[1] && !atEnd) scroller.scrollTop += scroller.clientHeight;
+}
+return {fields: fields, titles: titles, rows: rows, atEnd: atEnd};
+"""
+SCROLL_TOP_SCRIPT = """
+const grid = arguments[0] ? document.querySelector(arguments[0]) : document.querySelector(".MuiDataGrid-root");
+const scroller = grid && grid.querySelector(".MuiDataGrid-virtualScroller");
+if (scroller) scroller.scrollTop = 0;
+"""
+# The element to click for one row (by its data-id): the first control or span in the cell of column
+# arguments[2], or the row's first data cell when no column is given. Scrolled into view, null if not rendered.
+CELL_SCRIPT = """
+const grid = arguments[0] ? document.querySelector(arguments[0]) : document.querySelector(".MuiDataGrid-root");
+if (!grid) return null;
+const row = grid.querySelector(`.MuiDataGrid-row[data-id="${CSS.escape(String(arguments[1]))}"]`);
+if (!row) return null;
+let target;
+if (arguments[2] === null) {
+    target = row.querySelector('.MuiDataGrid-cell[data-field]:not([data-field="__check__"]):not([data-field="actions"])');
+} else {
+    const cell = row.querySelector(`.MuiDataGrid-cell[data-field="${CSS.escape(arguments[2])}"]`);
+    target = cell && (cell.querySelector("button, a, [role='button'], span") || cell);
+}
+if (target) target.scrollIntoView({block: "nearest"});
+return target || null;
+"""
+
+
+class GridSnapshot:
+    """
+    Columnar copy of a DataGrid: one list per column, all of the same length, in row order.
+    Columns are addressed by header title ("Status") or by MUI field name ("status").
+    """
+
+    def __init__(self, fields, titles, rows):
+        self.fields = fields
+        self.titles = titles
+        rows = sorted(rows, key=lambda row: row[0])
+        self.row_indexes = [row[0] for row in rows]
+        self.row_ids = [row[1] for row in rows]
+        self.columns = {field: [row[2][position] for row in rows] for position, field in enumerate(fields)}
+
+    def __len__(self):
+        return len(self.row_indexes)
+
+    def _field(self, column):
+        if column in self.columns:
+            return column
+        if column in self.titles:
+            return self.fields[self.titles.index(column)]
+        raise KeyError(f"Grid has no column '{column}' (columns: {self.titles})")
+
+    def column(self, column):
+        return self.columns[self._field(column)]
+
+    def row(self, position):
+        """ ✅ One row as {title: text}. """
+        return {title: self.columns[field][position] for field, title in zip(self.fields, self.titles)}
+
+    def rows(self):
+        return [self.row(position) for position in range(len(self))]
+
+    def search(self, text):
+        """ ✅ [(position, field)] of every cell containing `text`, e.g. the row showing an uploaded file name. """
+        return [
+            (position, field) for field in self.fields for position, cell in enumerate(self.columns[field])
+            if cell and text in cell
+        ]
+
+    def find(self, **criteria):
+        """ ✅ Positions of the rows whose cells equal every criterion, e.g. find(status="VALIDATED"). """
+        columns = {self._field(column): value for column, value in criteria.items()}
+        return [
+            position for position in range(len(self))
+            if all(self.columns[field][position] == value for field, value in columns.items())
+        ]
+
+
+class DataGridReader:
+    """ ✅ Bulk reads of a MUI DataGrid: one execute_script per snapshot instead of one round trip per cell. """
+
+    def __init__(self, driver, selector=None):
+        self.driver = driver
+        self.selector = selector  # CSS selector of the grid root; the first .MuiDataGrid-root by default
+
+    def _read(self, scroll=False):
+        return self.driver.execute_script(GRID_SCRIPT, self.selector, scroll)
+
+    def _wait_for_rows(self, timeout):
+        def rendered(driver):
+            data = self._read()
+            return data if data and data["rows"] else False
+        return wait_until(self.driver, rendered, timeout, message=f"No DataGrid rows rendered within {timeout}s")
+
+    def _pages(self, timeout, settle, max_pages):
+        """ Raw script results, one viewport at a time, until the virtual scroller reaches the end. """
+        self._wait_for_rows(timeout)
+        try:
+            for _ in range(max_pages):
+                data = self._read(scroll=True)
+                yield data
+                if data["atEnd"]:
+                    return
+                time.sleep(settle)  # Let the grid render the rows scrolled into view
+            logger.warning(f"⚠️ DataGrid still not at the end after {max_pages} pages, stopping")
+        finally:
+            self.driver.execute_script(SCROLL_TOP_SCRIPT, self.selector)
+
+    def read(self):
+        """ ✅ GridSnapshot of what is rendered right now (empty when the grid is not there). Never waits. """
+        data = self._read()
+        return GridSnapshot(data["fields"], data["titles"], data["rows"]) if data else GridSnapshot([], [], [])
+
+    def click(self, row_id, column=None, timeout=DEFAULT_TIMEOUT):
+        """
+        ✅ Click one row by its data-id, instead of an indexed cell locator that points at whichever row is first.
+        `column` is a field name (GridSnapshot.fields); without it the row's first data cell is clicked.
+        """
+        def rendered(driver):
+            element = driver.execute_script(CELL_SCRIPT, self.selector, row_id, column)
+            return element if element and element.is_displayed() else False
+
+        deadline = Deadline(timeout)
+        while True:
+            try:
+                wait_until(self.driver, rendered, timeout, deadline=deadline,
+                           message=f"DataGrid row {row_id} not rendered within {timeout}s").click()
+                return
+            except (ElementClickInterceptedException, StaleElementReferenceException):
+                if deadline.expired:
+                    raise
+                time.sleep(DEFAULT_POLL)
+
+    def snapshot(self, timeout=DEFAULT_TIMEOUT):
+        """ ✅ Headers and the rows currently rendered, waiting until the grid has rendered at least one row. """
+        data = self._wait_for_rows(timeout)
+        return GridSnapshot(data["fields"], data["titles"], data["rows"])
+
+    def stream(self, timeout=DEFAULT_TIMEOUT, settle=0.2, max_pages=200):
+        """
+        ✅ Yield every row of a virtualized grid as (row index, {title: text}), one viewport per script call.
+        Rows already seen are skipped; the grid is scrolled back to the top afterwards.
+        """
+        seen = set()
+        for data in self._pages(timeout, settle, max_pages):
+            for row_index, _, cells in sorted(data["rows"], key=lambda row: row[0]):
+                if row_index not in seen:
+                    seen.add(row_index)
+                    yield row_index, dict(zip(data["titles"], cells))
+
+    def read_all(self, timeout=DEFAULT_TIMEOUT, settle=0.2, max_pages=200):
+        """ ✅ GridSnapshot of every row, scrolling through a virtualized grid if needed. """
+        rows, fields, titles = {}, [], []
+        for data in self._pages(timeout, settle, max_pages):
+            fields, titles = data["fields"], data["titles"]
+            for row in data["rows"]:
+                rows.setdefault(row[0], row)
+        return GridSnapshot(fields, titles, list(rows.values()))
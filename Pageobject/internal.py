@@ -1,99 +1,145 @@
 import logging
 import os
 import time
-from selenium.common import NoSuchElementException, TimeoutException
+from selenium.common import NoSuchElementException, TimeoutException, ElementClickInterceptedException, \
+    StaleElementReferenceException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from Pageobject.datagrid import DataGridReader
+from Pageobject.locators import get_registry, present, clickable
+from Pageobject.probe import wait_for_elements, all_ready
+from Pageobject.waits import Deadline, wait_until, wait_until_not, find, is_absent, DEFAULT_TIMEOUT, DEFAULT_POLL
+from Utilities.download_watcher import wait_for_downloads
+from Utilities.logger import logger  # Import centralized logger
+
+# Status labels shown in the batch grid, mapped to the values the tests compare against
+BATCH_STATUSES = {
+    "FAILED": "Failed",
+    "SUBMITTED": "Submitted",
+    "VALIDATED": "Validation",
+}
+
+
+def batch_status_of(text):
+    """The test-facing status for a grid cell's text ('VALIDATED ...' -> 'Validation'), or None."""
+    for label, status in BATCH_STATUSES.items():
+        if text and text.startswith(label):
+            return status
+    return None
+
+
+class BatchStatusWatcher:
+    """
+    Polls the status of a batch in the Internal grid with adaptive backoff: the row showing
+    `file_name` when given, otherwise the newest batch.
+
+    wait_for() returns as soon as the batch reaches an expected status and raises
+    TimeoutException once the deadline passes. Every observed status change is kept
+    in `transitions` together with how long the previous status lasted.
+    """
+
+    def __init__(self, page, timeout=90, initial_interval=0.5, max_interval=5, backoff=1.5, file_name=None):
+        self.page = page
+        self.file_name = file_name
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.transitions = []
+        self.last_status = None
+        self._started = time.monotonic()
+        self._status_since = self._started
+
+    def _observe(self):
+        """Read the current status once and record a transition if it changed."""
+        status = self.page.read_batch_status(self.file_name)
+        if status != self.last_status:
+            now = time.monotonic()
+            transition = {
+                "from": self.last_status,
+                "to": status,
+                "seconds": round(now - self._status_since, 2),
+            }
+            self.transitions.append(transition)
+            logger.info(f"⏱️ Batch status {transition['from']} -> {transition['to']} "
+                        f"after {transition['seconds']}s")
+            self.last_status = status
+            self._status_since = now
+            return status, True
+        return status, False
+
+    def _poll(self, is_done, timeout, description):
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        interval = self.initial_interval
+
+        while True:
+            status, changed = self._observe()
+            if is_done(status):
+                return status
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"Batch status is still '{status}' after waiting for {description}.")
+
+            # ✅ Poll quickly right after a change, back off while the batch sits in one state
+            interval = self.initial_interval if changed else min(interval * self.backoff, self.max_interval)
+            time.sleep(min(interval, remaining))
+
+    def wait_for(self, expected, timeout=None):
+        """Wait until the batch status is one of `expected` ("Failed", "Submitted", "Validation")."""
+        expected = [expected] if isinstance(expected, str) else list(expected)
+        return self._poll(lambda status: status in expected, timeout, f"one of {expected}")
+
+    def wait_for_change(self, timeout=None):
+        """Wait until the batch status differs from the last observed one."""
+        if self.last_status is None:
+            self._observe()
+        previous = self.last_status
+        return self._poll(lambda status: status != previous, timeout, f"a change from '{previous}'")
+
+    @property
+    def elapsed(self):
+        return round(time.monotonic() - self._started, 2)
 
 
-##
-
 class InternalPage:
     def __init__(self, driver):
         self.driver = driver
-        self.dropdown = '//*[@id="root"]/header/nav/div/ul/li[2]/button'
-        self.dropdown_option = '//*[@id="Sources-tables"]/div[3]/ul/li[3]'
-        self.internal_text = '//*[@id="root"]/div[2]/section/h3'
-        self.internal_batch = '//*[@id="grid-actions"]/button[1]'
-        self.adding_text = '//*[@id="root"]/h1'
-        self.created_header = '//*[@id="root"]/div[2]/div/div[2]/div[1]/div/div/div[2]/div[1]/div/div[1]/span/span'
-        self.batch_header = '//*[@id="root"]/div[2]/div/div[2]/div[1]/div/div/div[3]/div[1]/div/div[1]/span'
-        self.file_header = '//*[@id="root"]/div[2]/div/div[2]/div[1]/div/div/div[5]/div[1]/div/div[1]/span/span'
-        self.status_header = '//*[@id="root"]/div[2]/div/div[2]/div[1]/div/div/div[4]/div[1]/div/div[1]/span/span'
-        self.download_file = '//*[@id="root"]/section/div[1]/div/section/h5'
-        self.upload_file = '//*[@id="root"]/section/div[2]/div/section[1]/section/h5'
-        self.download_template1_button = '//*[@id="root"]/section/div[1]/div/ul/li[1]/button'
-        self.download_template2_button = '//*[@id="root"]/section/div[1]/div/ul/li[2]/button'
-        self.download_template3_button = '//*[@id="root"]/section/div[1]/div/ul/li[3]/button'
-        self.download_template4_button = '//*[@id="root"]/section/div[1]/div/ul/li[4]/button'
-        self.back_arrow = '//*[@id="root"]/section/button'
-        self.temp_dropdown = '//*[@id="root"]/section/div[2]/div/section[1]/div/div'
+        self.locators = get_registry().page("InternalPage")  # Pageobject/locators.json
+        self.batch_grid = DataGridReader(driver)
         self.Domestic_Payments_dropdown = 'Template Domestic Payments'
-        self.upload_button = '//*[@id="root"]/section/div[2]/div/section[2]/input'
-        self.validate_button = '//*[@id="root"]/section/div[2]/div/div/button'
         self.Domestic_Payments_sourcelink_dropdown = "Template Domestic Payments with Source Link(s)"
         self.International_payments = 'Template International Payments'
         self.Commerce_payment = 'Template Commerce Payments'
-        self.error_message_file = '//*[@id="root"]/section/div[2]/div/section[2]/section/span'
-        self.upload_filename = '//*[@id="root"]/section/div[2]/div/section[2]/section/ul/li/p'
-        self.popup_message = '//*[@id="upload-status-notification"]/div'
-        self.check_back = '//*[@id="upload-status-notification"]/div[3]/div/div/div/button'
-        self.file_status_submit = '//*[@id="root"]/div[2]/div/div[2]/div[2]/div/div/div[7]/div[5]/div/span'
-        self.file_status_validate = '//*[@id="root"]/div[2]/div/div[2]/div[2]/div/div/div[1]/div[5]/div/span[1]'
-        self.file_status_failed = '//*[@id="root"]/div[2]/div/div[2]/div[2]/div/div/div[1]/div[5]/div/span[1]'
-        self.total_payment = '//*[@id="root"]/section/div[1]/div/div[1]/div[3]/p[2]/span[1]'
-        self.total_invoice = '//*[@id="root"]/section/div[1]/div/div[1]/div[3]/p[2]/span[3]'
-        self.error = '//*[@id="root"]/section/div[1]/div/div[1]/div[2]/span'
-        self.warring = '//*[@id="root"]/section/div[1]/div/div[1]/div[2]/span'
-        self.finalize_submission = '//*[@id="action_item_finalize_submission"]/div'
-        self.continue_submission = '//*[@id="finalize"]/div[3]/div/div/div/button[2]'
-        self.manual_batches_actions = '//*[@id="root"]/section/div[2]/h3'
-        self.go_to_payments_button = '//*[@id="action_item_go_to_payments"]/p'
-        self.download_pci_safe_original_button = '//*[@id="action_item_download_pci_safe_original"]/p'
-        self.download_pci_safe_final_button = '//*[@id="action_item_download_pci_safe_final"]/p'
-        self.payment_page = '//*[@id="root"]/div[2]/section/h3'
-        self.check_back_later = '/html/body/div[5]/div[3]/div/div/div/button'
-        self.download_pci = '//*[@id="action_item_download_pci_safe_original"]/p'
-        self.download_original = '//*[@id="action_item_download_original"]/p'
-        self.download_final = '//*[@id="action_item_download_final"]/p'
-        self.file_status = ' //*[@id="root"]/section/div[1]/div/div[3]/p[2]'
-        self.download_latest = '//*[@id="action_item_download_latest_file"]/p'
-        self.warring_message = '//*[@id="root"]/section/div[1]/div/div[2]'
-        self.upload_again = '//*[@id="action_item_upload_again"]/p'
-        self.upload_again_button= '//*[@id="upload-again"]/div[3]/div/div/section/section[2]/input'
-        self.again_validate_button = '//*[@id="upload-again"]/div[3]/div/div/section/div/button'
-        self.again_check_back_latter = '//*[@id="upload-status-notification"]/div[3]/div/div/div/button'
-        self.internal_page_validate = '//*[@id="root"]/div[2]/div/div[2]/div[2]/div/div/div[1]/div[5]/div/span[1]'
-        self.discard_batch = '//*[@id="action_item_discard_batch"]'
-        self.discard_button ='//*[@id="discard-batch"]/div[3]/div/div/div/button[2]'
-        self.contact_production = '//*[@id="action_item_contact_production_support"]/p'
-        self.payment_record = '//*[@id="root"]/div[2]/div/div[2]/div[2]/div/div/div[1]/div[5]'
         # self.success_message = '//*[@id="successMessage"]'
 
+    def _find(self, name, timeout=DEFAULT_TIMEOUT):
+        """Registry lookup with an explicit wait (the driver's implicit wait is 0)."""
+        return self.locators[name].find(self.driver, timeout)
+
     def click_dropdown(self):
-        self.driver.find_element(By.XPATH, self.dropdown).click()
+        self._find("dropdown").click()
 
     def select_dropdown_option(self):
-        self.driver.find_element(By.XPATH, self.dropdown_option).click()
+        self._find("dropdown_option").click()
 
     def is_internal_displayed(self):
         """Check if 'Dynamic Boost Status' text is displayed on the dashboard."""
         try:
-            return WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self.internal_text))
+            return wait_until(
+                self.driver, present(self.locators["internal_text"]), 10
             ).is_displayed()
         except:
             return False
 
     def click_internal_batch(self):
-        self.driver.find_element(By.XPATH, self.internal_batch).click()
+        self._find("internal_batch").click()
 
     def is_adding_batch_displayed(self):
 
         try:
-            return WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self.adding_text))
+            return wait_until(
+                self.driver, present(self.locators["adding_text"]), 10
             ).is_displayed()
         except:
             return False
@@ -101,29 +147,26 @@ class InternalPage:
     def is_element_visible(self, xpath):
         """Generic method to check if an element is visible on the page."""
         try:
-            return WebDriverWait(self.driver, 10).until(
-                EC.visibility_of_element_located((By.XPATH, xpath))
+            return wait_until(
+                self.driver, EC.visibility_of_element_located((By.XPATH, xpath)), 10
             ).is_displayed()
         except TimeoutException:
             return False
 
-    def are_key_elements_visible(self):
-        """Verify that the key columns are displayed on the 'Internal' page."""
-        return all([
-            self.is_element_visible(self.created_header),
-            self.is_element_visible(self.batch_header),
-            self.is_element_visible(self.file_header),
-            self.is_element_visible(self.status_header)
-        ])
+    def are_key_elements_visible(self, timeout=DEFAULT_TIMEOUT):
+        """Verify that the key columns are displayed on the 'Internal' page (one probe per poll for all four)."""
+        names = ("created_header", "batch_header", "file_header", "status_header")
+        states = wait_for_elements(self.driver, {name: self.locators[name] for name in names}, timeout)
+        return all_ready(states)
 
     def are_download_upload_sections_visible(self):
         """Verify that 'Download Files' and 'Upload File' sections are present."""
         try:
-            download_visible = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self.download_file))
+            download_visible = wait_until(
+                self.driver, present(self.locators["download_file"]), 10
             ).is_displayed()
-            upload_visible = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, self.upload_file))
+            upload_visible = wait_until(
+                self.driver, present(self.locators["upload_file"]), 10
             ).is_displayed()
             return download_visible and upload_visible
         except TimeoutException:
@@ -131,115 +174,105 @@ class InternalPage:
 
     def click_download_template1(self):
         """Click the 'Download' button for 'Template Domestic Payments'."""
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, self.download_template1_button))
+        wait_until(
+            self.driver, clickable(self.locators["download_template1_button"]), 10
         ).click()
 
     def click_download_template2(self):
         """Click the 'Download' button for 'Template Domestic Payments'."""
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, self.download_template2_button))
+        wait_until(
+            self.driver, clickable(self.locators["download_template2_button"]), 10
         ).click()
 
     def click_download_template3(self):
         """Click the 'Download' button for 'Template Domestic Payments'."""
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, self.download_template3_button))
+        wait_until(
+            self.driver, clickable(self.locators["download_template3_button"]), 10
         ).click()
 
     def click_download_template4(self):
         """Click the 'Download' button for 'Template Domestic Payments'."""
-        WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, self.download_template4_button))
+        wait_until(
+            self.driver, clickable(self.locators["download_template4_button"]), 10
         ).click()
 
-    def is_file_downloaded(self, download_dir, file_name, timeout=15):
-        """Verify if the file is downloaded within the timeout period."""
-        file_path = os.path.join(download_dir, file_name)
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            # Check if file exists and is not a partial download
-            if os.path.exists(file_path) and not file_name.endswith('.crdownload'):
-                print(f"File found: {file_path}")  # Debug log
-                return True
-            else:
-                print(f"File not found or still downloading: {file_path}")  # Debug log
+    def is_file_downloaded(self, download_dir, file_name, since, timeout=15, checksum=None):
+        """
+        Verify the file finished downloading within the timeout; returns as soon as the browser closes it.
+        `since` is time.time() taken before the click, so a same-named file left by an earlier test does not count.
+        """
+        checksums = {file_name: checksum} if checksum else None
+        return file_name in wait_for_downloads(download_dir, [file_name], timeout, checksums=checksums, since=since)
 
-            time.sleep(1)  # Reduced sleep time for quicker checks
-
-        return False
+    def are_files_downloaded(self, download_dir, file_names, since, timeout=15, checksums=None):
+        """Wait for several downloads at once (started after `since`); True only when every file finished in time."""
+        done = wait_for_downloads(download_dir, file_names, timeout, checksums=checksums, since=since)
+        return len(done) == len(set(file_names))
 
     def is_option_clickable(self, option_name):
         option = self.driver.find_element(By.XPATH, [option_name])
         return option.is_enabled() and option.is_displayed()
 
     def click_back_arrow(self):
-        self.driver.find_element(By.XPATH, self.back_arrow).click()
+        self._find("back_arrow").click()
 
     def click_template_dropdown(self):
-        self.driver.find_element(By.XPATH, self.temp_dropdown).click()
+        self._find("temp_dropdown").click()
 
     def click_template_domestic_file(self):
-        self.driver.find_element(By.NAME, self.Domestic_Payments_dropdown).click()
+        find(self.driver, (By.NAME, self.Domestic_Payments_dropdown)).click()
 
     # def add_file(self, file_path):
-    #     self.driver.find_element(By.XPATH, self.upload_button).send_keys(file_path)
+    #     self._find("upload_button").send_keys(file_path)
     def add_file(self, file_name):
         """Uploads a file by sending the file path to the upload button."""
         file_path = os.path.abspath(file_name)
-        print("Uploading file:", file_path)  # Debugging output
-        self.driver.find_element(By.XPATH, self.upload_button).send_keys(file_path)
+        logger.info(f"📂 Uploading file: {file_path}")
+        self._find("upload_button").send_keys(file_path)
 
     def click_validate_button(self):
         """Clicks the Validate button to process the file."""
-        self.driver.find_element(By.XPATH, self.validate_button).click()
+        self._find("validate_button").click()
 
     def click_template_domestic_sourcelink_file(self):
-        self.driver.find_element(By.NAME, self.Domestic_Payments_sourcelink_dropdown).click()
+        find(self.driver, (By.NAME, self.Domestic_Payments_sourcelink_dropdown)).click()
 
     def click_template_international_file(self):
-        self.driver.find_element(By.NAME, self.International_payments).click()
+        find(self.driver, (By.NAME, self.International_payments)).click()
 
     def click_template_commerce_file(self):
-        self.driver.find_element(By.NAME, self.Commerce_payment).click()
+        find(self.driver, (By.NAME, self.Commerce_payment)).click()
 
     def get_file_error_message(self):
         try:
-            return self.driver.find_element(By.XPATH, self.error_message_file).text
+            return self._find("error_message_file").text
         except NoSuchElementException:
             return None
 
     def is_validate_button_disabled(self):
         """Checks if the 'Validate' button is disabled."""
-        validate_button = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, self.validate_button))
+        validate_button = wait_until(
+            self.driver, present(self.locators["validate_button"]), 10
         )
         return "disabled" in validate_button.get_attribute("class")
 
     def get_uploaded_file_name(self):
         """Returns the name of the file displayed after upload."""
-        file_name_display = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, self.upload_filename))
+        file_name_display = wait_until(
+            self.driver, present(self.locators["upload_filename"]), 10
         )
         return file_name_display.text
 
     def is_popup_message_displayed(self):
         """Check if the popup message is displayed."""
-        popup_message = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, self.popup_message))
+        popup_message = wait_until(
+            self.driver, present(self.locators["popup_message"]), 10
         )
         return "We’re validating your file!This could take a few minutes.  " in popup_message.text
 
     def click_check_button(self):
-        self.driver.find_element(By.XPATH, self.check_back).click()
+        self.click_to_close("check_back")
 
-    def get_file_status(self):
-        """Get the file status from the internal page."""
-        file_status = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, self.file_status))
-        )
-        return file_status.text
     def get_file_status(self):
         """Returns the status of the uploaded file (e.g., 'Submitted' or 'Validation')."""
         # try:
@@ -252,87 +285,158 @@ class InternalPage:
         # except:
         #     pass
 
-        try:
-            validated_element = self.driver.find_element(By.XPATH,
-                                                         "(//div[contains(@class, 'MuiDataGrid-cell')]//span[text()='VALIDATED'])[1]")
-            print("First 'VALIDATED' status found:", validated_element.text.strip())
+        # ✅ One read of the whole grid instead of a find_element per status
+        shown = {status for _, status in self.read_batch_statuses()}
+        for status in ("Validation", "Failed"):
+            if status in shown:
+                logger.info(f"First '{status}' status found")
+                return status
 
-            return "Validation"
-        except:
-            pass
+        return None  # If neither status is found
 
-        try:
-            failed_element = self.driver.find_element(By.XPATH,
-                                                         "((//div[contains(@class, 'MuiDataGrid-cell')]//span[text()='FAILED'])[1]")
-            print("First 'FAILED' status found:", failed_element.text.strip())
+    def read_batch_rows(self, file_name=None):
+        """
+        [(row index, row id, status, status field)] for every rendered batch row that shows a status, top row first,
+        limited to the rows showing `file_name` when given. One script (DataGridReader), never waits.
+        """
+        snapshot = self.batch_grid.read()
+        matching = {position for position, _ in snapshot.search(file_name)} if file_name else range(len(snapshot))
+        rows = []
+        for position in sorted(matching):
+            for field in snapshot.fields:
+                status = batch_status_of(snapshot.columns[field][position])
+                if status:
+                    rows.append((snapshot.row_indexes[position], snapshot.row_ids[position], status, field))
+                    break
+        return rows
+
+    def read_batch_statuses(self, file_name=None):
+        """[(row index, status)] for every batch row rendered in the grid (or showing `file_name`), top row first."""
+        return [(row_index, status) for row_index, _, status, _ in self.read_batch_rows(file_name)]
+
+    def read_batch_grid(self, all_rows=False):
+        """GridSnapshot of the batches grid (headers + rows) from one script; all_rows scrolls through every page."""
+        return self.batch_grid.read_all() if all_rows else self.batch_grid.snapshot()
+
+    def read_batch_status(self, file_name=None):
+        """Status of the newest batch in the grid (or of the one showing `file_name`), None if none is shown. Never waits."""
+        rows = self.read_batch_statuses(file_name)
+        return rows[0][1] if rows else None
+
+    def _wait_for_batch_row(self, expected=None, timeout=DEFAULT_TIMEOUT, file_name=None):
+        """Poll the grid until a row (showing `file_name`, if given) has one of `expected`; its read_batch_rows() entry."""
+        expected = [expected] if isinstance(expected, str) else expected
+
+        def first_row(driver):
+            for row in self.read_batch_rows(file_name):
+                if expected is None or row[2] in expected:
+                    return row
+            return False
 
-            return "Failed"
-        except:
-            pass
+        batch = f" for {file_name}" if file_name else ""
+        return wait_until(self.driver, first_row, timeout,
+                          message=f"No batch status {expected or list(BATCH_STATUSES.values())}{batch} within {timeout}s")
+
+    def find_batch_status(self, expected=None, timeout=DEFAULT_TIMEOUT, file_name=None):
+        """
+        Poll the grid until a row shows a status (one of `expected`, if given) and return (status, row index)
+        of the topmost such row, or of the row showing `file_name`. Raises TimeoutException when none appears in time.
+        """
+        row_index, _, status, _ = self._wait_for_batch_row(expected, timeout, file_name)
+        return status, row_index
+
+    def watch_batch_status(self, **kwargs):
+        """Returns a BatchStatusWatcher for the newest batch on this page (or the one showing file_name=...)."""
+        return BatchStatusWatcher(self, **kwargs)
+
+    def click_batch_status(self, expected, file_name=None, timeout=15):
+        """Click the status of the batch showing `file_name` (else the newest one in status `expected`), by row id."""
+        _, row_id, _, field = self._wait_for_batch_row(expected, timeout, file_name)
+        self.batch_grid.click(row_id, field, timeout)
+
+    def click_when_ready(self, name, timeout=15):
+        """Click the named locator as soon as it is clickable, retrying while an overlay or animation intercepts it."""
+        deadline = Deadline(timeout)
+        while True:
+            try:
+                wait_until(self.driver, clickable(self.locators[name]), deadline=deadline).click()
+                return
+            except (ElementClickInterceptedException, StaleElementReferenceException):
+                if deadline.expired:
+                    raise
+                time.sleep(DEFAULT_POLL)
 
-        return None  # If neither status is found
+    def click_to_close(self, name, timeout=15):
+        """Click a dialog button, then wait for the dialog to go away so the next step does not hit its overlay."""
+        self.click_when_ready(name, timeout)
+        wait_until_not(self.driver, present(self.locators[name]), timeout,
+                       message=f"Dialog button '{name}' still shown {timeout}s after clicking it")
+
+    def is_dialog_closed(self, name, timeout=0):
+        """True once the dialog holding `name` is gone; a single lookup unless a timeout is given."""
+        return is_absent(self.driver, self.locators[name], timeout)
 
-    def click_status_button(self):
-        self.driver.find_element(By.XPATH, self.file_status_validate).click()
+    def click_status_button(self, file_name=None):
+        self.click_batch_status("Validation", file_name)
 
-    def click_failed_status_button(self):
-        self.driver.find_element(By.XPATH, self.file_status_failed).click()
+    def click_failed_status_button(self, file_name=None):
+        self.click_batch_status("Failed", file_name)
 
     def get_total_payments(self):
-        return self.driver.find_element(By.XPATH, self.total_payment).text
+        return self._find("total_payment").text
 
     def get_total_invoices(self):
-        return self.driver.find_element(By.XPATH, self.total_invoice).text
+        return self._find("total_invoice").text
 
     def get_errors(self):
-        return self.driver.find_element(By.XPATH, self.error).text
+        return self._find("error").text
 
     def click_finalize_button(self):
-        self.driver.find_element(By.XPATH, self.finalize_submission).click()
+        self.click_when_ready("finalize_submission")
 
     def click_continue_button(self):
-        self.driver.find_element(By.XPATH, self.continue_submission).click()
+        self.click_to_close("continue_submission")
 
     def is_manual_batches_actions_displayed(self):
-        return self.driver.find_element(By.XPATH, self.manual_batches_actions).is_displayed()
+        return self._find("manual_batches_actions").is_displayed()
 
     def is_go_to_payments_button_displayed(self):
-        return self.driver.find_element(By.XPATH, self.go_to_payments_button).is_displayed()
+        return self._find("go_to_payments_button").is_displayed()
 
     def is_download_pci_safe_original_button_displayed(self):
-        return self.driver.find_element(By.XPATH, self.download_pci_safe_original_button).is_displayed()
+        return self._find("download_pci_safe_original_button").is_displayed()
 
     def is_download_pci_safe_final_button_displayed(self):
-        return self.driver.find_element(By.XPATH, self.download_pci_safe_final_button).is_displayed()
+        return self._find("download_pci_safe_final_button").is_displayed()
 
     def click_go_to_payment(self):
-        self.driver.find_element(By.XPATH, self.go_to_payments_button).click()
+        self.click_when_ready("go_to_payments_button")
 
     def click_check_back_later(self):
-        self.driver.find_element(By.XPATH, self.check_back_later).click()
+        self.click_to_close("check_back_later")
 
     def is_payment_page_displayed(self):
-        return self.driver.find_element(By.XPATH, self.payment_page).is_displayed()
+        return self._find("payment_page").is_displayed()
 
     def click_download_pci(self):
-        self.driver.find_element(By.XPATH, self.download_pci).click()
+        self.click_when_ready("download_pci")
 
     def click_download_final_pci(self):
-        self.driver.find_element(By.XPATH, self.download_pci_safe_final_button).click()
+        self.click_when_ready("download_pci_safe_final_button")
 
     def click_download_original(self):
-        self.driver.find_element(By.XPATH, self.download_original).click()
+        self.click_when_ready("download_original")
 
     def click_download_final(self):
-        self.driver.find_element(By.XPATH, self.download_final).click()
+        self.click_when_ready("download_final")
 
     def is_file_status_page_displayed(self):
         """Verifies whether the file status page is displayed."""
-        return self.driver.find_element(By.XPATH, self.file_status).is_displayed()
+        return self._find("file_status").is_displayed()
 
     def get_error_and_warning_counts(self):
-        error_warning_text = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, self.error))  # ✅ Fix applied
+        error_warning_text = wait_until(
+            self.driver, present(self.locators["error"]), 10  # ✅ Fix applied
         ).text
         numbers = [int(num) for num in error_warning_text.split() if num.isdigit()]
 
@@ -342,62 +446,54 @@ class InternalPage:
             return {"errors": 0, "warnings": 0}
 
     def click_download_latest_file(self):
-        self.driver.find_element(By.XPATH, self.download_latest).click()
+        self.click_when_ready("download_latest")
 
     def is_warning_message_displayed(self):
         """Check if the warning message is displayed on the file status page."""
-        return self.driver.find_element(By.XPATH, self.warring_message).is_displayed()
+        return self._find("warring_message").is_displayed()
 
     def click_upload_again(self):
-        self.driver.find_element(By.XPATH,self.upload_again).click()
+        self.click_when_ready("upload_again")
 
     def add_again_file(self, file_name):
         """Uploads a file by sending the file path to the upload button."""
         file_path = os.path.abspath(file_name)
-        print("Uploading file:", file_path)  # Debugging output
-        self.driver.find_element(By.XPATH, self.upload_again_button).send_keys(file_path)
+        logger.info(f"📂 Uploading file: {file_path}")
+        self._find("upload_again_button").send_keys(file_path)
 
     def click_again_validate_button(self):
-        self.driver.find_element(By.XPATH,self.again_validate_button).click()
+        self._find("again_validate_button").click()
 
     def click_again_check_back_button(self):
-        self.driver.find_element(By.XPATH,self.again_check_back_latter).click()
+        self.click_to_close("again_check_back_latter")
 
     def is_internal_validate_button_displayed(self):
-        return self.driver.find_element(By.XPATH, self.internal_page_validate).is_displayed()
+        return self._find("internal_page_validate").is_displayed()
 
     def click_discard_batch(self):
-        self.driver.find_element(By.XPATH, self.discard_batch).click()
+        self.click_when_ready("discard_batch")
 
     def click_discard_batch_button(self):
-        self.driver.find_element(By.XPATH,self.discard_button).click()
+        self.click_when_ready("discard_button")
+
+    def is_discard_dialog_closed(self, timeout=10):
+        return self.is_dialog_closed("discard_button", timeout)
 
     def get_file_failed_status(self):
         """Returns the status of the uploaded file (e.g., 'Submitted', 'Validation', or 'Failed')."""
-        statuses = [
-            ("FAILED", "Failed"),  # Check for failed status first
-            ("SUBMITTED", "Submitted"),
-            ("VALIDATED", "Validation")
-        ]
-
-        for status_text, status_value in statuses:
-            try:
-                element = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located(
-                        (By.XPATH, f"(//div[contains(@class, 'MuiDataGrid-cell')]//span[text()='{status_text}'])[1]")
-                    )
-                )
-                print(f"First '{status_text}' status found:", element.text.strip())
-                return status_value
-            except Exception as e:
-                print(f"Status '{status_text}' not found. Error: {e}")
-                continue
-
-        return None  # If none of the statuses are found
+        try:
+            status, row_index = self.find_batch_status(timeout=10)
+            logger.info(f"First '{status}' status found in row {row_index}")
+            return status
+        except TimeoutException as e:
+            logger.warning(f"⚠️ {e.msg}")
+            return None  # If none of the statuses are found
 
     def click_contact_production(self):
-        self.driver.find_element(By.XPATH, self.contact_production).click()
+        self.click_when_ready("contact_production")
 
 
-    def click_payment_row(self):
-        self.driver.find_element(By.XPATH,self.payment_record).click()
\ No newline at end of file
+    def click_payment_row(self, position=0):
+        """Open a row of the grid (the first one by default), clicked by its row id."""
+        snapshot = self.batch_grid.snapshot(15)
+        self.batch_grid.click(snapshot.row_ids[position], timeout=15)
\ No newline at end of file
@@ -0,0 +1,327 @@
+import functools
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from selenium.common import NoSuchElementException, StaleElementReferenceException
+from Pageobject.waits import DEFAULT_TIMEOUT, DEFAULT_POLL
+from Utilities.logger import logger, get_output_dir, get_environment  # Import centralized logger
+
+try:
+    import fcntl  # ✅ POSIX only: serializes parallel workers merging into the same healing index
+except ImportError:
+    fcntl = None
+
+LOCATORS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locators.json")
+STRATEGY_ORDER = ("id", "css", "xpath")  # Primary first; the XPath is the fallback
+FALLBACK_FLAG_RATIO = 0.5  # Flag a locator when at least half of its lookups needed a fallback...
+FALLBACK_FLAG_MIN_LOOKUPS = 3  # ...over at least this many successful lookups
+HEALING_CACHE_DIR = os.getenv(
+    "BOOST_LOCATOR_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "boost-qa", "locators")
+)
+
+# JavaScript shared with Pageobject.probe: resolve one locator's candidates in order, in the browser,
+# and describe the element found so it can be healed if its selectors stop matching later
+RESOLVE_FUNCTION = """
+function fingerprintElement(element) {
+    const steps = [];
+    let node = element, anchor = "body";
+    while (node && node.parentElement && node !== document.body) {
+        if (node !== element && node.id && !node.id.includes(":")) { anchor = "#" + CSS.escape(node.id); break; }
+        const sameTag = Array.from(node.parentElement.children).filter(child => child.tagName === node.tagName);
+        steps.unshift(node.tagName.toLowerCase() + ":nth-of-type(" + (sameTag.indexOf(node) + 1) + ")");
+        node = node.parentElement;
+    }
+    const text = (element.innerText || "").trim();
+    return {
+        tag: element.tagName.toLowerCase(),
+        id: element.id || null,
+        text: text && text.length <= 80 && !text.includes("\\n") ? text : null,
+        aria_label: element.getAttribute("aria-label"),
+        name: element.getAttribute("name"),
+        testid: element.getAttribute("data-testid"),
+        position: [anchor].concat(steps).join(" > "),
+    };
+}
+
+function resolveLocator(candidates) {
+    for (let index = 0; index < candidates.length; index++) {
+        const [strategy, value] = candidates[index];
+        let element = null;
+        try {
+            if (strategy === "id") element = document.getElementById(value);
+            else if (strategy === "css") element = document.querySelector(value);
+            else element = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        } catch (e) { element = null; }  // Invalid selector: try the next candidate
+        if (element) return [element, index, fingerprintElement(element)];
+    }
+    return [null, -1, null];
+}
+"""
+RESOLVE_SCRIPT = RESOLVE_FUNCTION + "return resolveLocator(arguments[0]);"
+
+
+def _css_string(value):
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class HealingCache:
+    """
+    Fingerprints (id, text, aria-label, name, data-testid, position under the nearest id) of every
+    element a locator found, kept per environment in HEALING_CACHE_DIR/<ENV>.json.
+
+    When all of a locator's selectors miss, the alternatives built from its last fingerprint are
+    tried in the same script, so a layout change heals immediately instead of timing out.
+    """
+
+    def __init__(self, env, cache_dir=HEALING_CACHE_DIR):
+        self.path = os.path.join(cache_dir, f"{env}.json")
+        self.fingerprints = self._read()
+        self._dirty = set()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable locator healing cache {self.path}: {e}")
+            return {}
+
+    def remember(self, key, fingerprint):
+        if fingerprint and self.fingerprints.get(key) != fingerprint:
+            self.fingerprints[key] = fingerprint
+            self._dirty.add(key)
+
+    def alternatives(self, key):
+        """ ✅ [(kind, strategy, value), ...] to try after the registered selectors, most specific first. """
+        fingerprint = self.fingerprints.get(key)
+        if not fingerprint:
+            return []
+        tag = fingerprint["tag"]
+        alternatives = []
+        if fingerprint.get("id") and ":" not in fingerprint["id"]:  # ':r3:' style ids are generated per render
+            alternatives.append(("id", "id", fingerprint["id"]))
+        for kind, attribute in (("testid", "data-testid"), ("aria_label", "aria-label"), ("name", "name")):
+            if fingerprint.get(kind):
+                alternatives.append((kind, "css", f"{tag}[{attribute}={_css_string(fingerprint[kind])}]"))
+        if fingerprint.get("text") and '"' not in fingerprint["text"]:
+            alternatives.append(("text", "xpath", f'//{tag}[normalize-space(.)="{fingerprint["text"]}"]'))
+        if fingerprint.get("position"):
+            alternatives.append(("position", "css", fingerprint["position"]))
+        return alternatives
+
+    def save(self):
+        """ ✅ Merge this run's fingerprints into the on-disk index (atomic rename, locked against other workers). """
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(f"{self.path}.lock", "w") as lock_file:
+                if fcntl:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                merged = self._read()
+                merged.update({key: self.fingerprints[key] for key in self._dirty})
+                temp_path = f"{self.path}.{uuid.uuid4().hex}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as cache_file:
+                    json.dump(merged, cache_file, indent=1)
+                os.replace(temp_path, self.path)
+            self._dirty.clear()
+        except OSError as e:
+            logger.warning(f"⚠️ Could not save locator healing cache {self.path}: {e}")
+
+
+class LocatorStats:
+    """ ✅ Which strategy resolved each locator and how long the lookups took. """
+
+    def __init__(self):
+        self.entries = {}  # "Page.name" -> counters
+
+    def record(self, locator, strategy, seconds):
+        """ `strategy` is the registered strategy that matched, "healed:<kind>" or None for a miss. """
+        entry = self.entries.setdefault(locator.key, {
+            "lookups": 0, "missing": 0, "healed": 0, "seconds": 0.0, "positional": locator.positional,
+            "strategies": {strategy: 0 for strategy, _ in locator.candidates},
+        })
+        entry["lookups"] += 1
+        entry["seconds"] += seconds
+        if strategy is None:
+            entry["missing"] += 1
+            return
+        entry["strategies"][strategy] = entry["strategies"].get(strategy, 0) + 1
+        if strategy.startswith("healed:"):
+            if not entry["healed"]:
+                logger.warning(f"🩹 Locator {locator.key} healed via its cached {strategy[7:]} - update locators.json")
+            entry["healed"] += 1
+
+    def positional(self):
+        return [key for key, entry in self.entries.items() if entry["positional"]]
+
+    def healed(self):
+        return [(key, entry["healed"]) for key, entry in self.entries.items() if entry["healed"]]
+
+    def flagged(self):
+        """ ✅ Locators whose primary selector keeps missing while a fallback finds the element. """
+        flagged = []
+        for key, entry in self.entries.items():
+            found = entry["lookups"] - entry["missing"]
+            primary = next(iter(entry["strategies"]))
+            fallback = found - entry["strategies"][primary]
+            if found >= FALLBACK_FLAG_MIN_LOOKUPS and fallback / found >= FALLBACK_FLAG_RATIO:
+                flagged.append((key, fallback, found))
+        return flagged
+
+    def report(self):
+        """ ✅ Log flagged locators and write the stats to Metrics/<ENV>[/<worker>]/. Returns the file path. """
+        if not self.entries:
+            return None
+        for key, fallback, found in self.flagged():
+            logger.warning(f"⚠️ Locator {key} needed its fallback in {fallback}/{found} lookups - update its primary selector")
+        for key, healed in self.healed():
+            logger.warning(f"🩹 Locator {key} only matched through the healing cache ({healed} lookups)")
+        if self.positional():
+            logger.info(f"📐 {len(self.positional())} locator(s) used this run have no stable hook and rely on "
+                        f"layout position: {', '.join(self.positional())}")
+
+        metrics_dir = get_output_dir("Metrics")
+        os.makedirs(metrics_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        path = os.path.join(metrics_dir, f"locator_stats_{timestamp}.json")
+        with open(path, "w", encoding="utf-8") as stats_file:
+            json.dump({
+                "locators": self.entries,
+                "flagged": [key for key, _, _ in self.flagged()],
+                "healed": [key for key, _ in self.healed()],
+                "positional": self.positional(),
+            }, stats_file, indent=1)
+        logger.info(f"🔎 Locator stats written to: {path}")
+        return path
+
+
+class Locator:
+    """
+    A named element with a primary selector (id or CSS), fallbacks (the original XPath) and, once it has
+    been found, healing alternatives from the cache. All of them are tried in one execute_script,
+    so a stale primary costs no extra round trip.
+    `positional` marks elements the app gives no id, name or aria/data attribute: they are found by
+    their place in the layout (the absolute XPath, or a grid row/column index) and break when it shifts.
+    """
+
+    def __init__(self, page, name, candidates, registry, positional=False):
+        self.page = page
+        self.name = name
+        self.candidates = candidates  # [(strategy, value), ...] in the order they are tried
+        self.registry = registry
+        self.positional = positional
+
+    @property
+    def key(self):
+        return f"{self.page}.{self.name}"
+
+    @property
+    def xpath(self):
+        return dict(self.candidates).get("xpath")
+
+    def lookup_candidates(self):
+        """ ✅ (candidates, strategy labels): registered selectors first, then the healing alternatives. """
+        alternatives = self.registry.healing.alternatives(self.key)
+        candidates = self.candidates + [(strategy, value) for _, strategy, value in alternatives]
+        labels = [strategy for strategy, _ in self.candidates] + [f"healed:{kind}" for kind, _, _ in alternatives]
+        return candidates, labels
+
+    def record(self, labels, index, seconds, fingerprint):
+        """ ✅ Book one lookup: which strategy matched, how long it took, and the element's fingerprint. """
+        self.registry.stats.record(self, labels[index] if index >= 0 else None, seconds)
+        self.registry.healing.remember(self.key, fingerprint)
+
+    def resolve(self, driver):
+        """ ✅ (element, index of the candidate that matched) or (None, -1). Never waits. """
+        candidates, labels = self.lookup_candidates()
+        started = time.perf_counter()
+        element, index, fingerprint = driver.execute_script(RESOLVE_SCRIPT, candidates)
+        self.record(labels, index, time.perf_counter() - started, fingerprint)
+        return element, index
+
+    def find(self, driver, timeout=DEFAULT_TIMEOUT, interval=DEFAULT_POLL):
+        """ ✅ Like driver.find_element: wait up to `timeout` for the element, then raise NoSuchElementException. """
+        deadline = time.monotonic() + timeout
+        while True:
+            element, _ = self.resolve(driver)
+            if element is not None:
+                return element
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise NoSuchElementException(f"Locator {self.key} matched nothing: {self.candidates}")
+            time.sleep(min(interval, remaining))
+
+    def __repr__(self):
+        return f"Locator({self.key})"
+
+
+class LocatorRegistry:
+    """ ✅ Every page object's locators, loaded once per process from Pageobject/locators.json. """
+
+    def __init__(self, path=LOCATORS_FILE, env=None):
+        self.stats = LocatorStats()
+        self.healing = HealingCache(env or get_environment())
+        with open(path, encoding="utf-8") as locators_file:
+            data = json.load(locators_file)
+        self.pages = {
+            page: {
+                name: Locator(page, name, [(strategy, entry[strategy]) for strategy in STRATEGY_ORDER if entry.get(strategy)],
+                              self, entry.get("positional", False))
+                for name, entry in entries.items()
+            }
+            for page, entries in data.items()
+        }
+
+    def page(self, page):
+        return self.pages[page]
+
+    def get(self, page, name):
+        return self.pages[page][name]
+
+
+@functools.lru_cache(maxsize=None)
+def get_registry():
+    return LocatorRegistry()
+
+
+def report_locator_stats():
+    """ ✅ Called at session end: save the healing index and report. Does nothing if no page object loaded the registry. """
+    if get_registry.cache_info().currsize:
+        registry = get_registry()
+        registry.healing.save()
+        return registry.stats.report()
+    return None
+
+
+# ✅ Expected conditions for WebDriverWait(...).until(), resolving through the registry
+
+def present(locator):
+    def condition(driver):
+        element, _ = locator.resolve(driver)
+        return element if element is not None else False
+    return condition
+
+
+def visible(locator):
+    def condition(driver):
+        element, _ = locator.resolve(driver)
+        try:
+            return element if element is not None and element.is_displayed() else False
+        except StaleElementReferenceException:
+            return False
+    return condition
+
+
+def clickable(locator):
+    def condition(driver):
+        element, _ = locator.resolve(driver)
+        try:
+            return element if element is not None and element.is_displayed() and element.is_enabled() else False
+        except StaleElementReferenceException:
+            return False
+    return condition
@@ -1,23 +1,21 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from Pageobject.waits import wait_until, DEFAULT_TIMEOUT
 from Utilities.logger import logger  # Import centralized logger
 
 
 class LoginPage:
     """Page Object Model for the Login Page with Generic Waits."""
 
-    def __init__(self, driver, implicit_wait=15, explicit_wait=15):
+    def __init__(self, driver, explicit_wait=DEFAULT_TIMEOUT):
         """
         Initialize LoginPage with WebDriver.
-        :param driver: WebDriver instance
-        :param implicit_wait: Default implicit wait time
+        :param driver: WebDriver instance (its implicit wait stays 0, all waits are explicit)
         :param explicit_wait: Default explicit wait time
         """
         self.driver = driver
-        self.driver.implicitly_wait(implicit_wait)  # Set implicit wait globally
-        self.wait = WebDriverWait(driver, explicit_wait)  # Set explicit wait
+        self.explicit_wait = explicit_wait
 
         # Locators
         self.email_field = (By.ID, "email")
@@ -25,10 +23,11 @@ class LoginPage:
         self.submit_button = (By.XPATH, '//*[@id="root"]/div/div/form/button[2]')
         self.error_message = (By.XPATH, "//*[@id='root']/div/div[1]/div/div[1]")
 
-    def wait_for_element(self, locator, condition=EC.presence_of_element_located, timeout=15):
+    def wait_for_element(self, locator, condition=EC.presence_of_element_located, timeout=None):
         """Generic method to wait for an element with a given condition."""
+        timeout = self.explicit_wait if timeout is None else timeout
         try:
-            return WebDriverWait(self.driver, timeout).until(condition(locator))
+            return wait_until(self.driver, condition(locator), timeout)
         except TimeoutException:
             logger.error(f"Element {locator} was not found within {timeout} seconds.")
             return None
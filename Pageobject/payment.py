@@ -2,43 +2,36 @@ import logging
 import time
 from selenium.common import NoSuchElementException, TimeoutException, ElementNotInteractableException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from Pageobject.datagrid import DataGridReader
+from Pageobject.locators import get_registry, visible, clickable
+from Pageobject.waits import wait_until, DEFAULT_TIMEOUT
 
 class PaymentPage:
-    def __init__(self, driver, implicit_wait=15, explicit_wait=15):
+    def __init__(self, driver, explicit_wait=DEFAULT_TIMEOUT):
         self.driver = driver
-        self.driver = driver
-        self.driver.implicitly_wait(implicit_wait)  # Set implicit wait globally
-        self.wait = WebDriverWait(driver, explicit_wait)  # Set explicit wait
-        # Locators//*[@id="root"]/div[2]/div/div[2]/div[2]/div/div/div[1]/div[5]
-        self.payment_record = (By.XPATH, '//*[@id="root"]/div[2]/div/div[2]/div[2]/div/div/div[1]/div[5]')
-        self.payment_tab = (By.XPATH, '//*[@id="root"]/section/div[1]/div/div[1]/div[3]/div/button[1]')
-        self.received_date = (By.XPATH, "//div[contains(text(), 'Received Date')]/following-sibling::div")
-        self.process_date = (By.XPATH, "//div[contains(text(), 'Process Date')]/following-sibling::div")
-        self.payment_status = (By.XPATH, "//div[contains(text(), 'Payment Status')]/following-sibling::div")
-        self.source_name = (By.XPATH, "//div[contains(text(), 'Source Name')]/following-sibling::div")
-        self.buyer_name = (By.XPATH, "//div[contains(text(), 'Buyer Name')]/following-sibling::div")
-        self.merchant_name = (By.XPATH, "//div[contains(text(), 'Merchant Name')]/following-sibling::div")
-        self.add_note = (By.XPATH, '//*[@id="action_item_add_note_to_payment"]/p')
-        self.note_text_area = (By.XPATH, '//*[@id="add-note"]')
-        self.submit = (By.XPATH, '//*[@id="addNotes-dialog"]/div[3]/div/div/section/button[2]')
-        self.cancel = (By.XPATH, '//*[@id="addNotes-dialog"]/div[3]/div/div/section/button[1]')
-        self.download_payment_details = (By.XPATH, '//*[@id="action_item_download_payment_details"]/p')
-        self.link_source = (By.XPATH, '//*[@id="action_item_link_source"]/p')
+        self.explicit_wait = explicit_wait  # The driver's implicit wait stays 0, all waits are explicit
+        self.locators = get_registry().page("PaymentPage")  # Pageobject/locators.json
+        self.payments_grid = DataGridReader(driver)
 
-    def wait_for_element(self, locator, condition=EC.presence_of_element_located, timeout=15):
+    def wait_for_element(self, locator, condition=EC.presence_of_element_located, timeout=None):
         """Generic method to wait for an element with a given condition."""
+        timeout = self.explicit_wait if timeout is None else timeout
         try:
-            return WebDriverWait(self.driver, timeout).until(condition(locator))
+            return wait_until(self.driver, condition(locator), timeout)
         except TimeoutException:
             logging.error(f"Element {locator} was not found within {timeout} seconds.")
             return None
 
-    def click_payment_record(self):
+    def read_payments_grid(self, all_rows=False):
+        """GridSnapshot of the payments grid (headers + rows) from one script; all_rows scrolls through every page."""
+        return self.payments_grid.read_all() if all_rows else self.payments_grid.snapshot()
+
+    def click_payment_record(self, position=0):
+        """Open a payment (the first row by default), clicked by its row id in the payments grid."""
         try:
-            WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.payment_record)).click()
+            snapshot = self.payments_grid.snapshot(10)
+            self.payments_grid.click(snapshot.row_ids[position], timeout=10)
             logging.info("Clicked on the payment record.")
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to click payment record: {e}")
@@ -46,56 +39,56 @@ class PaymentPage:
 
     def is_payment_tab_displayed(self):
         try:
-            return WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.payment_tab)).is_displayed()
+            return wait_until(self.driver, visible(self.locators["payment_tab"]), 10).is_displayed()
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Payment tab not displayed: {e}")
             return False
 
     def get_received_date(self):
         try:
-            return WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.received_date)).text
+            return wait_until(self.driver, visible(self.locators["received_date"]), 10).text
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to get received date: {e}")
             raise
 
     def get_process_date(self):
         try:
-            return WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.process_date)).text
+            return wait_until(self.driver, visible(self.locators["process_date"]), 10).text
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to get process date: {e}")
             raise
 
     def get_payment_status(self):
         try:
-            return WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.payment_status)).text
+            return wait_until(self.driver, visible(self.locators["payment_status"]), 10).text
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to get payment status: {e}")
             raise
 
     def get_source_name(self):
         try:
-            return WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.source_name)).text
+            return wait_until(self.driver, visible(self.locators["source_name"]), 10).text
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to get source name: {e}")
             raise
 
     def get_buyer_name(self):
         try:
-            return WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.buyer_name)).text
+            return wait_until(self.driver, visible(self.locators["buyer_name"]), 10).text
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to get buyer name: {e}")
             raise
 
     def get_merchant_name(self):
         try:
-            return WebDriverWait(self.driver, 10).until(EC.visibility_of_element_located(self.merchant_name)).text
+            return wait_until(self.driver, visible(self.locators["merchant_name"]), 10).text
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to get merchant name: {e}")
             raise
 
     def click_add_note(self):
         try:
-            WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.add_note)).click()
+            wait_until(self.driver, clickable(self.locators["add_note"]), 10).click()
             logging.info("Clicked on 'Add Note'.")
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to click 'Add Note': {e}")
@@ -119,7 +112,7 @@ class PaymentPage:
 
     def click_download_payment_details(self):
         try:
-            WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.download_payment_details)).click()
+            wait_until(self.driver, clickable(self.locators["download_payment_details"]), 10).click()
             logging.info("Clicked on 'Download Payment Details'.")
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to click 'Download Payment Details': {e}")
@@ -127,7 +120,7 @@ class PaymentPage:
 
     def click_link_source(self):
         try:
-            WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.link_source)).click()
+            wait_until(self.driver, clickable(self.locators["link_source"]), 10).click()
             logging.info("Clicked on 'Link Source'.")
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to click 'Link Source': {e}")
@@ -135,7 +128,7 @@ class PaymentPage:
 
     def click_cancel_button(self):
         try:
-            WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.cancel)).click()
+            wait_until(self.driver, clickable(self.locators["cancel"]), 10).click()
             logging.info("Clicked on 'cancel button'.")
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to click 'cancel button': {e}")
@@ -143,7 +136,7 @@ class PaymentPage:
 
     def click_submit_button(self):
         try:
-            WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.submit)).click()
+            wait_until(self.driver, clickable(self.locators["submit"]), 10).click()
             logging.info("Clicked on 'cancel button'.")
         except (NoSuchElementException, TimeoutException) as e:
             logging.error(f"Failed to click 'cancel button': {e}")
@@ -153,8 +146,9 @@ class PaymentPage:
         """Enter text into the note text area."""
         try:
             # Wait for the text area to be visible and interactable
-            text_area = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable(self.note_text_area))
+            text_area = wait_until(
+                self.driver, clickable(self.locators["note_text_area"]), 10
+            )
             logging.info(f"Text area found: {text_area}")
             text_area.clear()  # Clear any existing text
             text_area.send_keys(note_text)
@@ -167,7 +161,7 @@ class PaymentPage:
 
     def submit_note(self):
         """Click the 'Submit' button to add the note."""
-        WebDriverWait(self.driver, 10).until(EC.element_to_be_clickable(self.submit)).click()
+        wait_until(self.driver, clickable(self.locators["submit"]), 10).click()
 
 # import logging
 # from selenium.common import NoSuchElementException, TimeoutException, ElementNotInteractableException
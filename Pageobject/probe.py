@@ -0,0 +1,75 @@
+import time
+from Pageobject.locators import Locator, RESOLVE_FUNCTION
+from Pageobject.waits import Deadline, DEFAULT_TIMEOUT, DEFAULT_POLL
+from Utilities.logger import logger  # Import centralized logger
+
+# Resolves every locator in one round trip and reports what the tests usually ask Selenium for one element at a time
+PROBE_SCRIPT = RESOLVE_FUNCTION + """
+const states = {};
+for (const [name, candidates] of Object.entries(arguments[0])) {
+    const [element, index] = resolveLocator(candidates);
+    if (!element) {
+        states[name] = {present: false, visible: false, enabled: false, text: null, strategy: -1};
+        continue;
+    }
+    const style = window.getComputedStyle(element);
+    const visible = element.getClientRects().length > 0 && style.visibility !== "hidden"
+        && style.display !== "none" && parseFloat(style.opacity || "1") > 0;
+    const enabled = !element.disabled && element.getAttribute("aria-disabled") !== "true";
+    states[name] = {present: true, visible: visible, enabled: enabled, text: (element.innerText || "").trim(),
+                    strategy: index, fingerprint: fingerprintElement(element)};
+}
+return states;
+"""
+
+
+def probe_elements(driver, locators):
+    """
+    ✅ One execute_script for many elements.
+    `locators` maps a name to a registry Locator or a plain XPath;
+    returns {name: {"present", "visible", "enabled", "text", "strategy"}}. Never waits.
+    """
+    candidates, labels = {}, {}
+    for name, locator in locators.items():
+        if isinstance(locator, Locator):
+            candidates[name], labels[name] = locator.lookup_candidates()
+        else:
+            candidates[name] = [("xpath", locator)]
+    started = time.perf_counter()
+    states = driver.execute_script(PROBE_SCRIPT, candidates)
+    seconds = (time.perf_counter() - started) / max(len(locators), 1)
+    for name, locator in locators.items():
+        if isinstance(locator, Locator):
+            state = states[name]
+            locator.record(labels[name], state["strategy"], seconds, state.pop("fingerprint", None))
+    return states
+
+
+def wait_for_elements(driver, locators, timeout=DEFAULT_TIMEOUT, clickable=False, interval=DEFAULT_POLL):
+    """
+    ✅ Poll the whole group with probe_elements() until every element is visible (and enabled when
+    `clickable`), or until the deadline. Returns the last states, so callers can tell which ones were missing.
+    """
+    deadline = Deadline(timeout)
+    while True:
+        try:
+            states = probe_elements(driver, locators)
+        except Exception as e:  # Page still navigating, script blocked, ...
+            logger.warning(f"⚠️ Element probe failed, retrying: {e}")
+            states = {name: {"present": False, "visible": False, "enabled": False, "text": None, "strategy": -1}
+                      for name in locators}
+
+        if all_ready(states, clickable):
+            return states
+
+        if deadline.expired:
+            missing = [name for name, state in states.items() if not state["visible"]]
+            disabled = [name for name, state in states.items() if clickable and state["visible"] and not state["enabled"]]
+            logger.warning(f"⚠️ Elements not ready after {timeout}s - not visible: {missing}, disabled: {disabled}")
+            return states
+        time.sleep(min(interval, deadline.remaining))
+
+
+def all_ready(states, clickable=False):
+    """ ✅ True when every probed element is visible (and enabled when `clickable`). """
+    return all(state["visible"] and (state["enabled"] or not clickable) for state in states.values())
@@ -0,0 +1,79 @@
+import os
+import time
+from selenium.common import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+# ✅ One wait engine for every page object. The driver's implicit wait stays 0 (see Utilities.driver_pool),
+# so each wait below is the only wait in play and a negative check costs exactly what it asks for.
+DEFAULT_TIMEOUT = float(os.getenv("BOOST_WAIT_TIMEOUT", "10"))
+DEFAULT_POLL = float(os.getenv("BOOST_WAIT_POLL", "0.25"))
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+class Deadline:
+    """ ✅ A time budget shared by every wait inside one page-object call. """
+
+    def __init__(self, seconds=DEFAULT_TIMEOUT):
+        self.seconds = seconds
+        self._ends = time.monotonic() + seconds
+
+    @property
+    def remaining(self):
+        return max(self._ends - time.monotonic(), 0.0)
+
+    @property
+    def expired(self):
+        return self.remaining <= 0
+
+    def budget(self, timeout=None):
+        """ Seconds the next wait may take: its own timeout, capped by what is left of the budget. """
+        return self.remaining if timeout is None else min(timeout, self.remaining)
+
+
+def wait_until(driver, condition, timeout=DEFAULT_TIMEOUT, poll=DEFAULT_POLL, message="", deadline=None):
+    """ ✅ WebDriverWait(...).until() with the suite's poll interval and an optional shared Deadline. """
+    if deadline is not None:
+        timeout = deadline.budget(timeout)
+    return WebDriverWait(driver, timeout, poll_frequency=poll, ignored_exceptions=IGNORED_EXCEPTIONS).until(
+        condition, message
+    )
+
+
+def wait_until_not(driver, condition, timeout=DEFAULT_TIMEOUT, poll=DEFAULT_POLL, message="", deadline=None):
+    """ ✅ Wait for a condition to stop holding (spinner gone, dialog closed, ...). """
+    if deadline is not None:
+        timeout = deadline.budget(timeout)
+    return WebDriverWait(driver, timeout, poll_frequency=poll, ignored_exceptions=IGNORED_EXCEPTIONS).until_not(
+        condition, message
+    )
+
+
+def find(driver, locator, timeout=DEFAULT_TIMEOUT, deadline=None):
+    """ ✅ Explicit replacement for driver.find_element under an implicit wait: (By, value) -> element. """
+    return wait_until(driver, EC.presence_of_element_located(locator), timeout, deadline=deadline,
+                      message=f"Element {locator} not found within {timeout}s")
+
+
+def is_present(driver, locator):
+    """ ✅ One check, no waiting. Accepts a (By, value) tuple or a registry Locator. """
+    if hasattr(locator, "resolve"):
+        return locator.resolve(driver)[0] is not None
+    return bool(driver.find_elements(*locator))
+
+
+def is_absent(driver, locator, timeout=0, poll=DEFAULT_POLL):
+    """
+    ✅ Fast negative check: True as soon as the element is not in the DOM.
+    With the default timeout of 0 this is a single lookup; pass a timeout to wait for an element to go away.
+    """
+    ends = time.monotonic() + timeout
+    while True:
+        try:
+            if not is_present(driver, locator):
+                return True
+        except StaleElementReferenceException:
+            return True
+        if time.monotonic() >= ends:
+            return False
+        time.sleep(min(poll, max(ends - time.monotonic(), 0)))
@@ -1,20 +1,41 @@
 import os
+import shutil
+import time
 import pytest
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from Utilities.logger import logger  # Import centralized logger
+from selenium.common.exceptions import NoSuchElementException
+from Pageobject.login import LoginPage
+from Pageobject.internal import InternalPage
+from Pageobject.locators import report_locator_stats
+from Utilities.driver_pool import DriverPool, get_pool_size
+from Utilities.session_cache import LoginSessionCache, DEFAULT_TTL
+from Utilities.utils import env_config, test_data, take_screenshot, write_screenshot, archive_old_screenshots
+from Utilities.screenshots import flush_screenshots, wait_for_screenshot
+from Utilities.capture_policy import CAPTURE_MODES, configure_capture_policy, get_capture_policy
+from Utilities.instrumentation import instrumentation, enable_instrumentation
+from Utilities.logger import logger, flush_logs, get_output_dir, get_worker_id  # Import centralized logger
 
 
 def pytest_addoption(parser):
     """ ✅ Add CLI options for environment and headless mode """
     parser.addoption("--env", action="store", default="DEV", help="Choose environment: DEV, UAT, PROD")
     parser.addoption("--headless", action="store_true", help="Run tests in headless mode")
+    parser.addoption("--browser-pool-size", action="store", type=int, default=None,
+                     help="Number of warm browser sessions kept per worker (default: 1)")
+    parser.addoption("--login-cache-ttl", action="store", type=int, default=DEFAULT_TTL,
+                     help="Seconds to reuse a login when the server token has no expiry (0 disables the cache)")
+    parser.addoption("--log-json", action="store_true",
+                     help="Also write logs as JSON lines (Logs/<ENV>/*.jsonl) for machine ingestion")
+    parser.addoption("--instrument", action="store_true",
+                     help="Record wall time, wait time and WebDriver round trips of every page-object call")
+    parser.addoption("--screenshots", action="store", choices=CAPTURE_MODES, default=None,
+                     help="When screenshots are written: failure (default), sampled, buffer or always")
+    parser.addoption("--screenshot-sample", action="store", type=float, default=None,
+                     help="Share of passing tests captured in 'sampled' mode (default: 0.05)")
+    parser.addoption("--screenshot-buffer", action="store", type=int, default=None,
+                     help="Step screenshots kept per test in 'buffer' mode (default: 5)")
+    parser.addoption("--screenshot-seed", action="store", type=int, default=None,
+                     help="Seed for 'sampled' mode, to reproduce which passing tests were captured")
 
 
 def pytest_configure(config):
@@ -22,55 +43,243 @@ def pytest_configure(config):
     env = config.getoption("--env") or "DEV"
     os.environ["ENVIRONMENT"] = env.upper()  # ✅ Set it globally before imports
     print(f"🌍 Using environment: {os.environ['ENVIRONMENT']}")  # Debugging log
+    if config.getoption("--log-json"):
+        os.environ["BOOST_LOG_JSON"] = "1"  # ✅ Read when the logger is configured on first use
+    if config.getoption("--instrument"):
+        enable_instrumentation(config)
+    configure_capture_policy(config.getoption("--screenshots"), config.getoption("--screenshot-sample"),
+                             config.getoption("--screenshot-buffer"), config.getoption("--screenshot-seed"))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session, exitstatus):
+    """ ✅ Report locator fallbacks, then make sure every queued screenshot and log record is on disk before reports are written """
+    report_locator_stats()
+    logger.info(get_capture_policy().summary())
+    flush_screenshots()
+    flush_logs()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_screenshot_archive():
+    """ ✅ Runs once before any test execution to archive previous Screenshots (one rename, zipped in the background) """
+    archive_old_screenshots()
+
+
+def pytest_runtest_setup(item):
+    """ ✅ Every test starts with an empty step-screenshot buffer """
+    get_capture_policy().start_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """ ✅ Attach screenshots to the HTML report, as the capture policy decides (see --screenshots) """
+    outcome = yield
+    report = outcome.get_result()
+
+    # After the test body, or after a setup that failed (the test body then never runs)
+    if report.when != "call" and not (report.when == "setup" and report.failed):
+        return
+    driver = item.funcargs.get("driver", None)
+    if not driver:
+        return
+
+    policy = get_capture_policy()
+    ENV = os.getenv("ENVIRONMENT", "DEV").upper()
+    screenshot_paths = []
+    for data, path in policy.drain(report.failed):  # Buffered steps, only written when the test failed
+        write_screenshot(data, path)
+        screenshot_paths.append(path)
+    suffix = policy.final_capture(item.nodeid, report.failed)
+    if suffix:
+        screenshot_paths.append(take_screenshot(driver, f"{ENV}_{item.name}_{suffix}", force_write=True))
+
+    pytest_html = item.config.pluginmanager.getplugin("html")
+    if pytest_html is None:
+        return
+    extra = getattr(report, "extra", [])
+    for screenshot_path in screenshot_paths:
+        if wait_for_screenshot(screenshot_path):
+            extra.append(pytest_html.extras.image(screenshot_path))
+    report.extra = extra
 
 
 # ✅ Load environment variables from .env file (if used)
 load_dotenv()
 
 
-@pytest.fixture(scope="function")
-def driver(request):
-    """ ✅ Fixture to initialize and quit WebDriver with optional headless mode """
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """ ✅ Session-wide pool of warm browser sessions, one pool per worker process """
     browser_name = os.getenv('WEB_BROWSER', 'chrome').lower()
     headless = request.config.getoption("--headless")  # Get headless mode flag
 
-    logger.info(f"Launching browser: {browser_name} | Headless mode: {headless}")
-
-    if browser_name == "chrome":
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless=new")  # Enable headless mode in Chrome
-            options.add_argument("--disable-gpu")
-            options.add_argument("--window-size=1920x1080")
-        service = ChromeService()
-        driver = webdriver.Chrome(service=service, options=options)
-
-    elif browser_name == "firefox":
-        options = FirefoxOptions()
-        if headless:
-            options.add_argument("--headless")  # Enable headless mode in Firefox
-        service = FirefoxService()
-        driver = webdriver.Firefox(service=service, options=options)
-
-    elif browser_name == "edge":
-        options = EdgeOptions()
-        if headless:
-            options.add_argument("--headless")  # Enable headless mode in Edge
-        service = EdgeService()
-        driver = webdriver.Edge(service=service, options=options)
+    pool = DriverPool(browser_name, headless, size=get_pool_size(request.config))
+    pool.warm_up()
+    yield pool
 
-    else:
-        logger.error(f"Unsupported browser: {browser_name}")
-        raise ValueError(f"Unsupported browser: {browser_name}")
+    pool.close()
 
-    driver.maximize_window()
-    driver.implicitly_wait(10)
-    logger.info("Browser session started.")
+
+@pytest.fixture(scope="function")
+def driver(driver_pool):
+    """ ✅ Hand each test a clean browser session from the pool and reset it afterwards """
+    driver = driver_pool.acquire()
+    if instrumentation.enabled:
+        instrumentation.attach(driver)  # ✅ Count the WebDriver round trips of each page-object call
 
     yield driver  # Pass WebDriver instance to test function
 
-    driver.quit()
-    logger.info("Browser session ended.")
+    driver_pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def login_cache(request):
+    """ ✅ Authenticated-session snapshots shared by all tests of this worker """
+    return LoginSessionCache(default_ttl=request.config.getoption("--login-cache-ttl"))
+
+
+# ✅ **Generic Login Fixture**
+@pytest.fixture(scope="function")
+def login_and_navigate_to_internal(driver, test_data, login_cache):
+    """
+    ✅ Logs in with valid credentials and navigates to the Sources -> Internal page.
+    Only the first test per worker types credentials; later tests restore the cached session.
+    Returns the InternalPage instance.
+    """
+    env = os.environ["ENVIRONMENT"]
+    internal_page = InternalPage(driver)
+
+    snapshot = login_cache.get(env)
+    if snapshot and login_cache.restore(driver, snapshot, test_data["web_base_url"]):
+        if internal_page.is_internal_displayed():
+            logger.info("🔑 Restored cached login session and opened the Internal page.")
+            return internal_page
+        logger.warning("⚠️ Cached login session was rejected, logging in again.")
+        login_cache.invalidate(env)
+
+    logger.info("🔐 Logging into the application and navigating to the Internal page.")
+    driver.get(test_data["web_base_url"])
+
+    login_page = LoginPage(driver)
+    login_page.enter_email(test_data["credentials_valid_username"])
+    login_page.enter_password(test_data["credentials_valid_password"])
+    login_page.click_login()
+
+    internal_page.click_dropdown()
+    internal_page.select_dropdown_option()
+    if internal_page.is_internal_displayed():
+        login_cache.capture(driver, env, internal_url=driver.current_url)
+
+    return internal_page
+
+
+TESTDATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Testdata")
+
+
+class UploadedBatch:
+    """ ✅ A batch created through the Internal page, remembered so later tests can jump straight to it """
+
+    def __init__(self, file_name, status, status_url, finalized):
+        self.file_name = file_name
+        self.status = status
+        self.status_url = status_url
+        self.finalized = finalized
+
+
+def unique_upload(file_name):
+    """
+    ✅ Copy a Testdata file to a name no other worker or earlier run uses (20250114-PNC_gw0_<ms>.xlsx),
+    so the batch can be told apart from everyone else's uploads of the same file in the shared grid.
+    """
+    stem, extension = os.path.splitext(file_name)
+    worker = f"_{get_worker_id()}" if get_worker_id() else ""
+    upload_dir = os.path.join(os.getcwd(), get_output_dir("Uploads"))
+    os.makedirs(upload_dir, exist_ok=True)
+    upload_path = os.path.join(upload_dir, f"{stem}{worker}_{time.time_ns() // 1_000_000}{extension}")
+    shutil.copyfile(os.path.join(TESTDATA_DIR, file_name), upload_path)
+    return upload_path
+
+
+def create_batch(internal_page, file_name, expected_status, finalize=False):
+    """ ✅ Upload a Testdata file, wait for its status and open its file status page (optionally finalized) """
+    logger.info(f"📦 Creating {'finalized ' if finalize else ''}batch from {file_name}...")
+    upload_path = unique_upload(file_name)
+    batch_name = os.path.splitext(os.path.basename(upload_path))[0]  # Identifies this batch's row in the grid
+    try:
+        internal_page.click_internal_batch()
+        internal_page.add_file(upload_path)
+        internal_page.click_validate_button()
+        internal_page.click_check_button()
+
+        status = internal_page.watch_batch_status(file_name=batch_name).wait_for(expected_status)
+    finally:
+        os.remove(upload_path)
+    if status == "Failed":
+        internal_page.click_failed_status_button(batch_name)
+    else:
+        internal_page.click_status_button(batch_name)
+
+    if finalize:
+        internal_page.click_finalize_button()
+        internal_page.click_continue_button()
+        internal_page.click_check_back_later()
+
+    return UploadedBatch(os.path.basename(upload_path), status, internal_page.driver.current_url, finalize)
+
+
+@pytest.fixture(scope="session")
+def batch_cache():
+    """ ✅ Batches already created by this worker, keyed by (file name, stage) """
+    return {}
+
+
+def open_batch(request, internal_page, batch_cache, file_name, expected_status, finalize=False):
+    """
+    ✅ Reuse this worker's batch for (file, stage) unless the test is marked `fresh_batch`.
+    Fresh batches are never cached, so a test that mutates its batch cannot affect other tests.
+    """
+    key = (file_name, "finalized" if finalize else expected_status)
+    fresh = request.node.get_closest_marker("fresh_batch") is not None
+
+    batch = None if fresh else batch_cache.get(key)
+    if batch:
+        internal_url = internal_page.driver.current_url
+        internal_page.driver.get(batch.status_url)
+        try:
+            reachable = internal_page.is_file_status_page_displayed()
+        except NoSuchElementException:
+            reachable = False
+        if reachable:
+            logger.info(f"📦 Reusing {key[1]} batch from {file_name}.")
+            return internal_page
+        logger.warning(f"⚠️ Cached {key[1]} batch from {file_name} is not reachable, creating a new one.")
+        del batch_cache[key]
+        internal_page.driver.get(internal_url)
+
+    batch = create_batch(internal_page, file_name, expected_status, finalize)
+    if not fresh:
+        batch_cache[key] = batch
+    return internal_page
+
+
+@pytest.fixture(scope="function")
+def validated_batch(request, login_and_navigate_to_internal, batch_cache):
+    """ ✅ Internal page opened on the file status page of a validated (not finalized) PNC batch """
+    return open_batch(request, login_and_navigate_to_internal, batch_cache, "20250114-PNC.xlsx", "Validation")
+
+
+@pytest.fixture(scope="function")
+def finalized_batch(request, login_and_navigate_to_internal, batch_cache):
+    """ ✅ Internal page opened on the file status page of a validated PNC batch after 'Finalize Submission' """
+    return open_batch(request, login_and_navigate_to_internal, batch_cache, "20250114-PNC.xlsx", "Validation",
+                      finalize=True)
+
+
+@pytest.fixture(scope="function")
+def failed_batch(request, login_and_navigate_to_internal, batch_cache):
+    """ ✅ Internal page opened on the file status page of a batch that failed validation """
+    return open_batch(request, login_and_navigate_to_internal, batch_cache, "DOMESTIC.xlsx", "Failed")
 
 #
 
@@ -10,42 +10,13 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from Pageobject.login import LoginPage
 from Pageobject.dashboard import DashboardPage
-from Utilities.utils import take_screenshot, archive_old_screenshots, test_data
+from Utilities.utils import take_screenshot, test_data
 from Utilities.logger import logger
 
 # ✅ Fetch environment dynamically
 ENV = os.getenv("ENVIRONMENT", "DEV").upper()  # Default to DEV if not set
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_screenshot_archive():
-    """
-    ✅ Runs before any test execution to archive previous Screenshots.
-    """
-    logger.info("📂 Archiving old Screenshots before test execution...")
-    archive_old_screenshots()
-
-
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """✅ Attach Logs and Screenshots to the HTML report."""
-    outcome = yield
-    report = outcome.get_result()
-
-    if report.when == "call":  # Ensure it's after the test execution
-        driver = item.funcargs.get("driver", None)
-        if driver:
-            screenshot_path = take_screenshot(driver, f"{ENV}_{item.name}_failed")
-
-            pytest_html = item.config.pluginmanager.getplugin("html")
-            extra = getattr(report, "extra", [])
-
-            if screenshot_path and os.path.exists(screenshot_path):
-                extra.append(pytest_html.extras.image(screenshot_path))
-
-            report.extra = extra
-
-
 # ✅ **Generic Login Fixture**
 @pytest.fixture(scope="function")
 def login_and_navigate_to_dashboard(driver, test_data):
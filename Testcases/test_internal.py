@@ -8,65 +8,14 @@ from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 
-from Pageobject.login import LoginPage
 from Pageobject.internal import InternalPage
-from Utilities.utils import take_screenshot, archive_old_screenshots, test_data
+from Utilities.utils import take_screenshot, test_data, get_download_dir
 from Utilities.logger import logger
 
 # ✅ Fetch environment dynamically
 ENV = os.getenv("ENVIRONMENT", "DEV").upper()  # Default to DEV if not set
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_screenshot_archive():
-    """
-    ✅ Runs before any test execution to archive previous Screenshots.
-    """
-    logger.info("📂 Archiving old Screenshots before test execution...")
-    archive_old_screenshots()
-
-
-@pytest.hookimpl(hookwrapper=True)
-def pytest_runtest_makereport(item, call):
-    """✅ Attach Logs and Screenshots to the HTML report."""
-    outcome = yield
-    report = outcome.get_result()
-
-    if report.when == "call":  # Ensure it's after the test execution
-        driver = item.funcargs.get("driver", None)
-        if driver:
-            screenshot_path = take_screenshot(driver, f"{ENV}_{item.name}_failed")
-
-            pytest_html = item.config.pluginmanager.getplugin("html")
-            extra = getattr(report, "extra", [])
-
-            if screenshot_path and os.path.exists(screenshot_path):
-                extra.append(pytest_html.extras.image(screenshot_path))
-
-            report.extra = extra
-# ✅ **Generic Login Fixture**
-@pytest.fixture(scope="function")
-def login_and_navigate_to_internal(driver, test_data):
-    """
-        ✅ Logs in with valid credentials and navigates to the Dashboard page.
-        Returns the DashboardPage instance.
-        """
-    logger.info("🔐 Logging into the application and navigating to the Dashboard.")
-    driver.get(test_data["web_base_url"])
-
-    login_page = LoginPage(driver)
-    login_page.enter_email(test_data["credentials_valid_username"])
-    login_page.enter_password(test_data["credentials_valid_password"])
-    login_page.click_login()
-    # Open the base URL and log in
-    # Wait for login to complete
-    # Navigate to the Internal page
-    internal_page = InternalPage(driver)
-    internal_page.click_dropdown()
-    internal_page.select_dropdown_option()
-
-    return internal_page
-
 # ✅ **TC_Internal_001** -  Validate that the "Sources -> Internal" screen is displayed
 def test_validate_internal_page(login_and_navigate_to_internal, driver):
     logger.info("📌 Validating 'Sources -> Internal' screen visibility.")
@@ -104,11 +53,12 @@ def test_download_template(login_and_navigate_to_internal, driver):
     logger.info("🔄 Verifying the download functionality for 'Template Domestic Payments'.")
     internal_page = login_and_navigate_to_internal
     internal_page.click_internal_batch()
-    download_dir = os.path.expanduser("~/Downloads")  # Dynamic path for portability
+    download_dir = get_download_dir()  # ~/Downloads, or this worker's own folder in parallel runs
     expected_file = "DOMESTIC.xlsx"  # Update if needed
     logger.info(f"📥 Initiating download for template: {expected_file}")
+    clicked_at = time.time()  # Only a download that starts now counts, not a leftover with the same name
     internal_page.click_download_template1()
-    assert internal_page.is_file_downloaded(download_dir, expected_file), f"❌ File '{expected_file}' not downloaded."
+    assert internal_page.is_file_downloaded(download_dir, expected_file, since=clicked_at), f"❌ File '{expected_file}' not downloaded."
     logger.info(f"✅ File '{expected_file}' downloaded successfully.")
     file_path = os.path.join(download_dir, expected_file)
     assert os.path.getsize(file_path) > 0, f"❌ Downloaded file '{expected_file}' is empty."
@@ -124,11 +74,12 @@ def test_download_source_template(login_and_navigate_to_internal, driver):
     logger.info("🔄 Verifying the download functionality for 'Source Template'.")
     internal_page = login_and_navigate_to_internal
     internal_page.click_internal_batch()
-    download_dir = os.path.expanduser("~/Downloads")  # Dynamic path for better portability
+    download_dir = get_download_dir()  # ~/Downloads, or this worker's own folder in parallel runs
     expected_file = "DOMESTIC_SOURCE_LINK.xlsx"  # Ensure this is the correct filename
     logger.info(f"📥 Initiating download for template: {expected_file}")
+    clicked_at = time.time()  # Only a download that starts now counts, not a leftover with the same name
     internal_page.click_download_template2()
-    assert internal_page.is_file_downloaded(download_dir, expected_file), f"❌ File '{expected_file}' not downloaded."
+    assert internal_page.is_file_downloaded(download_dir, expected_file, since=clicked_at), f"❌ File '{expected_file}' not downloaded."
     logger.info(f"✅ File '{expected_file}' downloaded successfully.")
     file_path = os.path.join(download_dir, expected_file)
     assert os.path.getsize(file_path) > 0, f"❌ Downloaded file '{expected_file}' is empty."
@@ -144,11 +95,12 @@ def test_download_international_payments(login_and_navigate_to_internal, driver)
     logger.info("🔄Verifying the download functionality for 'Template International Payments'.")
     internal_page = login_and_navigate_to_internal
     internal_page.click_internal_batch()
-    download_dir = os.path.expanduser("~/Downloads")  # Dynamic path for better portability
+    download_dir = get_download_dir()  # ~/Downloads, or this worker's own folder in parallel runs
     expected_file = "INTERNATIONAL.xlsx"  # Ensure this is the correct filename
     logger.info(f"📥 Initiating download for template: {expected_file}")
+    clicked_at = time.time()  # Only a download that starts now counts, not a leftover with the same name
     internal_page.click_download_template3()
-    assert internal_page.is_file_downloaded(download_dir, expected_file), f"❌ File '{expected_file}' not downloaded."
+    assert internal_page.is_file_downloaded(download_dir, expected_file, since=clicked_at), f"❌ File '{expected_file}' not downloaded."
     logger.info(f"✅ File '{expected_file}' downloaded successfully.")
     file_path = os.path.join(download_dir, expected_file)
     assert os.path.getsize(file_path) > 0, f"❌ Downloaded file '{expected_file}' is empty."
@@ -165,12 +117,13 @@ def test_download_commerce_payments(login_and_navigate_to_internal, driver):
     logger.info("🔄 Verifying the download functionality for 'Template Commerce Payments'.")
     internal_page = login_and_navigate_to_internal
     internal_page.click_internal_batch()
-    download_dir = os.path.expanduser("~/Downloads")  # Dynamic path for better portability
+    download_dir = get_download_dir()  # ~/Downloads, or this worker's own folder in parallel runs
     expected_file = "COMMERCE.xlsx"  # Ensure this is the correct filename
     logger.info(f"📥 Initiating download for template: {expected_file}")
+    clicked_at = time.time()  # Only a download that starts now counts, not a leftover with the same name
     internal_page.click_download_template4()
     take_screenshot(driver, f"{ENV}_download_page")
-    assert internal_page.is_file_downloaded(download_dir, expected_file), f"❌ File '{expected_file}' not downloaded."
+    assert internal_page.is_file_downloaded(download_dir, expected_file, since=clicked_at), f"❌ File '{expected_file}' not downloaded."
     logger.info(f"✅ File '{expected_file}' downloaded successfully.")
     take_screenshot(driver, f"{ENV}_download_success_{expected_file}")
     file_path = os.path.join(download_dir, expected_file)
@@ -371,35 +324,15 @@ def test_validate_file_upload_completion(login_and_navigate_to_internal, driver)
     internal_page.click_validate_button()
     logger.info("⏳ Waiting for file validation status update...")
     internal_page.click_check_button()
-    file_status = internal_page.get_file_status()
-    assert file_status in ["Submitted", "Validation"], \
-        f"❌ Expected file status to be 'Submitted' or 'Validation', but got '{file_status}'."
+    file_status = internal_page.watch_batch_status().wait_for(["Submitted", "Validation"])
     take_screenshot(driver, f"{ENV}_file_status_update")
     logger.info("✅ File upload completion and status update validated successfully.")
 
 
 # ✅ **TC_Internal_018** - Validate the presence of details in the internal page after file validation
-def test_file_details_after_validation(login_and_navigate_to_internal, driver):
+def test_file_details_after_validation(validated_batch, driver):
     logger.info("📌 [TC_Internal_018] Verifying file details after validation.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Using file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    logger.info("⏳ Waiting for validation status update...")
-    internal_page.click_check_button()
-    file_status = internal_page.get_file_status()
-    assert file_status in ["Submitted", "Validation"], \
-        f"❌ Expected file status to be 'Submitted' or 'Validation', but got '{file_status}'."
-    take_screenshot(driver, f"{ENV}_file_status_update")
-    logger.info("✅ File status updated successfully.")
-    internal_page.click_status_button()
+    internal_page = validated_batch
     total_payments_text = internal_page.get_total_payments()
     assert "Total Payments" in total_payments_text, "❌ Heading 'Total Payments' not found."
     take_screenshot(driver, f"{ENV}_file_details_page")
@@ -407,28 +340,9 @@ def test_file_details_after_validation(login_and_navigate_to_internal, driver):
 
 
 # ✅ **TC_Internal_019** - Validate navigation to file status page and check file details
-def test_file_status_navigation(login_and_navigate_to_internal, driver):
+def test_file_status_navigation(validated_batch, driver):
     logger.info("📌 Verifying navigation to file status page from 'Submitted' status.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    logger.info("⏳ Waiting for file status update...")
-    internal_page.click_check_button()
-    file_status = internal_page.get_file_status()
-    assert file_status in ["Submitted", "Validation"], \
-        f"❌ Expected file status to be 'Submitted' or 'Validation', but got '{file_status}'."
-    take_screenshot(driver, f"{ENV}_file_status_update")
-    logger.info(f"✅ File status verified as: {file_status}")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
+    internal_page = validated_batch
     total_payments_text = internal_page.get_total_payments()
     assert "Total Payments" in total_payments_text, "❌ Heading 'Total Payments' not found."
     take_screenshot(driver, f"{ENV}_file_details_verified")
@@ -436,38 +350,9 @@ def test_file_status_navigation(login_and_navigate_to_internal, driver):
 
 
 # ✅ **TC_Internal_020** - Validate 'Manual Batches Actions' for a submitted batch
-def test_manual_batches_action(login_and_navigate_to_internal, driver):
+def test_manual_batches_action(finalized_batch, driver):
     logger.info("📌 Verifying 'Manual Batches Actions' for a submitted batch.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    logger.info("⏳ Waiting for file status update...")
-    internal_page.click_check_button()
-    file_status = internal_page.get_file_status()
-    assert file_status in ["Submitted", "Validation"], \
-        f"❌ Expected file status to be 'Submitted' or 'Validation', but got '{file_status}'."
-    take_screenshot(driver, f"{ENV}_file_status_update")
-    logger.info(f"✅ File status verified as: {file_status}")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
-    logger.info("🚀 Finalizing batch...")
-    time.sleep(5)
-    internal_page.click_finalize_button()
-    take_screenshot(driver, f"{ENV}_after_finalize_button")
-    time.sleep(5)
-    internal_page.click_continue_button()
-    take_screenshot(driver, f"{ENV}_after_continue_button")
-    time.sleep(5)
-    internal_page.click_check_back_later()
-    take_screenshot(driver, f"{ENV}_after_check_back_later")
+    internal_page = finalized_batch
     assert internal_page.is_manual_batches_actions_displayed(), "❌ 'Manual Batches Actions' section is not displayed."
     assert internal_page.is_go_to_payments_button_displayed(), "❌ 'Go to payments' button is not displayed."
     assert internal_page.is_download_pci_safe_original_button_displayed(), "❌ 'Download PCI-safe Original' button is not displayed."
@@ -479,205 +364,50 @@ def test_manual_batches_action(login_and_navigate_to_internal, driver):
 
 
 # ✅ **TC_Internal_021** - Validate the 'Go to payments' action in 'Manual Batches Actions'
-def test_Goto_payment(login_and_navigate_to_internal, driver):
+def test_Goto_payment(finalized_batch, driver):
     logger.info("📌 [TC_Internal_021] Verifying 'Go to payments' action in 'Manual Batches Actions'.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    logger.info("⏳ Checking file status...")
-    internal_page.click_check_button()
-    file_status = internal_page.get_file_status()
-    assert file_status in ["Submitted", "Validation"], \
-        f"❌ Expected file status to be 'Submitted' or 'Validation', but got '{file_status}'."
-    take_screenshot(driver, f"{ENV}_file_status_update")
-    logger.info(f"✅ File status verified: {file_status}")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
-    logger.info("🚀 Finalizing batch...")
-    internal_page.click_finalize_button()
-    take_screenshot(driver, f"{ENV}_after_finalize_button")
-    internal_page.click_continue_button()
-    take_screenshot(driver, f"{ENV}_after_continue_button")
-    time.sleep(5)
-    internal_page.click_check_back_later()
-    take_screenshot(driver, f"{ENV}_after_check_back_later")
-    time.sleep(5)
+    internal_page = finalized_batch
     internal_page.click_go_to_payment()
     take_screenshot(driver, f"{ENV}_after_go_to_payments")
     assert internal_page.is_payment_page_displayed(), "❌ Payment page is not displayed."
     logger.info("✅ Successfully verified 'Go to payments' action in 'Manual Batches Actions'.")
 
 # ✅ **TC_Internal_022** - Validate the 'Download PCI-safe Original' action for a submitted batch
-def test_TC_Internal_022_download_pci_safe_original(login_and_navigate_to_internal, driver):
+def test_TC_Internal_022_download_pci_safe_original(finalized_batch, driver):
     logger.info("📌 Validating 'Download PCI-safe Original' functionality.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    file_status = internal_page.get_file_status()
-    assert file_status in ["Submitted", "Validation"], \
-        f"❌ Expected file status to be 'Submitted' or 'Validation', but got '{file_status}'."
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    logger.info(f"✅ File status verified as: {file_status}")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
-    internal_page.click_finalize_button()
-    time.sleep(5)
-    internal_page.click_continue_button()
-    time.sleep(5)
-    internal_page.click_check_back_later()
-    take_screenshot(driver, f"{ENV}_batch_finalized")
-    time.sleep(5)
+    internal_page = finalized_batch
     internal_page.click_download_pci()
     take_screenshot(driver, f"{ENV}_after_pci_download")
     logger.info("✅ Successfully triggered 'Download PCI-safe Original' action.")
 
 # ✅ **TC_Internal_023** - Validate the 'Download PCI-safe Final' action for a submitted batch
-def test_download_pci_safe_final(login_and_navigate_to_internal, driver):
+def test_download_pci_safe_final(finalized_batch, driver):
     logger.info("📌 [TC_Internal_023] Validating 'Download PCI-safe Final' functionality.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    file_status = internal_page.get_file_status()
-    assert file_status in ["Submitted", "Validation"], \
-        f"❌ Expected file status to be 'Submitted' or 'Validation', but got '{file_status}'."
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    logger.info(f"✅ File status verified as: {file_status}")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
-    internal_page.click_finalize_button()
-    time.sleep(5)
-    internal_page.click_continue_button()
-    time.sleep(5)
-    internal_page.click_check_back_later()
-    take_screenshot(driver, f"{ENV}_batch_finalized")
+    internal_page = finalized_batch
     internal_page.click_download_final_pci()
     take_screenshot(driver, f"{ENV}_after_final_pci_download")
     logger.info("✅ Successfully triggered 'Download PCI-safe Final' action.")
 
 # ✅ **TC_Internal_024** - Validate the 'Download Original' action for a submitted batch
-def test_download_original(login_and_navigate_to_internal, driver):
+def test_download_original(finalized_batch, driver):
     logger.info("📌 Validating 'Download Original' functionality.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    file_status = internal_page.get_file_status()
-    assert file_status in ["Submitted", "Validation"], \
-        f"❌ Expected file status to be 'Submitted' or 'Validation', but got '{file_status}'."
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    logger.info(f"✅ File status verified as: {file_status}")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
-    internal_page.click_finalize_button()
-    time.sleep(5)
-    internal_page.click_continue_button()
-    time.sleep(5)
-    internal_page.click_check_back_later()
-    take_screenshot(driver, f"{ENV}_batch_finalized")
+    internal_page = finalized_batch
     internal_page.click_download_original()
     take_screenshot(driver, f"{ENV}_after_original_download")
     logger.info("✅ Successfully triggered 'Download Original' action.")
 
 # ✅ **TC_Internal_025** - Validate the 'Download Final' action for a submitted batch
-def test_download_final(login_and_navigate_to_internal, driver):
+def test_download_final(finalized_batch, driver):
     logger.info("📌 Validating 'Download Final' functionality.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    for attempt in range(5):
-        file_status = internal_page.get_file_status()
-        if file_status in ["Submitted", "Validation"]:
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for file status update (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Unexpected file status: '{file_status}'.")
-
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
-    internal_page.click_finalize_button()
-    time.sleep(5)
-    internal_page.click_continue_button()
-    time.sleep(5)
-    internal_page.click_check_back_later()
-    take_screenshot(driver, f"{ENV}_batch_finalized")
+    internal_page = finalized_batch
     internal_page.click_download_final()
     take_screenshot(driver, f"{ENV}_after_final_download")
     logger.info("✅ Successfully triggered 'Download Final' action.")
 
 # ✅ **TC_Internal_026** - Validate navigation to file status page from 'Validated' status
-def test_file_status_navigation(login_and_navigate_to_internal, driver):
+def test_file_status_navigation(validated_batch, driver):
     logger.info("📌Validating navigation to file status page and checking for errors/warnings.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    expected_statuses = ["Submitted", "Validation"]
-    for attempt in range(5):
-        file_status = internal_page.get_file_status()
-        if file_status in expected_statuses:
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for file status update (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Unexpected file status: '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
+    internal_page = validated_batch
     assert internal_page.is_file_status_page_displayed(), "❌ Failed to navigate to the file status page."
     error_warning_counts = internal_page.get_error_and_warning_counts()
     logger.info(f"⚠️ Error Count: {error_warning_counts['errors']}, Warning Count: {error_warning_counts['warnings']}")
@@ -687,33 +417,9 @@ def test_file_status_navigation(login_and_navigate_to_internal, driver):
     logger.info("✅ Navigation and validation test passed successfully!")
 
 # ✅ **TC_Internal_027** - Validate the 'Download Latest File' action for a validated batch
-def test_download_latest_file(login_and_navigate_to_internal, driver):
+def test_download_latest_file(validated_batch, driver):
     logger.info("📌 Validating 'Download Latest File' action for a validated batch.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    expected_statuses = ["Submitted", "Validation"]
-    for attempt in range(5):
-        file_status = internal_page.get_file_status()
-        if file_status in expected_statuses:
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for file status update (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Unexpected file status: '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
+    internal_page = validated_batch
     assert internal_page.is_file_status_page_displayed(), "❌ Failed to navigate to the file status page."
     logger.info("📥 Clicking 'Download Latest File' button...")
     internal_page.click_download_latest_file()
@@ -721,33 +427,10 @@ def test_download_latest_file(login_and_navigate_to_internal, driver):
     logger.info("✅ File download action triggered successfully!")
 
 # ✅ **TC_Internal_028** - Validate 'Finalize Submission' functionality for a validated batch with warnings
-def test_finalize_submission_with_warnings(login_and_navigate_to_internal, driver):
+@pytest.mark.fresh_batch
+def test_finalize_submission_with_warnings(validated_batch, driver):
     logger.info("📌Validating 'Finalize Submission' for a batch with warnings.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    expected_statuses = ["Submitted", "Validation"]
-    for attempt in range(5):
-        file_status = internal_page.get_file_status()
-        if file_status in expected_statuses:
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for file status update (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Unexpected file status: '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
+    internal_page = validated_batch
     assert internal_page.is_file_status_page_displayed(), "❌ Failed to navigate to the file status page."
     assert internal_page.is_warning_message_displayed(), "❌ Expected warning: 'Please check. This batch may be duplicated.'"
     logger.info("⚠️ Warning detected: 'Please check. This batch may be duplicated.'")
@@ -760,34 +443,11 @@ def test_finalize_submission_with_warnings(login_and_navigate_to_internal, drive
     logger.info("✅ Finalize Submission completed successfully!")
 
 # ✅ **TC_Internal_029** - Validate 'Upload Again' functionality for a validated batch with warnings
-def test_upload_again(login_and_navigate_to_internal, driver):
+@pytest.mark.fresh_batch
+def test_upload_again(validated_batch, driver):
     logger.info("📌 Validating 'Upload Again' functionality.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
+    internal_page = validated_batch
     base_path = os.path.dirname(os.path.abspath(__file__))
-    initial_file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(initial_file_path):
-        raise FileNotFoundError(f"❌ File not found: {initial_file_path}")
-    logger.info(f"🔍 Uploading initial file: {initial_file_path}")
-    internal_page.add_file(initial_file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_initial_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    expected_statuses = ["Submitted", "Validation"]
-    for attempt in range(5):
-        file_status = internal_page.get_file_status()
-        if file_status in expected_statuses:
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for file status update (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Unexpected file status: '{file_status}'.")
-
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_status_page")
     internal_page.click_upload_again()
     take_screenshot(driver, f"{ENV}_upload_again_clicked")
     latest_file_path = os.path.join(base_path, "../testdata/20250114-PNC_Latest.xlsx")
@@ -804,39 +464,14 @@ def test_upload_again(login_and_navigate_to_internal, driver):
     logger.info("✅ 'Upload Again' functionality validated successfully!")
 
 # ✅ **TC_Internal_030** - Validate 'Discard Batch' functionality for a validated batch
-def test_discard_batch(login_and_navigate_to_internal, driver):
+@pytest.mark.fresh_batch
+def test_discard_batch(validated_batch, driver):
     logger.info("📌 Validating 'Discard Batch' functionality.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/20250114-PNC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    expected_statuses = ["Submitted", "Validation"]
-    for attempt in range(5):
-        file_status = internal_page.get_file_status()
-        if file_status in expected_statuses:
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for file status update (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Unexpected file status: '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_status_verified")
-    # Navigate to file status page
-    internal_page.click_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_failed_status_page")
-    time.sleep(5)
+    internal_page = validated_batch
     internal_page.click_discard_batch()
     take_screenshot(driver, f"{ENV}_discard_batch_prompt")
-    time.sleep(5)
     internal_page.click_discard_batch_button()
+    assert internal_page.is_discard_dialog_closed(), "❌ Discard dialog is still open."
     take_screenshot(driver, f"{ENV}_batch_discarded")
     logger.info("✅ 'Discard Batch' functionality validated successfully!")
 
@@ -867,96 +502,29 @@ def test_failed_status(login_and_navigate_to_internal, driver):
     logger.info("✅ Navigation and validation test passed successfully!")
 
 # ✅ **TC_Internal_032** - Validate functionality of 'Download Original' button on a failed batch
-def test_batch_download_original(login_and_navigate_to_internal, driver):
+def test_batch_download_original(failed_batch, driver):
     logger.info("📌  Validating 'Download Original' button for a failed batch.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_failed_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/DOMESTIC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_failed_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    for attempt in range(5):
-        file_status = internal_page.get_file_failed_status()
-        if file_status == "Failed":
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for 'Failed' status (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Expected file status 'Failed', but got '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_failed_status_verified")
-    internal_page.click_failed_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_failed_status_page")
+    internal_page = failed_batch
     assert internal_page.is_file_status_page_displayed(), "❌ Failed to navigate to the file status page."
     internal_page.click_download_original()
     take_screenshot(driver, f"{ENV}_download_original_attempted")
     logger.info("✅ 'Download Original' button functionality validated successfully!")
 
 # ✅ **TC_Internal_033** - Validate functionality of 'Download Latest File' button on a failed batch
-def test_failed_batch_download_latest_file(login_and_navigate_to_internal, driver):
+def test_failed_batch_download_latest_file(failed_batch, driver):
     logger.info("📌 Validating 'Download Latest File' button for a failed batch.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_failed_file")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    file_path = os.path.join(base_path, "../Testdata/DOMESTIC.xlsx")
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"❌ File not found: {file_path}")
-    logger.info(f"🔍 Uploading file: {file_path}")
-    internal_page.add_file(file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_failed_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    for attempt in range(5):
-        file_status = internal_page.get_file_failed_status()
-        if file_status == "Failed":
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for 'Failed' status (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Expected file status 'Failed', but got '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_failed_status_verified")
-    internal_page.click_failed_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_failed_status_page")
+    internal_page = failed_batch
     assert internal_page.is_file_status_page_displayed(), "❌ Failed to navigate to the file status page."
     internal_page.click_download_latest_file()
     take_screenshot(driver, f"{ENV}_download_latest_file_attempted")
     logger.info("✅ 'Download Latest File' button functionality validated successfully!")
 
 # ✅ **TC_Internal_034** - Validate functionality of 'Upload Again' button on a failed batch
-def test_failed_upload_again(login_and_navigate_to_internal, driver):
+@pytest.mark.fresh_batch
+def test_failed_upload_again(failed_batch, driver):
     logger.info("📌 Validating 'Upload Again' functionality for a failed batch.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_failed_file")
+    internal_page = failed_batch
     base_path = os.path.dirname(os.path.abspath(__file__))
-    failed_file_path = os.path.join(base_path, "../Testdata/DOMESTIC.xlsx")
-    if not os.path.exists(failed_file_path):
-        raise FileNotFoundError(f"❌ File not found: {failed_file_path}")
-    logger.info(f"🔍 Uploading failed file: {failed_file_path}")
-    internal_page.add_file(failed_file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_failed_file")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    for attempt in range(5):
-        file_status = internal_page.get_file_failed_status()
-        if file_status == "Failed":
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for 'Failed' status (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Expected file status 'Failed', but got '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_failed_status_verified")
-    internal_page.click_failed_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_failed_status_page")
     assert internal_page.is_file_status_page_displayed(), "❌ Failed to navigate to the file status page."
     internal_page.click_upload_again()
     take_screenshot(driver, f"{ENV}_upload_again_clicked")
@@ -973,68 +541,22 @@ def test_failed_upload_again(login_and_navigate_to_internal, driver):
     logger.info("✅ 'Upload Again' button functionality validated successfully!")
 
 # ✅ **TC_Internal_035** - Validate functionality of 'Discard Batch' button on a failed batch
-def test_failed_batch_discard(login_and_navigate_to_internal, driver):
+@pytest.mark.fresh_batch
+def test_failed_batch_discard(failed_batch, driver):
     logger.info("📌 Validating 'Discard Batch' functionality for a failed batch.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_failed_batch")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    failed_file_path = os.path.join(base_path, "../Testdata/DOMESTIC.xlsx")
-    if not os.path.exists(failed_file_path):
-        raise FileNotFoundError(f"❌ File not found: {failed_file_path}")
-    logger.info(f"🔍 Uploading failed file: {failed_file_path}")
-    internal_page.add_file(failed_file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_failed_batch")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    for attempt in range(5):
-        file_status = internal_page.get_file_failed_status()
-        if file_status == "Failed":
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for 'Failed' status (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Expected file status 'Failed', but got '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_failed_status_verified")
-    time.sleep(5)
-    internal_page.click_failed_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_failed_status_page")
+    internal_page = failed_batch
     assert internal_page.is_file_status_page_displayed(), "❌ Failed to navigate to the file status page."
     internal_page.click_discard_batch()
-    time.sleep(3)
     internal_page.click_discard_batch_button()
+    assert internal_page.is_discard_dialog_closed(), "❌ Discard dialog is still open."
     take_screenshot(driver, f"{ENV}_discard_batch_clicked")
     take_screenshot(driver, f"{ENV}_batch_discarded")
     logger.info("✅ 'Discard Batch' functionality validated successfully!")
 
 # ✅ **TC_Internal_036** - Validate functionality of 'Contact Production Support' button on a failed batch
-def test_contact_production_support(login_and_navigate_to_internal, driver):
+def test_contact_production_support(failed_batch, driver):
     logger.info("📌 Validating 'Contact Production Support' button functionality for a failed batch.")
-    internal_page = login_and_navigate_to_internal
-    internal_page.click_internal_batch()
-    take_screenshot(driver, f"{ENV}_before_uploading_failed_batch")
-    base_path = os.path.dirname(os.path.abspath(__file__))
-    failed_file_path = os.path.join(base_path, "../testdata/DOMESTIC.xlsx")
-    if not os.path.exists(failed_file_path):
-        raise FileNotFoundError(f"❌ File not found: {failed_file_path}")
-    logger.info(f"🔍 Uploading failed file: {failed_file_path}")
-    internal_page.add_file(failed_file_path)
-    take_screenshot(driver, f"{ENV}_after_uploading_failed_batch")
-    internal_page.click_validate_button()
-    internal_page.click_check_button()
-    for attempt in range(5):
-        file_status = internal_page.get_file_failed_status()
-        if file_status == "Failed":
-            logger.info(f"✅ File status verified: {file_status}")
-            break
-        logger.warning(f"⏳ Waiting for 'Failed' status (Attempt {attempt + 1}/5)...")
-        time.sleep(3)
-    else:
-        raise AssertionError(f"❌ Expected file status 'Failed', but got '{file_status}'.")
-    take_screenshot(driver, f"{ENV}_file_failed_status_verified")
-    internal_page.click_failed_status_button()
-    take_screenshot(driver, f"{ENV}_navigated_to_failed_status_page")
+    internal_page = failed_batch
     assert internal_page.is_file_status_page_displayed(), "❌ Failed to navigate to the file status page."
     internal_page.click_contact_production()
     take_screenshot(driver, f"{ENV}_contact_production_clicked")
@@ -0,0 +1,40 @@
+import io
+import json
+import os
+import pytest
+from Utilities.screenshots import ScreenshotStore
+from Utilities.logger import logger  # Import centralized logger
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _frame(size=(200, 120), box=None):
+    """ A white PNG frame, with a small black square drawn at `box` when given. """
+    image = Image.new("RGB", size, "white")
+    if box:
+        image.paste((0, 0, 0), box)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+# ✅ Deltas are extra objects: every named screenshot still links to the full page
+def test_delta_screenshots_keep_full_frames(tmp_path):
+    logger.info("📌 Saving two similar frames with deltas enabled.")
+    store = ScreenshotStore(root=str(tmp_path / "store"), fmt="png", save_deltas=True)
+    first, second = str(tmp_path / "first.png"), str(tmp_path / "second.png")
+
+    store.save(_frame(), first)
+    store.save(_frame(box=(10, 10, 30, 30)), second)
+    store.save(_frame(box=(10, 10, 30, 30)), str(tmp_path / "again.png"))  # Same full frame as `second`
+
+    for path in (first, second, str(tmp_path / "again.png")):
+        with Image.open(path) as saved:
+            assert saved.size == (200, 120), f"❌ {os.path.basename(path)} is {saved.size}, not the full frame"
+
+    with open(os.path.join(store.root, "deltas.jsonl"), encoding="utf-8") as manifest:
+        deltas = [json.loads(line) for line in manifest]
+    assert [entry["name"] for entry in deltas] == ["second.png"], f"❌ Unexpected delta entries: {deltas}"
+    assert os.path.samefile(os.path.join(store.root, deltas[0]["frame"]), second)
+    assert store.restore(second).tobytes() == Image.open(second).convert("RGB").tobytes()
+    logger.info(f"✅ Both frames kept at full size, one delta recorded: {store.stats}")
@@ -0,0 +1,97 @@
+import os
+import random
+import threading
+from collections import deque
+from Utilities.logger import logger  # Import centralized logger
+
+# ✅ When screenshots are written to disk:
+#   failure - only when a test fails (plus the step screenshots tests take explicitly)
+#   sampled - every failure, plus a share of the passing tests
+#   buffer  - step screenshots are kept in memory (last N per test) and written only if the test fails
+#   always  - after every test, the old behaviour
+CAPTURE_MODES = ("failure", "sampled", "buffer", "always")
+DEFAULT_MODE = os.getenv("BOOST_SCREENSHOT_MODE", "failure").lower()
+DEFAULT_SAMPLE_RATE = float(os.getenv("BOOST_SCREENSHOT_SAMPLE", "0.05"))
+DEFAULT_BUFFER_SIZE = int(os.getenv("BOOST_SCREENSHOT_BUFFER", "5"))
+
+
+class CapturePolicy:
+    """ ✅ Decides which screenshots of a test are written, so passing tests cost no disk I/O. """
+
+    def __init__(self, mode=DEFAULT_MODE, sample_rate=DEFAULT_SAMPLE_RATE, buffer_size=DEFAULT_BUFFER_SIZE, seed=None):
+        if mode not in CAPTURE_MODES:
+            raise ValueError(f"❌ Unknown screenshot mode '{mode}', choose one of {CAPTURE_MODES}")
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.buffer_size = max(buffer_size, 1)
+        # Same seed, same sampled tests: rerunning with --screenshot-seed reproduces a run's selection
+        self.seed = seed if seed is not None else random.randrange(1 << 32)
+        self._buffer = deque(maxlen=self.buffer_size)
+        self._lock = threading.Lock()
+        self.stats = {"failed": 0, "sampled": 0, "buffered": 0, "discarded": 0}
+
+    @property
+    def buffering(self):
+        """ True when take_screenshot() should hold step screenshots in memory instead of writing them. """
+        return self.mode == "buffer"
+
+    def start_test(self):
+        """ ✅ Drop whatever the previous test buffered (it passed, or its failure was already written). """
+        with self._lock:
+            self.stats["discarded"] += len(self._buffer)
+            self._buffer.clear()
+
+    def buffer(self, data, path):
+        """ ✅ Keep one step screenshot in memory; the oldest falls out once the buffer is full. """
+        with self._lock:
+            self._buffer.append((data, path))
+
+    def is_sampled(self, nodeid):
+        """ ✅ Deterministic per test and seed, so a run's selection can be reproduced with --screenshot-seed. """
+        return random.Random(f"{self.seed}:{nodeid}").random() < self.sample_rate
+
+    def final_capture(self, nodeid, failed):
+        """ ✅ Suffix for the end-of-test screenshot ("failed" / "passed"), or None when it should be skipped. """
+        if failed:
+            self.stats["failed"] += 1
+            return "failed"
+        if self.mode == "always" or (self.mode == "sampled" and self.is_sampled(nodeid)):
+            self.stats["sampled"] += 1
+            return "passed"
+        return None
+
+    def drain(self, failed):
+        """ ✅ The buffered (data, path) step screenshots to write: all of them if the test failed, none otherwise. """
+        with self._lock:
+            steps = list(self._buffer) if failed else []
+            self.stats["buffered"] += len(steps)
+            self.stats["discarded"] += len(self._buffer) - len(steps)
+            self._buffer.clear()
+        return steps
+
+    def summary(self):
+        stats = self.stats
+        return (f"🖼️ Screenshot policy '{self.mode}': {stats['failed']} failure, {stats['sampled']} pass and "
+                f"{stats['buffered']} buffered step screenshots written, {stats['discarded']} buffered ones skipped")
+
+
+capture_policy = CapturePolicy(DEFAULT_MODE if DEFAULT_MODE in CAPTURE_MODES else "failure")
+
+
+def configure_capture_policy(mode=None, sample_rate=None, buffer_size=None, seed=None):
+    """ ✅ Replace the session policy (called from pytest_configure with the --screenshots options). """
+    global capture_policy
+    capture_policy = CapturePolicy(
+        mode or DEFAULT_MODE,
+        DEFAULT_SAMPLE_RATE if sample_rate is None else sample_rate,
+        DEFAULT_BUFFER_SIZE if buffer_size is None else buffer_size,
+        seed,
+    )
+    logger.info(f"📸 Screenshot mode: {capture_policy.mode} (sample rate {capture_policy.sample_rate}, "
+                f"buffer {capture_policy.buffer_size}, seed {capture_policy.seed})")
+    return capture_policy
+
+
+def get_capture_policy():
+    """ ✅ The current session policy (import this, not the module attribute, which configure replaces). """
+    return capture_policy
@@ -0,0 +1,106 @@
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from Utilities.logger import logger  # Import centralized logger
+
+try:
+    from dotenv import dotenv_values  # ✅ Optional: read .env without touching os.environ
+except ImportError:
+    dotenv_values = None
+
+# ✅ Keys every environment must define (lower case, without the ENV_ prefix), and how to check them
+CONFIG_SCHEMA = {
+    "web_base_url": lambda value: value.startswith(("http://", "https://")),
+    "credentials_valid_username": None,
+    "credentials_valid_password": None,
+    "credentials_invalid_username": None,
+    "credentials_invalid_password": None,
+    "credentials_specialchar_email": None,
+}
+SECRET_MARKERS = ("password", "secret", "token", "api_key")  # Keys containing these are masked in logs and repr
+
+
+def is_secret(key):
+    return any(marker in key for marker in SECRET_MARKERS)
+
+
+class EnvironmentConfig(Mapping):
+    """
+    ✅ Frozen, validated test data for one environment (DEV_WEB_BASE_URL -> config["web_base_url"]).
+    Read-only: tests share one instance, so nothing can leak from one test into the next.
+    """
+
+    __slots__ = ("env", "_values")
+
+    def __init__(self, env, values):
+        object.__setattr__(self, "env", env)
+        object.__setattr__(self, "_values", MappingProxyType(dict(values)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"❌ Test data for {self.env} is read-only")
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            raise KeyError(f"❌ '{key}' is not set for {self.env}: define {self.env}_{key.upper()} in .env") from None
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def redacted(self):
+        """ ✅ Plain dict with secrets masked, safe to log. """
+        return {key: "***" if is_secret(key) else value for key, value in self._values.items()}
+
+    def __repr__(self):
+        return f"EnvironmentConfig({self.env}, {self.redacted()})"
+
+
+def _read_sources(env_file):
+    """ .env values overridden by the real environment, like load_dotenv(override=False). """
+    values = {}
+    if dotenv_values is not None and env_file and os.path.exists(env_file):
+        values.update({key: value for key, value in dotenv_values(env_file).items() if value is not None})
+    values.update(os.environ)
+    return values
+
+
+def validate(env, values):
+    """ ✅ Raise ValueError listing every missing or malformed required key at once. """
+    problems = []
+    for key, check in CONFIG_SCHEMA.items():
+        if not values.get(key):
+            problems.append(f"{env}_{key.upper()} is missing")
+        elif check is not None and not check(values[key]):
+            problems.append(f"{env}_{key.upper()} is invalid: {'***' if is_secret(key) else values[key]}")
+    if problems:
+        logger.error(f"❌ Invalid test data for {env}: {'; '.join(problems)}")
+        raise ValueError(f"❌ Invalid test data for {env}: {'; '.join(problems)}")
+
+
+@lru_cache(maxsize=None)
+def load_config(env=None, env_file=".env"):
+    """
+    ✅ Load, validate and freeze the test data for `env` (default: ENVIRONMENT, then DEV).
+    Cached: the environment is scanned once per process, not once per test.
+    """
+    env = (env or os.getenv("ENVIRONMENT", "DEV")).upper()
+    prefix = f"{env}_"  # Prefix for environment variables
+    values = {
+        key[len(prefix):].lower(): value
+        for key, value in _read_sources(env_file).items()
+        if key.startswith(prefix) and value
+    }
+
+    if not values:
+        logger.error(f"❌ No environment variables found for {env}. Please check your settings.")
+        raise ValueError(f"❌ Missing environment variables for {env}")
+    validate(env, values)
+
+    config = EnvironmentConfig(env, values)
+    logger.info(f"✅ Test data loaded for {env} environment: {config.redacted()}")
+    return config
@@ -0,0 +1,168 @@
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import time
+from Utilities.logger import logger  # Import centralized logger
+
+# Suffixes browsers use while a download is still being written (Chrome/Edge, Firefox)
+PARTIAL_SUFFIXES = (".crdownload", ".part")
+POLL_INTERVAL = 0.1  # Fallback when inotify is not available (macOS, Windows)
+STABLE_FOR = 0.5  # Seconds a file must keep its size/mtime when no close event was seen
+
+# inotify(7) constants
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_NONBLOCK = getattr(os, "O_NONBLOCK", 0)
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _load_libc():
+    """ libc with inotify support, or None (not Linux, or no inotify) to fall back to polling. """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch  # AttributeError if missing
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_libc = _load_libc()
+
+
+def sha256sum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as downloaded:
+        for chunk in iter(lambda: downloaded.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DownloadWatcher:
+    """
+    Waits for browser downloads to finish in one folder.
+
+    On Linux it listens to inotify events, so a file counts as done the moment the browser closes it
+    (or renames its .crdownload/.part file to the final name). Elsewhere it polls every POLL_INTERVAL.
+    Either way a file is only done when no partial file for it is left and, if no close event was
+    seen, its size and mtime have been stable for STABLE_FOR seconds.
+    """
+
+    def __init__(self, download_dir):
+        self.download_dir = download_dir
+        self._fd = None
+        os.makedirs(download_dir, exist_ok=True)
+        if _libc is not None:
+            fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0 and _libc.inotify_add_watch(
+                fd, os.fsencode(download_dir), IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+            ) >= 0:
+                self._fd = fd
+            elif fd >= 0:
+                os.close(fd)
+        if self._fd is None:
+            logger.info(f"📥 inotify not available, polling {download_dir} every {POLL_INTERVAL}s")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _events(self, timeout):
+        """ [(file name, mask)] that arrived within `timeout` seconds. """
+        if self._fd is None:
+            time.sleep(min(POLL_INTERVAL, timeout))
+            return []
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events, offset = [], 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            _, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            name = buffer[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length].rstrip(b"\0")
+            events.append((os.fsdecode(name), mask))
+            offset += EVENT_HEADER.size + length
+        return events
+
+    def _has_partial(self, file_name):
+        return any(os.path.exists(os.path.join(self.download_dir, file_name + suffix)) for suffix in PARTIAL_SUFFIXES)
+
+    def _signature(self, file_name):
+        try:
+            stat = os.stat(os.path.join(self.download_dir, file_name))
+            return stat.st_size, stat.st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def wait_for(self, file_names, timeout=15, stable_for=STABLE_FOR, checksums=None, since=None):
+        """
+        ✅ Wait until every file in `file_names` is completely downloaded, or until `timeout`.
+
+        checksums: optional {file name: sha256 hex}; a mismatch counts as not downloaded.
+        since: optional epoch seconds; older files with the same name (left over from a previous run) are ignored.
+        Returns {file name: path} for the files that completed; compare its length with what you asked for.
+        """
+        file_names = [file_names] if isinstance(file_names, str) else list(file_names)
+        pending, done = set(file_names), {}
+        closed = set()  # Final names the browser closed or renamed into place while we watched
+        observed = {}  # file name -> (signature, monotonic time it was first seen)
+        deadline = time.monotonic() + timeout
+
+        while pending:
+            now = time.monotonic()
+            for file_name in sorted(pending):
+                signature = self._signature(file_name)
+                if signature is None or self._has_partial(file_name):
+                    observed.pop(file_name, None)
+                    continue
+                if since is not None and signature[1] / 1e9 < since:
+                    continue
+                if observed.get(file_name, (None,))[0] != signature:
+                    observed[file_name] = (signature, now)
+                if file_name in closed or now - observed[file_name][1] >= stable_for:
+                    path = os.path.join(self.download_dir, file_name)
+                    if checksums and file_name in checksums and sha256sum(path) != checksums[file_name]:
+                        logger.warning(f"⚠️ Checksum mismatch for {path}, waiting for a fresh download")
+                        closed.discard(file_name)
+                        continue
+                    done[file_name] = path
+                    pending.discard(file_name)
+
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            # Sleep until something happens in the folder, or until the next stability check is due
+            wait = min(remaining, stable_for) if observed else remaining
+            for name, mask in self._events(wait):
+                if name in pending and mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                    closed.add(name)
+                elif name in pending and mask & IN_MODIFY:
+                    closed.discard(name)
+
+        if pending:
+            logger.warning(f"⚠️ Downloads not finished after {timeout}s: {sorted(pending)} in {self.download_dir}")
+        return done
+
+
+def wait_for_downloads(download_dir, file_names, timeout=15, **kwargs):
+    """ ✅ One-shot DownloadWatcher(download_dir).wait_for(...). """
+    with DownloadWatcher(download_dir) as watcher:
+        return watcher.wait_for(file_names, timeout, **kwargs)
@@ -0,0 +1,183 @@
+import os
+from collections import deque
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from Utilities.logger import logger  # Import centralized logger
+from Utilities.utils import get_download_dir
+
+SUPPORTED_BROWSERS = ("chrome", "firefox", "edge")
+DEFAULT_IMPLICIT_WAIT = 0  # ✅ Page objects wait explicitly through Pageobject.waits; implicit waits would stack on top
+
+
+def create_driver(browser_name, headless=False):
+    """ ✅ Launch a new WebDriver session for the given browser with optional headless mode """
+    logger.info(f"Launching browser: {browser_name} | Headless mode: {headless}")
+    download_dir = get_download_dir()  # ✅ Parallel workers must not share a download folder
+
+    if browser_name == "chrome":
+        options = ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")  # Enable headless mode in Chrome
+            options.add_argument("--disable-gpu")
+            options.add_argument("--window-size=1920x1080")
+        options.add_experimental_option("prefs", {"download.default_directory": download_dir})
+        service = ChromeService()
+        driver = webdriver.Chrome(service=service, options=options)
+
+    elif browser_name == "firefox":
+        options = FirefoxOptions()
+        if headless:
+            options.add_argument("--headless")  # Enable headless mode in Firefox
+        options.set_preference("browser.download.folderList", 2)  # 2 = use browser.download.dir
+        options.set_preference("browser.download.dir", download_dir)
+        service = FirefoxService()
+        driver = webdriver.Firefox(service=service, options=options)
+
+    elif browser_name == "edge":
+        options = EdgeOptions()
+        if headless:
+            options.add_argument("--headless")  # Enable headless mode in Edge
+        options.add_experimental_option("prefs", {"download.default_directory": download_dir})
+        service = EdgeService()
+        driver = webdriver.Edge(service=service, options=options)
+
+    else:
+        logger.error(f"Unsupported browser: {browser_name}")
+        raise ValueError(f"Unsupported browser: {browser_name}")
+
+    driver.maximize_window()
+    driver.implicitly_wait(DEFAULT_IMPLICIT_WAIT)
+    logger.info("Browser session started.")
+    return driver
+
+
+class DriverPool:
+    """
+    Keeps a fixed set of warm browser sessions for the current worker process.
+
+    Sessions are handed out with acquire() and returned with release(), which wipes
+    cookies, storage and extra tabs so the next test starts from a clean browser.
+    A session that fails its health check or its reset is quit and replaced.
+    """
+
+    def __init__(self, browser_name, headless=False, size=1, max_uses=50):
+        if browser_name not in SUPPORTED_BROWSERS:
+            logger.error(f"Unsupported browser: {browser_name}")
+            raise ValueError(f"Unsupported browser: {browser_name}")
+
+        self.browser_name = browser_name
+        self.headless = headless
+        self.size = max(1, int(size))
+        self.max_uses = max_uses
+        self._idle = deque()
+        self._uses = {}  # id(driver) -> number of tests served
+
+    def _launch(self):
+        driver = create_driver(self.browser_name, self.headless)
+        self._uses[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver):
+        """Quit a session and forget about it, ignoring errors from dead browsers."""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to quit browser session cleanly: {e}")
+        logger.info("Browser session ended.")
+
+    def warm_up(self):
+        """Start sessions until the pool holds its configured size."""
+        while len(self._uses) < self.size:
+            self._idle.append(self._launch())
+
+    def is_healthy(self, driver):
+        """A session is healthy if the browser answers a trivial script and has an open window."""
+        try:
+            driver.execute_script("return 1")
+            return bool(driver.window_handles)
+        except Exception as e:
+            logger.warning(f"⚠️ Browser session failed health check: {e}")
+            return False
+
+    def acquire(self):
+        """Return a healthy, clean session, recycling dead ones along the way."""
+        while self._idle:
+            driver = self._idle.popleft()
+            if self.is_healthy(driver):
+                self._uses[id(driver)] += 1
+                logger.info("♻️ Reusing warm browser session from pool.")
+                return driver
+            logger.warning("♻️ Recycling unhealthy browser session.")
+            self._discard(driver)
+
+        driver = self._launch()
+        self._uses[id(driver)] += 1
+        return driver
+
+    def release(self, driver):
+        """Reset a session and return it to the pool, or quit it if it cannot be reused."""
+        if id(driver) not in self._uses:
+            return
+
+        if self._uses[id(driver)] >= self.max_uses:
+            logger.info(f"♻️ Browser session served {self.max_uses} tests, replacing it.")
+            self._discard(driver)
+            return
+
+        if not self.is_healthy(driver) or not self.reset(driver):
+            self._discard(driver)
+            return
+
+        if len(self._idle) >= self.size:
+            self._discard(driver)
+            return
+
+        self._idle.append(driver)
+
+    def reset(self, driver):
+        """Close extra tabs and clear cookies and web storage. Returns False if the session is unusable."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per-origin, so clear it while the app page is still loaded
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except WebDriverException:
+                pass  # about:blank and error pages have no storage
+
+            driver.delete_all_cookies()
+            if self.browser_name in ("chrome", "edge"):
+                # Chromium can drop cookies for every domain, not just the current one
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+            driver.get("about:blank")
+            driver.implicitly_wait(DEFAULT_IMPLICIT_WAIT)  # In case a test changed it
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to reset browser session: {e}")
+            return False
+
+    def close(self):
+        """Quit every session owned by the pool."""
+        while self._idle:
+            self._discard(self._idle.popleft())
+        self._uses.clear()
+
+
+def get_pool_size(config):
+    """Pool size from --browser-pool-size, falling back to the BROWSER_POOL_SIZE env var."""
+    size = config.getoption("--browser-pool-size")
+    if size is None:
+        size = os.getenv("BROWSER_POOL_SIZE", 1)
+    return int(size)
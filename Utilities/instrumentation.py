@@ -0,0 +1,297 @@
+import functools
+import inspect
+import json
+import os
+import time
+from datetime import datetime
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+from Utilities.logger import logger, get_output_dir  # Import centralized logger
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket catches everything slower
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+TOP_OFFENDERS = 10
+
+
+class LatencyHistogram:
+    """ ✅ Fixed-bucket latency histogram of WebDriver commands. """
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS_MS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.commands = {}  # WebDriver command name -> count
+
+    def add(self, command, seconds):
+        ms = seconds * 1000
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[index] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.commands[command] = self.commands.get(command, 0) + 1
+
+    def percentile(self, fraction):
+        """ Upper bound (ms) of the bucket holding the given fraction of commands. """
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += count
+            if seen >= target and count:
+                return bound if bound != float("inf") else self.max * 1000
+        return 0.0
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 1),
+            "max_ms": round(self.max * 1000, 1),
+            "buckets_ms": {str(bound): count for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets) if count},
+            "commands": self.commands,
+        }
+
+
+class Instrumentation:
+    """
+    Per-call timings of page-object methods: wall time, time spent in explicit waits and the number
+    of WebDriver commands (HTTP round trips to the driver), tagged with the running test's node id.
+
+    Nothing is patched until enable() is called, so a normal run pays no overhead at all.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.current_test = None
+        self.records = []
+        self._stack = []  # Page-object calls in progress (methods call each other)
+        self._original_waits = {}
+        self.commands_by_test = {}  # node id -> LatencyHistogram
+        self.commands_by_method = {}  # "Page.method" (innermost call) or "<test body>" -> LatencyHistogram
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        for name in ("until", "until_not"):
+            original = getattr(WebDriverWait, name)
+            self._original_waits[name] = original
+            setattr(WebDriverWait, name, self._timed_wait(original))
+
+    def disable(self):
+        for name, original in self._original_waits.items():
+            setattr(WebDriverWait, name, original)
+        self._original_waits.clear()
+        self.enabled = False
+
+    def _timed_wait(self, original):
+        @functools.wraps(original)
+        def wait(wait_self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(wait_self, *args, **kwargs)
+            finally:
+                self.on_wait(time.perf_counter() - started)
+        return wait
+
+    def attach(self, driver):
+        """ ✅ Count every command the driver sends; safe to call again for a pooled driver. """
+        executor = driver.command_executor
+        if getattr(executor, "_boost_instrumented", False):
+            return
+        original = executor.execute
+
+        def execute(command, params):
+            started = time.perf_counter()
+            try:
+                return original(command, params)
+            finally:
+                self.on_command(command, time.perf_counter() - started)
+
+        executor.execute = execute
+        executor._boost_instrumented = True
+
+    def on_command(self, command, seconds):
+        for frame in self._stack:
+            frame["round_trips"] += 1
+
+        # Histograms: per test, and per innermost page-object method (the one that actually sent it)
+        method = self._stack[-1]["name"] if self._stack else "<test body>"
+        test = self.current_test or "<no test>"
+        self.commands_by_test.setdefault(test, LatencyHistogram()).add(command, seconds)
+        self.commands_by_method.setdefault(method, LatencyHistogram()).add(command, seconds)
+
+    def on_wait(self, seconds):
+        for frame in self._stack:
+            frame["wait"] += seconds
+
+    def call(self, page, method, func, args, kwargs):
+        """ ✅ Run one page-object method and record how long it took and what it cost. """
+        frame = {"name": f"{page}.{method}", "round_trips": 0, "wait": 0.0}
+        self._stack.append(frame)
+        started = time.perf_counter()
+        error = None
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error = type(e).__name__
+            raise
+        finally:
+            wall = time.perf_counter() - started
+            self._stack.pop()
+            self.records.append({
+                "test": self.current_test,
+                "page": page,
+                "method": method,
+                "depth": len(self._stack),
+                "wall": round(wall, 4),
+                "wait": round(frame["wait"], 4),
+                "round_trips": frame["round_trips"],
+                "error": error,
+            })
+
+    def summary(self):
+        """ ✅ Aggregate per page-object method, slowest total wall time first. """
+        totals = {}
+        for record in self.records:
+            key = (record["page"], record["method"])
+            entry = totals.setdefault(key, {"calls": 0, "wall": 0.0, "wait": 0.0, "round_trips": 0, "errors": 0})
+            entry["calls"] += 1
+            entry["wall"] += record["wall"]
+            entry["wait"] += record["wait"]
+            entry["round_trips"] += record["round_trips"]
+            entry["errors"] += 1 if record["error"] else 0
+        return sorted(totals.items(), key=lambda item: item[1]["wall"], reverse=True)
+
+    def write_metrics(self):
+        """ ✅ One JSON line per page-object call, in Metrics/<ENV>[/<worker>]/. Returns the file path. """
+        metrics_dir = get_output_dir("Metrics")
+        os.makedirs(metrics_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        path = os.path.join(metrics_dir, f"page_metrics_{timestamp}.jsonl")
+        with open(path, "w", encoding="utf-8") as metrics_file:
+            for record in self.records:
+                metrics_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        return path
+
+    def write_command_stats(self):
+        """ ✅ Command histograms per test and per method, next to the page metrics. Returns the file path. """
+        metrics_dir = get_output_dir("Metrics")
+        os.makedirs(metrics_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        path = os.path.join(metrics_dir, f"command_stats_{timestamp}.json")
+        with open(path, "w", encoding="utf-8") as stats_file:
+            json.dump({
+                "by_test": {test: hist.as_dict() for test, hist in self.commands_by_test.items()},
+                "by_method": {method: hist.as_dict() for method, hist in self.commands_by_method.items()},
+            }, stats_file, indent=1)
+        return path
+
+    def top_offenders(self, histograms, limit=TOP_OFFENDERS):
+        """ ✅ Entries that sent the most commands, with their latency profile. """
+        ranked = sorted(histograms.items(), key=lambda item: item[1].count, reverse=True)[:limit]
+        return [
+            (name, hist.count, hist.total, hist.percentile(0.5), hist.percentile(0.95), hist.max * 1000,
+             max(hist.commands, key=hist.commands.get))
+            for name, hist in ranked
+        ]
+
+
+# ✅ Shared instance used by the wrappers, the driver fixture and the pytest plugins
+instrumentation = Instrumentation()
+
+
+def instrument_class(cls):
+    """ ✅ Wrap every public method of a page-object class so each call is recorded. """
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(attr) or getattr(attr, "_boost_instrumented", False):
+            continue
+
+        def make_wrapper(func, method):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return instrumentation.call(cls.__name__, method, func, args, kwargs)
+            wrapper._boost_instrumented = True
+            return wrapper
+
+        setattr(cls, name, make_wrapper(attr, name))
+
+
+def instrument_page_objects():
+    """ ✅ Instrument the page objects used by the suite. """
+    from Pageobject.login import LoginPage
+    from Pageobject.internal import InternalPage
+    from Pageobject.payment import PaymentPage
+    from Pageobject.file_validation import PaymentPage as FileValidationPage
+    from Pageobject.dashboard import DashboardPage
+
+    for cls in (LoginPage, InternalPage, PaymentPage, FileValidationPage, DashboardPage):
+        instrument_class(cls)
+
+
+class InstrumentationPlugin:
+    """ ✅ Tags records with the running test, writes the metrics files and prints the top offenders. """
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        instrumentation.current_test = item.nodeid
+        yield
+        instrumentation.current_test = None
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if instrumentation.records:
+            path = instrumentation.write_metrics()
+            logger.info(f"⏱️ Page-object metrics written to: {path}")
+        if instrumentation.commands_by_test:
+            path = instrumentation.write_command_stats()
+            logger.info(f"⏱️ WebDriver command stats written to: {path}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """ ✅ Print which methods and tests send the most WebDriver commands (candidates for batching). """
+        for title, histograms in (("page-object method", instrumentation.commands_by_method),
+                                  ("test", instrumentation.commands_by_test)):
+            if not histograms:
+                continue
+            terminalreporter.section(f"WebDriver round trips per {title} (top {TOP_OFFENDERS})")
+            terminalreporter.write_line(
+                f"{'commands':>8} {'total s':>8} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>8}  {'most sent':<22} {title}")
+            for name, count, total, p50, p95, max_ms, most_sent in instrumentation.top_offenders(histograms):
+                terminalreporter.write_line(
+                    f"{count:>8} {total:>8.2f} {p50:>7.0f} {p95:>7.0f} {max_ms:>8.0f}  {most_sent:<22} {name}")
+
+
+class HtmlSummaryPlugin:
+    """ ✅ Page-object timing table in the pytest-html summary (only registered when pytest-html is active). """
+
+    def pytest_html_results_summary(self, prefix, summary, postfix):
+        from py.xml import html
+
+        rows = [
+            html.tr(
+                html.td(f"{page}.{method}"), html.td(entry["calls"]),
+                html.td(f"{entry['wall']:.2f}"), html.td(f"{entry['wait']:.2f}"),
+                html.td(entry["round_trips"]), html.td(entry["errors"]),
+            )
+            for (page, method), entry in instrumentation.summary()
+        ]
+        if rows:
+            postfix.extend([
+                html.h2("Page-object timings"),
+                html.table(
+                    html.tr(html.th("Method"), html.th("Calls"), html.th("Wall (s)"), html.th("Wait (s)"),
+                            html.th("Round trips"), html.th("Errors")),
+                    *rows,
+                    id="page-object-timings",
+                ),
+            ])
+
+
+def enable_instrumentation(config):
+    """ ✅ Called from conftest when --instrument is passed. """
+    instrumentation.enable()
+    instrument_page_objects()
+    config.pluginmanager.register(InstrumentationPlugin(), "boost-instrumentation")
+    if config.pluginmanager.hasplugin("html"):
+        config.pluginmanager.register(HtmlSummaryPlugin(), "boost-instrumentation-html")
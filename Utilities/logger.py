@@ -1,19 +1,188 @@
+import atexit
+import gzip
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import shutil
+import threading
+import time
 from datetime import datetime
 
+try:
+    import fcntl  # ✅ POSIX only: lets the archiver skip logs another process is still writing
+except ImportError:
+    fcntl = None
+
+# ✅ Archive limits per log folder, so startup cost does not grow with the log history
+ARCHIVE_MAX_AGE_DAYS = 14
+ARCHIVE_MAX_BYTES = 50 * 1024 * 1024
+
+# ✅ File writes are batched: flushed when the queue drains, at least every FLUSH_INTERVAL seconds,
+# and immediately for errors
+FLUSH_INTERVAL = 1.0
+
 
 def get_environment():
     """ ✅ Always fetch the latest environment value dynamically. """
     return os.getenv("ENVIRONMENT", "DEV").upper()  # ✅ Always read fresh ENV value
 
 
+def get_worker_id():
+    """ ✅ Id of the parallel worker running this process ('' when tests run serially). """
+    # pytest-xdist sets PYTEST_XDIST_WORKER, main.py --workers sets BOOST_WORKER_ID
+    return os.getenv("PYTEST_XDIST_WORKER") or os.getenv("BOOST_WORKER_ID") or ""
+
+
+def get_output_dir(root):
+    """ ✅ Per-environment output folder (Logs, Screenshots, Downloads), split per worker when running in parallel. """
+    worker_id = get_worker_id()
+    if worker_id:
+        return os.path.join(root, get_environment(), worker_id)
+    return os.path.join(root, get_environment())
+
+
+def _is_in_use(path):
+    """ ✅ True if another live process holds the lock on this log file. """
+    if fcntl is None:
+        return False  # Windows refuses to move open files, shutil.move will fail and the file is skipped
+    with open(path, "rb") as log_file:
+        try:
+            fcntl.flock(log_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return True
+        fcntl.flock(log_file.fileno(), fcntl.LOCK_UN)
+    return False
+
+
+def _compress(path, archive_dir):
+    """ ✅ gzip a log into the archive folder (via a temp file, so a crash never leaves a truncated archive). """
+    target = os.path.join(archive_dir, os.path.basename(path) + ".gz")
+    temp_target = target + ".tmp"
+    with open(path, "rb") as source, gzip.open(temp_target, "wb") as archive:
+        shutil.copyfileobj(source, archive)
+    os.replace(temp_target, target)
+    os.remove(path)
+
+
+def archive_old_logs(log_dir, archive_dir, current_log=None):
+    """
+    ✅ Compress finished logs into the archive, then prune it by age and total size.
+    Runs on a background thread from setup_logger; safe to call directly.
+    """
+    try:
+        # Finished logs from earlier runs, plus archives left uncompressed by older versions
+        candidates = [os.path.join(log_dir, file) for file in os.listdir(log_dir) if file.endswith(".log")]
+        candidates += [os.path.join(archive_dir, file) for file in os.listdir(archive_dir) if file.endswith(".log")]
+        for path in candidates:
+            if current_log and os.path.abspath(path) == os.path.abspath(current_log):
+                continue
+            try:
+                if not _is_in_use(path):
+                    _compress(path, archive_dir)
+            except OSError:
+                pass  # Deleted or still open elsewhere, try again next run
+
+        # Drop archives that are too old, then the oldest ones until the folder fits the size budget
+        archives = []
+        for file in os.listdir(archive_dir):
+            path = os.path.join(archive_dir, file)
+            if os.path.isfile(path):
+                stat = os.stat(path)
+                archives.append((stat.st_mtime, stat.st_size, path))
+        archives.sort()
+
+        oldest_allowed = time.time() - ARCHIVE_MAX_AGE_DAYS * 86400
+        total_size = sum(size for _, size, _ in archives)
+        for mtime, size, path in archives:
+            if mtime >= oldest_allowed and total_size <= ARCHIVE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total_size -= size
+            except OSError:
+                pass
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"⚠️ Log archiving failed: {e}")
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """ ✅ FileHandler that leaves flushing to the queue listener instead of flushing after every record. """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR or time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """ ✅ One compact JSON object per record, for log ingestion tools. """
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "env": get_environment(),
+            "worker": get_worker_id() or None,
+            "thread": record.threadName,
+            "msg": record.getMessage(),
+        }
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """ ✅ Background writer: handles records as they arrive and flushes all handlers once the queue is empty. """
+
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+_listeners = []  # One per configured logger; drained by flush_logs() and at exit
+
+
+def flush_logs():
+    """ ✅ Block until every queued record is written and flushed (call at teardown). """
+    for listener in _listeners:
+        listener.queue.join()
+        for handler in listener.handlers:
+            handler.flush()
+
+
+def _stop_listeners():
+    """ ✅ atexit: write whatever is still queued, then close the files. """
+    while _listeners:
+        listener = _listeners.pop()
+        listener.stop()  # Processes every record queued before the sentinel
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(_stop_listeners)
+
+
 def setup_logger(logger_name="TestLogger"):
     """ ✅ Creates and configures a logger with the correct ENV dynamically. """
 
     ENV = get_environment()  # ✅ Fetch the latest ENV dynamically
-    LOG_DIR = os.path.join("Logs", ENV)  # ✅ Ensure correct log directory
+    LOG_DIR = get_output_dir("Logs")  # ✅ Ensure correct log directory (one per worker)
     ARCHIVE_DIR = os.path.join(LOG_DIR, "archive")
 
     # ✅ Generate a timestamped log file with the correct ENV name
@@ -24,13 +193,6 @@ def setup_logger(logger_name="TestLogger"):
     os.makedirs(LOG_DIR, exist_ok=True)
     os.makedirs(ARCHIVE_DIR, exist_ok=True)
 
-    # ✅ Archive old Logs before starting a new log
-    for file in os.listdir(LOG_DIR):
-        if file.endswith(".log") and not file.startswith("archive"):
-            old_log_path = os.path.join(LOG_DIR, file)
-            new_archive_path = os.path.join(ARCHIVE_DIR, file)
-            shutil.move(old_log_path, new_archive_path)
-
     # ✅ Setup the logger
     logger = logging.getLogger(logger_name)
     logger.setLevel(logging.INFO)
@@ -40,16 +202,33 @@ def setup_logger(logger_name="TestLogger"):
         logger.handlers.clear()
 
     # File Handler - Logs stored per test execution
-    file_handler = logging.FileHandler(LOG_FILE, mode='w', encoding='utf-8')
+    file_handler = BufferedFileHandler(LOG_FILE, mode='w', encoding='utf-8')
     file_handler.setFormatter(logging.Formatter('%(asctime)s :%(levelname)s : %(name)s :%(message)s'))
+    if fcntl is not None:
+        fcntl.flock(file_handler.stream.fileno(), fcntl.LOCK_SH)  # ✅ Mark this log as in use until the process exits
 
     # Console Handler - Logs shown in console
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
 
-    # ✅ Add Handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    handlers = [file_handler, console_handler]
+
+    # Optional JSON-lines file next to the text log (BOOST_LOG_JSON=1 or pytest --log-json)
+    if os.getenv("BOOST_LOG_JSON", "").lower() in ("1", "true", "yes"):
+        json_handler = BufferedFileHandler(LOG_FILE[:-len(".log")] + ".jsonl", mode='w', encoding='utf-8')
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    # ✅ Add Handlers: callers only enqueue records, a background listener does the writing
+    log_queue = queue.Queue()  # Unbounded, so logging never blocks the test
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = BatchingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+
+    # ✅ Archive old Logs in the background instead of blocking startup
+    threading.Thread(target=archive_old_logs, args=(LOG_DIR, ARCHIVE_DIR, LOG_FILE),
+                     name="log-archiver", daemon=True).start()
 
     logger.info(f"🚀 Logger initialized for environment: {ENV}")
     logger.info(f"📂 Log file: {LOG_FILE}")
@@ -57,8 +236,34 @@ def setup_logger(logger_name="TestLogger"):
     return logger
 
 
-# ✅ Fetch the latest ENV dynamically every time a new logger is created
-logger = setup_logger()
+_loggers = {}
+_loggers_lock = threading.Lock()
+
+
+def get_logger(logger_name="TestLogger"):
+    """ ✅ Configure the logger on first use only; later calls return the same instance. """
+    if logger_name not in _loggers:
+        with _loggers_lock:
+            if logger_name not in _loggers:
+                _loggers[logger_name] = setup_logger(logger_name)
+    return _loggers[logger_name]
+
+
+class LazyLogger:
+    """ ✅ Stand-in for the module-level logger: nothing is created on import, only on the first log call. """
+
+    def __init__(self, logger_name="TestLogger"):
+        self._logger_name = logger_name
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            # pytest and other introspection probe private attributes; that must not create log files
+            raise AttributeError(name)
+        return getattr(get_logger(self._logger_name), name)
+
+
+# ✅ Importing this module has no side effects; Logs/ is created when the first message is logged
+logger = LazyLogger()
 
 
 
@@ -0,0 +1,193 @@
+import heapq
+import html
+import os
+import subprocess
+import time
+import xml.etree.ElementTree as ET
+
+# ✅ Most tests a scheduling group holds: small enough to balance workers, large enough to share a batch upload
+GROUP_SIZE = int(os.getenv("BOOST_GROUP_SIZE", "4"))
+
+
+def collect_node_ids(pytest_cmd, tests_to_run):
+    """ ✅ Ask pytest for the node ids it would run, without starting any browser. """
+    collect_cmd = [arg for arg in pytest_cmd if arg != "-v"]  # -v would print a tree instead of node ids
+    result = subprocess.run(
+        collect_cmd + [tests_to_run, "--collect-only", "-q"],
+        capture_output=True, text=True,
+    )
+    node_ids = [line.strip() for line in result.stdout.splitlines() if "::" in line]
+    if result.returncode not in (0, 5) or not node_ids:  # 5 = no tests collected
+        print(result.stdout[-2000:])
+        print(result.stderr[-2000:])
+    return node_ids
+
+
+def parse_shard(shard):
+    """ ✅ Turn 'i/n' (1-based) into (i, n). """
+    try:
+        index, total = (int(part) for part in shard.split("/"))
+    except ValueError:
+        raise ValueError(f"❌ Invalid shard '{shard}', expected i/n such as 1/4")
+    if not 1 <= index <= total:
+        raise ValueError(f"❌ Invalid shard '{shard}', i must be between 1 and n")
+    return index, total
+
+
+def select_shard(node_ids, shard, group_size=GROUP_SIZE):
+    """
+    ✅ Deal the same test groups as schedule_longest_first out to CI machines, fewest tests first.
+    Uses test counts, not timings, so every machine computes the same split from the same collection.
+    """
+    index, total = parse_shard(shard)
+    chunks, _ = _pack(group_tests(node_ids, group_size), len, total, node_ids)
+    return chunks[index - 1] if index <= len(chunks) else []
+
+
+def group_tests(node_ids, group_size=GROUP_SIZE):
+    """
+    ✅ Consecutive runs of at most `group_size` tests from the same module, in file order.
+    Neighbouring tests usually open the same batch fixture, so a group shares one batch_cache upload,
+    while a large module like test_internal.py still spreads over several workers.
+    """
+    groups, current = [], []
+    for nodeid in node_ids:
+        if current and (len(current) >= group_size or nodeid.split("::", 1)[0] != current[0].split("::", 1)[0]):
+            groups.append(current)
+            current = []
+        current.append(nodeid)
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _pack(groups, weight, workers, node_ids):
+    """ Longest-processing-time-first: the heaviest remaining group goes to the least loaded worker. """
+    workers = max(1, min(workers, len(groups)))
+    loads = [(0.0, worker) for worker in range(workers)]
+    heapq.heapify(loads)
+    chunks = [[] for _ in range(workers)]
+    for group in sorted(groups, key=weight, reverse=True):
+        load, worker = heapq.heappop(loads)
+        chunks[worker].extend(group)
+        heapq.heappush(loads, (load + weight(group), worker))
+
+    order = {nodeid: position for position, nodeid in enumerate(node_ids)}
+    for chunk in chunks:
+        chunk.sort(key=order.__getitem__)  # Each worker runs its tests in collection (file) order
+    predicted = [0.0] * workers
+    for load, worker in loads:
+        predicted[worker] = load
+    return chunks, predicted
+
+
+def schedule_longest_first(node_ids, estimates, workers, group_size=GROUP_SIZE):
+    """
+    ✅ Longest-processing-time-first bin packing of test groups (see group_tests): hand the slowest
+    remaining group to the least loaded worker, so long groups are placed first and short ones even out the tail.
+    Returns (chunks, predicted seconds per worker).
+    """
+    return _pack(group_tests(node_ids, group_size), lambda group: sum(estimates[nodeid] for nodeid in group),
+                 workers, node_ids)
+
+
+def run_workers(pytest_cmd, chunks, report_folder):
+    """
+    ✅ Run one pytest process per chunk with its own BOOST_WORKER_ID.
+
+    Each worker writes its own HTML/JUnit report, timings file and console log into report_folder,
+    and its own Logs/Screenshots/Downloads folders (see Utilities.logger.get_output_dir).
+    Returns {worker_id: {"exit_code", "html", "junit", "timings", "seconds"}}.
+    """
+    running = {}
+    for index, node_ids in enumerate(chunks):
+        worker_id = f"w{index}"
+        html_report = os.path.join(report_folder, f"report_{worker_id}.html")
+        junit_report = os.path.join(report_folder, f"junit_{worker_id}.xml")
+        timings_file = os.path.join(report_folder, f"timings_{worker_id}.json")
+        console_log = open(os.path.join(report_folder, f"console_{worker_id}.log"), "w", encoding="utf-8")
+
+        cmd = pytest_cmd + node_ids + [
+            f"--html={html_report}", "--self-contained-html",
+            f"--junitxml={junit_report}",
+        ]
+        env = dict(os.environ, BOOST_WORKER_ID=worker_id, BOOST_TIMINGS_FILE=timings_file)
+        process = subprocess.Popen(cmd, env=env, stdout=console_log, stderr=subprocess.STDOUT)
+        running[worker_id] = (process, console_log, time.monotonic(),
+                              {"html": html_report, "junit": junit_report, "timings": timings_file})
+        print(f"🧵 Worker {worker_id} started with {len(node_ids)} tests (pid {process.pid})")
+
+    results = {}
+    for worker_id, (process, console_log, started, result) in running.items():
+        exit_code = process.wait()
+        console_log.close()
+        seconds = time.monotonic() - started
+        results[worker_id] = dict(result, exit_code=exit_code, seconds=seconds)
+        status = "✅" if exit_code == 0 else "❌"
+        print(f"{status} Worker {worker_id} finished in {seconds:.0f}s with exit code {exit_code}")
+    return results
+
+
+def merge_junit_reports(junit_reports, merged_path):
+    """ ✅ Combine the workers' JUnit XML files into one <testsuites> document. Returns the merged root. """
+    merged = ET.Element("testsuites")
+    for worker_id, path in junit_reports.items():
+        if not os.path.exists(path):
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            suite.set("name", f"{suite.get('name', 'pytest')}[{worker_id}]")
+            for testcase in suite.iter("testcase"):
+                testcase.set("worker", worker_id)
+            merged.append(suite)
+
+    ET.ElementTree(merged).write(merged_path, encoding="utf-8", xml_declaration=True)
+    return merged
+
+
+def _outcome(testcase):
+    """ ✅ pytest-html style outcome of a JUnit <testcase>. """
+    for tag, outcome in (("failure", "Failed"), ("error", "Error"), ("skipped", "Skipped")):
+        element = testcase.find(tag)
+        if element is not None:
+            return outcome, element.get("message", "")
+    return "Passed", ""
+
+
+def merge_html_reports(merged_junit, worker_reports, merged_path, title):
+    """
+    ✅ Write a single HTML report covering every worker.
+
+    The summary and result table come from the merged JUnit data; each row links to the worker's
+    own pytest-html report, which keeps the screenshots and captured logs.
+    """
+    rows, counts = [], {}
+    for suite in merged_junit.findall("testsuite"):
+        for testcase in suite.iter("testcase"):
+            outcome, message = _outcome(testcase)
+            counts[outcome] = counts.get(outcome, 0) + 1
+            worker_id = testcase.get("worker", "")
+            report_name = os.path.basename(worker_reports.get(worker_id, ""))
+            name = f"{testcase.get('classname', '')}::{testcase.get('name', '')}"
+            rows.append(
+                f'<tr class="{outcome.lower()}"><td>{outcome}</td><td>{html.escape(name)}</td>'
+                f'<td>{float(testcase.get("time", 0)):.2f}</td>'
+                f'<td><a href="{html.escape(report_name)}">{html.escape(worker_id)}</a></td>'
+                f'<td>{html.escape(message[:300])}</td></tr>'
+            )
+
+    summary = ", ".join(f"{count} {outcome.lower()}" for outcome, count in sorted(counts.items()))
+    with open(merged_path, "w", encoding="utf-8") as report:
+        report.write(
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            f"<title>{html.escape(title)}</title><style>"
+            "body{font-family:Helvetica,Arial,sans-serif;font-size:13px}"
+            "table{border-collapse:collapse;width:100%}td,th{border:1px solid #e6e6e6;padding:4px 8px;text-align:left}"
+            ".passed td:first-child{color:green}.failed td:first-child,.error td:first-child{color:red}"
+            ".skipped td:first-child{color:orange}</style></head><body>"
+            f"<h1>{html.escape(title)}</h1><p>{len(rows)} tests: {summary}</p>"
+            "<table><tr><th>Result</th><th>Test</th><th>Duration (s)</th><th>Worker report</th><th>Message</th></tr>"
+            + "".join(rows) +
+            "</table></body></html>"
+        )
@@ -0,0 +1,103 @@
+import copy
+import hashlib
+import os
+import pickle
+import sys
+import uuid
+import zlib
+from collections import OrderedDict
+from Utilities.logger import logger  # Import centralized logger
+
+DEFAULT_CACHE_DIR = os.getenv(
+    "BOOST_PARSE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "boost-qa", "parse")
+)
+DEFAULT_MAX_ENTRIES = 32  # Parsed workbooks kept in memory per process
+
+
+class ParseCache:
+    """
+    Results of workbook parsers, keyed by file content hash, parser and parser version.
+
+    Two tiers: an in-memory LRU per process, and zlib-compressed pickles on disk shared by every
+    run and worker on this machine. Editing a workbook changes its hash; bumping a parser's
+    PARSER_VERSION invalidates everything that parser produced.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_entries=DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory = OrderedDict()  # key -> parsed result
+        self._hashes = {}  # (path, size, mtime) -> content hash, so unchanged files are hashed once
+
+    def content_hash(self, file_path):
+        """ ✅ sha256 of the file contents. """
+        stat = os.stat(file_path)
+        stat_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        if stat_key not in self._hashes:
+            digest = hashlib.sha256()
+            with open(file_path, "rb") as workbook:
+                for chunk in iter(lambda: workbook.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            self._hashes[stat_key] = digest.hexdigest()
+        return self._hashes[stat_key]
+
+    def _key(self, parser, file_path, args):
+        version = getattr(sys.modules[parser.__module__], "PARSER_VERSION", 0)
+        name = f"{parser.__module__}.{parser.__qualname__}"
+        args_hash = hashlib.sha256(repr(args).encode()).hexdigest()[:12]
+        return f"{name}-v{version}-{self.content_hash(file_path)[:32]}-{args_hash}"
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl.z")
+
+    def _read_disk(self, key):
+        try:
+            with open(self._disk_path(key), "rb") as cached:
+                return pickle.loads(zlib.decompress(cached.read()))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable parse cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key, result):
+        """ ✅ Write to a temp file and rename, so parallel workers never read a half-written entry. """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{self._disk_path(key)}.{uuid.uuid4().hex}.tmp"
+            with open(temp_path, "wb") as cached:
+                cached.write(zlib.compress(pickle.dumps(result, pickle.HIGHEST_PROTOCOL)))
+            os.replace(temp_path, self._disk_path(key))
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write parse cache entry {key}: {e}")
+
+    def _remember(self, key, result):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def load(self, parser, file_path, *args):
+        """ ✅ Return parser(file_path, *args), parsing only if neither cache tier has the result. """
+        file_name = os.path.basename(file_path)
+        key = self._key(parser, file_path, args)
+
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            logger.info(f"📦 Parse cache hit (memory): {parser.__name__}({file_name})")
+            return copy.deepcopy(self._memory[key])  # Callers may mutate what they get back
+
+        result = self._read_disk(key)
+        if result is not None:
+            logger.info(f"📦 Parse cache hit (disk): {parser.__name__}({file_name})")
+        else:
+            logger.info(f"📦 Parse cache miss: {parser.__name__}({file_name}), parsing...")
+            result = copy.deepcopy(parser(file_path, *args))  # Parsers may return shared globals
+            self._write_disk(key, result)
+
+        self._remember(key, result)
+        return copy.deepcopy(result)
+
+
+# ✅ Shared instance for tests and helpers
+parse_cache = ParseCache()
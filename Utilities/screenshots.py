@@ -0,0 +1,461 @@
+import atexit
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from Utilities.logger import logger, get_environment  # Import centralized logger
+
+try:
+    import fcntl  # ✅ POSIX only: keeps parallel workers from rotating or compressing the same folder twice
+except ImportError:
+    fcntl = None
+
+try:
+    from PIL import Image, ImageChops  # ✅ Optional: WebP/optimised PNG and near-duplicate detection
+except ImportError:
+    Image = ImageChops = None
+
+# ✅ Screenshots are fetched from the browser on the test thread (that part needs the driver),
+# then encoded and written to disk by a small background pool so the test can carry on.
+WRITER_THREADS = int(os.getenv("BOOST_SCREENSHOT_WRITERS", "2"))
+FLUSH_TIMEOUT = 30  # Seconds flush_screenshots() waits for outstanding writes at the end of the session
+
+# ✅ Content-addressed store: every distinct frame is kept once under Screenshots/.store/<ENV> and the
+# named screenshots are hard links to it. Without Pillow it still dedupes exact copies, as plain PNG.
+STORE_FORMAT = os.getenv("BOOST_SCREENSHOT_FORMAT", "webp" if Image else "png").lower()  # webp | png
+NEAR_DUPLICATE_BITS = int(os.getenv("BOOST_SCREENSHOT_NEAR_DUP_BITS", "4"))  # dHash bits that may differ; -1 = exact only
+NEAR_DUPLICATE_TOLERANCE = 8  # ...and no pixel channel may differ by more than this (0-255) from the stored frame
+SAVE_DELTAS = os.getenv("BOOST_SCREENSHOT_DELTAS", "").lower() in ("1", "true", "yes")  # Store only the changed region
+DELTA_MAX_AREA = 0.25  # A delta is only kept when the changed region is at most this share of the frame
+HASH_SIZE = 16  # dHash grid: HASH_SIZE x HASH_SIZE = 256 bits
+STORE_MAX_AGE_DAYS = int(os.getenv("BOOST_SCREENSHOT_MAX_AGE_DAYS", "14"))
+STORE_MAX_BYTES = int(os.getenv("BOOST_SCREENSHOT_MAX_MB", "500")) * 1024 * 1024
+IMAGE_EXTENSIONS = (".png", ".webp")
+
+
+def _write(data, path, encode=None):
+    """ Encode (optional) and write one screenshot via a temp file, so readers never see half a PNG. """
+    if encode is not None:
+        data = encode(data)
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(temp_path, "wb") as screenshot:
+        screenshot.write(data)
+    os.replace(temp_path, path)
+    return path
+
+
+class ScreenshotWriter:
+    """ ✅ Background writer pool: submit() returns at once, wait()/flush() block until the files are on disk. """
+
+    def __init__(self, max_workers=WRITER_THREADS):
+        self.max_workers = max(max_workers, 1)
+        self._executor = None  # Started on the first screenshot, so runs without screenshots cost nothing
+        self._pending = {}  # path -> Future
+        self._lock = threading.Lock()
+
+    def submit(self, data, path, encode=None, write=_write):
+        """
+        ✅ Queue raw image bytes for writing to `path`; returns the Future (its result is the path).
+        `write(data, path, encode)` does the work on a pool thread, e.g. ScreenshotStore.save.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="screenshot-writer")
+            future = self._executor.submit(write, data, path, encode)
+            self._pending[path] = future
+        future.add_done_callback(lambda done: self._finished(path, done))
+        return future
+
+    def _finished(self, path, future):
+        with self._lock:
+            if self._pending.get(path) is future:
+                del self._pending[path]
+        if future.exception() is not None:
+            logger.error(f"❌ Failed to write screenshot {path}: {future.exception()}")
+
+    def wait(self, path, timeout=None):
+        """ ✅ Block until the screenshot at `path` is written; True if it exists on disk. """
+        with self._lock:
+            future = self._pending.get(path)
+        if future is not None:
+            wait([future], timeout)
+        return os.path.exists(path)
+
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """ ✅ Block until every queued screenshot is written; returns how many were still pending. """
+        with self._lock:
+            futures = list(self._pending.values())
+        if futures:
+            _, not_done = wait(futures, timeout)
+            if not_done:
+                logger.warning(f"⚠️ {len(not_done)} screenshot(s) still being written after {timeout}s")
+        return len(futures)
+
+    def shutdown(self):
+        """ ✅ atexit: finish every queued write, then stop the pool. """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def _dhash(image):
+    """ Perceptual difference hash: one bit per neighbouring pixel pair of a small grayscale copy. """
+    pixels = image.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.BILINEAR).tobytes()
+    bits = 0
+    for row in range(HASH_SIZE):
+        for column in range(HASH_SIZE):
+            offset = row * (HASH_SIZE + 1) + column
+            bits = (bits << 1) | (pixels[offset] > pixels[offset + 1])
+    return bits
+
+
+def _link(source, path):
+    """ Point `path` at a stored object: a hard link where the filesystem allows it, a copy otherwise. """
+    temp_path = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, path)
+
+
+def prune_dir(directory, max_age_days=STORE_MAX_AGE_DAYS, max_bytes=STORE_MAX_BYTES, removable=None):
+    """
+    ✅ Delete files older than `max_age_days`, then the oldest ones until the folder fits `max_bytes`.
+    `removable(path, stat)` can veto files (e.g. store objects still linked from a screenshot). Returns bytes freed.
+    """
+    files = []
+    for file in os.listdir(directory):
+        path = os.path.join(directory, file)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if os.path.isfile(path) and (removable is None or removable(path, stat)):
+            files.append((stat.st_mtime, stat.st_size, path))
+    files.sort()
+
+    oldest_allowed = time.time() - max_age_days * 86400
+    total_size = sum(size for _, size, _ in files)
+    freed = 0
+    for mtime, size, path in files:
+        if mtime >= oldest_allowed and total_size <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total_size -= size
+            freed += size
+        except OSError:
+            pass
+    return freed
+
+
+class ScreenshotStore:
+    """
+    ✅ Keeps one copy of each distinct screenshot.
+
+    Objects are named <sha256 prefix>-<dHash>.<ext>. A frame whose bytes match a stored object, or whose
+    perceptual hash is within `near_duplicate_bits` of one and whose pixels differ by at most
+    NEAR_DUPLICATE_TOLERANCE, is not encoded again: its named file just links to that object.
+    The named file always links to a full frame. With `save_deltas`, a frame that differs from the previous one
+    in a small region also stores that crop as an extra object; deltas.jsonl records it with its base, the full
+    frame and the box, so a step's change can be reviewed on its own and restore() can rebuild it.
+    """
+
+    def __init__(self, root=None, fmt=STORE_FORMAT, near_duplicate_bits=NEAR_DUPLICATE_BITS, save_deltas=SAVE_DELTAS):
+        self.root = root or os.path.join(os.getcwd(), "Screenshots", ".store", get_environment())
+        self.format = fmt if Image else "png"
+        self.near_duplicate_bits = near_duplicate_bits if Image else -1
+        self.save_deltas = save_deltas and Image is not None
+        self.stats = {"stored": 0, "exact": 0, "near": 0, "deltas": 0}
+        self._lock = threading.Lock()
+        self._by_digest = None  # sha256 prefix -> object path, loaded on first save
+        self._by_hash = {}  # dHash -> object path
+        self._in_flight = {}  # sha256 prefix -> Future of the object path, while the first writer stores it
+        self._previous = None  # (image, object path) of the last full frame, for deltas
+
+    @property
+    def extension(self):
+        return "." + self.format
+
+    def _load(self):
+        """ Index the objects written by earlier runs and other workers (their names carry both hashes). """
+        os.makedirs(self.root, exist_ok=True)
+        self._by_digest = {}
+        for file in os.listdir(self.root):
+            name, extension = os.path.splitext(file)
+            if extension in IMAGE_EXTENSIONS:
+                digest, _, dhash = name.partition("-")
+                self._by_digest[digest] = os.path.join(self.root, file)
+                if dhash:
+                    self._by_hash[int(dhash, 16)] = os.path.join(self.root, file)
+
+    def _candidates(self, dhash):
+        """ Stored objects whose perceptual hash is within `near_duplicate_bits` of `dhash`, closest first. """
+        if self.near_duplicate_bits < 0:
+            return []
+        distances = ((bin(stored ^ dhash).count("1"), path) for stored, path in self._by_hash.items())
+        return [path for distance, path in sorted(distances) if distance <= self.near_duplicate_bits]
+
+    @staticmethod
+    def _same_pixels(image, object_path):
+        """
+        The hash only says two frames look alike from afar (a new error toast barely moves it),
+        so a candidate is confirmed pixel by pixel before a frame is dropped.
+        """
+        try:
+            with Image.open(object_path) as stored:
+                if stored.size != image.size:
+                    return False
+                extrema = ImageChops.difference(stored.convert("RGB"), image.convert("RGB")).getextrema()
+        except OSError:
+            return False
+        return max(high for _, high in extrema) <= NEAR_DUPLICATE_TOLERANCE
+
+    def _encode(self, image):
+        buffer = io.BytesIO()
+        if self.format == "webp":
+            image.save(buffer, "WEBP", lossless=True, method=4)  # Lossless: failure forensics stay pixel-exact
+        else:
+            image.save(buffer, "PNG", optimize=True)
+        return buffer.getvalue()
+
+    def _write_object(self, data, digest, dhash=None):
+        """ Write an object unless it already exists; never replaces one a screenshot may already link to. """
+        file = f"{digest}-{dhash:0{HASH_SIZE * HASH_SIZE // 4}x}{self.extension}" if dhash is not None else f"{digest}.png"
+        object_path = os.path.join(self.root, file)
+        if os.path.exists(object_path):
+            return object_path
+        temp_path = f"{object_path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as stored:
+            stored.write(data)
+        try:
+            os.link(temp_path, object_path)  # Atomic and exclusive: another process may have won the race
+        except FileExistsError:
+            pass
+        except OSError:
+            os.replace(temp_path, object_path)  # No hard links here, so nothing can be linked to the old inode
+            return object_path
+        os.remove(temp_path)
+        return object_path
+
+    def _delta(self, image, path, previous, frame_path):
+        """ Store the region that changed since the previous frame next to the full frame; None when it is too big. """
+        if previous is None or previous[0].size != image.size:
+            return None
+        base_image, base_path = previous
+        box = ImageChops.difference(base_image.convert("RGB"), image.convert("RGB")).getbbox()
+        if box is None or (box[2] - box[0]) * (box[3] - box[1]) > DELTA_MAX_AREA * image.width * image.height:
+            return None
+        crop = image.crop(box)
+        data = self._encode(crop)
+        object_path = self._write_object(data, hashlib.sha256(data).hexdigest()[:16], _dhash(crop))
+        with self._lock, open(os.path.join(self.root, "deltas.jsonl"), "a", encoding="utf-8") as manifest:
+            manifest.write(json.dumps({"name": os.path.basename(path), "object": os.path.basename(object_path),
+                                       "base": os.path.basename(base_path), "frame": os.path.basename(frame_path),
+                                       "box": list(box)}) + "\n")
+        return object_path
+
+    def _count(self, outcome):
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def save(self, data, path, encode=None):
+        """
+        ✅ ScreenshotWriter `write` callback: dedupe, encode and store `data`, then link it at `path`.
+        Lookups hold the lock, decoding and encoding do not, so the writer threads still encode in parallel.
+        A digest is reserved before it is stored, so identical frames in flight wait for the first one.
+        """
+        if encode is not None:
+            data = encode(data)
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        with self._lock:
+            if self._by_digest is None:
+                self._load()
+            object_path = self._by_digest.get(digest)
+            pending = self._in_flight.get(digest)
+            if (object_path is None or not os.path.exists(object_path)) and pending is None:
+                object_path, reservation = None, Future()
+                self._in_flight[digest] = reservation
+
+        if object_path is not None:
+            self._count("exact")
+        elif pending is not None:
+            object_path = pending.result()  # Raises if the first writer failed, like it did there
+            self._count("exact")
+        else:
+            try:
+                object_path = self._store(data, digest, path)
+            except BaseException as e:
+                reservation.set_exception(e)
+                raise
+            finally:
+                with self._lock:
+                    self._in_flight.pop(digest, None)
+                    if object_path is not None:
+                        self._by_digest[digest] = object_path
+            reservation.set_result(object_path)
+
+        _link(object_path, path)
+        return path
+
+    def _store(self, data, digest, path):
+        """ Full-frame object for a frame not stored under this digest yet: a near duplicate or a new object. """
+        if Image is None:
+            object_path = self._write_object(data, digest)
+            self._count("stored")
+            return object_path
+
+        image = Image.open(io.BytesIO(data))
+        image.load()
+        dhash = _dhash(image)
+        with self._lock:
+            candidates, previous = self._candidates(dhash), self._previous
+        object_path = next((candidate for candidate in candidates if self._same_pixels(image, candidate)), None)
+        if object_path is not None:
+            self._count("near")
+            return object_path
+
+        object_path = self._write_object(self._encode(image), digest, dhash)
+        with self._lock:
+            self._by_hash[dhash] = object_path
+            self._previous = (image, object_path)
+        self._count("stored")
+        # ✅ The delta is an extra object only: `path` and the digest index always point at the full frame
+        if self.save_deltas and self._delta(image, path, previous, object_path) is not None:
+            self._count("deltas")
+        return object_path
+
+    def restore(self, path):
+        """ ✅ Full frame (PIL Image) rebuilt from a screenshot's delta and its base; a plain Image.open() otherwise. """
+        name = os.path.basename(path)
+        manifest = os.path.join(self.root, "deltas.jsonl")
+        if os.path.exists(manifest):
+            with open(manifest, encoding="utf-8") as deltas:
+                for line in deltas:
+                    entry = json.loads(line)
+                    if entry["name"] == name:
+                        image = Image.open(os.path.join(self.root, entry["base"])).convert("RGB")
+                        image.paste(Image.open(os.path.join(self.root, entry["object"])), tuple(entry["box"][:2]))
+                        return image
+        return Image.open(path)
+
+    def prune(self, max_age_days=STORE_MAX_AGE_DAYS, max_bytes=STORE_MAX_BYTES):
+        """ ✅ Drop objects no screenshot links to any more, by age and total size. """
+        if not os.path.isdir(self.root):
+            return 0
+        bases = set()  # Objects that deltas are drawn on stay as long as the manifest needs them
+        manifest = os.path.join(self.root, "deltas.jsonl")
+        if os.path.exists(manifest):
+            with open(manifest, encoding="utf-8") as deltas:
+                bases = {json.loads(line)["base"] for line in deltas if line.strip()}
+
+        def removable(path, stat):
+            return path.endswith(IMAGE_EXTENSIONS) and stat.st_nlink <= 1 and os.path.basename(path) not in bases
+
+        with self._lock:
+            freed = prune_dir(self.root, max_age_days, max_bytes, removable)
+            self._by_digest = None  # Re-index on the next save
+            self._by_hash = {}
+        if freed:
+            logger.info(f"🧹 Pruned {freed // 1024} KB of unused screenshots from {self.root}")
+        return freed
+
+
+class _DirLock:
+    """ ✅ Exclusive flock on `<path>.lock`; `blocking=False` makes acquired False instead of waiting. """
+
+    def __init__(self, path, blocking=True):
+        self.path = path + ".lock"
+        self.blocking = blocking
+        self.acquired = False
+        self._file = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, "a")
+        if fcntl is None:
+            self.acquired = True  # Windows: no parallel workers sharing folders (see Utilities.parallel)
+            return self
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | (0 if self.blocking else fcntl.LOCK_NB))
+            self.acquired = True
+        except OSError:
+            self.acquired = False
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.acquired and fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+
+
+def rotate_dir(current_dir, archive_dir):
+    """
+    ✅ Move last run's screenshots out of the way with one rename: `current_dir` becomes
+    `archive_dir/<timestamp>` and an empty `current_dir` is created. O(1) however many files it holds.
+    Returns the archived folder, or None when there was nothing to archive.
+    """
+    with _DirLock(current_dir):
+        try:
+            with os.scandir(current_dir) as entries:
+                if next(entries, None) is None:
+                    return None
+        except FileNotFoundError:
+            os.makedirs(current_dir, exist_ok=True)
+            return None
+        os.makedirs(archive_dir, exist_ok=True)
+        target = os.path.join(archive_dir, datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f"))
+        os.rename(current_dir, target)
+        os.makedirs(current_dir, exist_ok=True)
+    return target
+
+
+def compress_archives(archive_dir, store=None, max_age_days=STORE_MAX_AGE_DAYS, max_bytes=STORE_MAX_BYTES):
+    """
+    ✅ Zip every rotated folder in `archive_dir`, prune the zips by age and total size, then prune the store.
+    Runs on a background thread from archive_old_screenshots; folders another process is working on are skipped.
+    """
+    try:
+        for folder in sorted(os.listdir(archive_dir)):
+            path = os.path.join(archive_dir, folder)
+            if not os.path.isdir(path):
+                continue
+            with _DirLock(path, blocking=False) as lock:
+                if not lock.acquired or not os.path.isdir(path):
+                    continue
+                temp_zip = shutil.make_archive(path + ".tmp", "zip", path)
+                os.replace(temp_zip, path + ".zip")
+                shutil.rmtree(path)  # Drops the hard links, so store objects only archived here become prunable
+            os.remove(lock.path)
+        prune_dir(archive_dir, max_age_days, max_bytes, removable=lambda path, stat: path.endswith(".zip"))
+        if store is not None:
+            store.prune(max_age_days, max_bytes)
+    except Exception as e:
+        logger.warning(f"⚠️ Screenshot archiving failed: {e}")
+
+
+screenshot_writer = ScreenshotWriter()
+atexit.register(screenshot_writer.shutdown)
+screenshot_store = ScreenshotStore()
+
+
+def wait_for_screenshot(path, timeout=10):
+    """ ✅ True once the screenshot returned by take_screenshot() is on disk (e.g. before attaching it to a report). """
+    return bool(path) and screenshot_writer.wait(path, timeout)
+
+
+def flush_screenshots(timeout=FLUSH_TIMEOUT):
+    """ ✅ Make sure every queued screenshot is written (call before reports are generated). """
+    pending = screenshot_writer.flush(timeout)
+    stats = screenshot_store.stats
+    if stats["exact"] or stats["near"] or stats["deltas"]:
+        logger.info(f"🖼️ Screenshot store: {stats['stored']} stored, {stats['exact']} exact and "
+                    f"{stats['near']} near duplicates linked, {stats['deltas']} deltas recorded")
+    return pending
@@ -0,0 +1,128 @@
+import base64
+import json
+import time
+from selenium.common.exceptions import WebDriverException
+from Utilities.logger import logger  # Import centralized logger
+
+DEFAULT_TTL = 900  # Seconds to trust a snapshot when the server gives no expiry
+EXPIRY_MARGIN = 60  # Drop snapshots this many seconds before the token actually expires
+
+# Cookie keys accepted by WebDriver's add_cookie
+COOKIE_KEYS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+def _jwt_expiry(value):
+    """Return the 'exp' claim of a JWT string, or None if the value is not a JWT."""
+    if not isinstance(value, str) or value.count(".") != 2:
+        return None
+    payload = value.split(".")[1]
+    try:
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+def _find_token_expiry(cookies, local_storage):
+    """Earliest expiry of any JWT found in cookies or localStorage (values may be JSON blobs)."""
+    candidates = [cookie.get("value") for cookie in cookies]
+    for value in local_storage.values():
+        candidates.append(value)
+        try:
+            parsed = json.loads(value)
+        except (TypeError, ValueError):
+            continue
+        if isinstance(parsed, dict):
+            candidates.extend(v for v in parsed.values() if isinstance(v, str))
+
+    expiries = [exp for exp in map(_jwt_expiry, candidates) if exp]
+    return min(expiries) if expiries else None
+
+
+class LoginSnapshot:
+    """Cookies and localStorage of an authenticated session plus where it was taken."""
+
+    def __init__(self, cookies, local_storage, internal_url, expires_at):
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.internal_url = internal_url
+        self.expires_at = expires_at
+
+    def is_expired(self):
+        return time.time() >= self.expires_at
+
+
+class LoginSessionCache:
+    """
+    One real UI login per worker and environment; later tests inject the captured
+    cookies and localStorage instead of typing credentials again.
+    """
+
+    def __init__(self, default_ttl=DEFAULT_TTL):
+        self.default_ttl = default_ttl
+        self._snapshots = {}  # env -> LoginSnapshot
+
+    @property
+    def enabled(self):
+        return self.default_ttl > 0
+
+    def get(self, env):
+        """Return a live snapshot for the environment, or None."""
+        snapshot = self._snapshots.get(env)
+        if snapshot and snapshot.is_expired():
+            logger.info(f"🔑 Cached login for {env} expired, a fresh login is required.")
+            self.invalidate(env)
+            return None
+        return snapshot
+
+    def invalidate(self, env):
+        self._snapshots.pop(env, None)
+
+    def capture(self, driver, env, internal_url):
+        """Snapshot the logged-in browser state after a successful UI login."""
+        if not self.enabled:
+            return None
+
+        cookies = driver.get_cookies()
+        local_storage = driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+
+        # ✅ Prefer the server's own token expiry, then cookie expiry, then the default TTL
+        expires_at = _find_token_expiry(cookies, local_storage)
+        if expires_at is None:
+            cookie_expiries = [cookie["expiry"] for cookie in cookies if cookie.get("expiry")]
+            expires_at = min(cookie_expiries) if cookie_expiries else None
+        if expires_at is None:
+            expires_at = time.time() + self.default_ttl
+        expires_at -= EXPIRY_MARGIN
+
+        snapshot = LoginSnapshot(cookies, local_storage, internal_url, expires_at)
+        self._snapshots[env] = snapshot
+        logger.info(f"🔑 Cached login session for {env} "
+                    f"(valid for {int(expires_at - time.time())}s, {len(cookies)} cookies).")
+        return snapshot
+
+    def restore(self, driver, snapshot, base_url):
+        """Inject a snapshot into the browser and open the Internal page. Returns False on failure."""
+        try:
+            driver.get(base_url)  # Cookies and storage can only be set on the app's origin
+
+            for cookie in snapshot.cookies:
+                cookie = {key: cookie[key] for key in COOKIE_KEYS if key in cookie}
+                try:
+                    driver.add_cookie(cookie)
+                except WebDriverException:
+                    cookie.pop("domain", None)  # Retry host-only if the domain is rejected
+                    driver.add_cookie(cookie)
+
+            driver.execute_script(
+                "for (const [key, value] of Object.entries(arguments[0])) {"
+                "  window.localStorage.setItem(key, value);"
+                "}",
+                snapshot.local_storage,
+            )
+            driver.get(snapshot.internal_url)
+            return True
+        except WebDriverException as e:
+            logger.warning(f"⚠️ Failed to restore cached login session: {e}")
+            return False
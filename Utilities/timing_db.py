@@ -0,0 +1,84 @@
+import json
+import os
+import sqlite3
+import statistics
+import time
+
+DEFAULT_DB_PATH = os.path.join("Reports", "test_timings.sqlite")
+DEFAULT_ESTIMATE = 30.0  # Seconds assumed for a test that has never run and when there is no history at all
+SMOOTHING = 0.5  # Weight of the newest run in the moving average
+
+# ✅ Pytest plugin part: main.py loads this module with "-p Utilities.timing_db" and sets BOOST_TIMINGS_FILE
+_durations = {}
+
+
+def pytest_runtest_logreport(report):
+    """ ✅ Add up setup + call + teardown, so fixture work (logins, batch uploads) counts towards the test. """
+    _durations.setdefault(report.nodeid, {"seconds": 0.0, "skipped": False})
+    _durations[report.nodeid]["seconds"] += report.duration
+    if report.skipped:
+        _durations[report.nodeid]["skipped"] = True
+
+
+def pytest_sessionfinish(session):
+    """ ✅ Dump this process's durations for main.py to store in the timing database. """
+    path = os.getenv("BOOST_TIMINGS_FILE")
+    if path and _durations:
+        with open(path, "w", encoding="utf-8") as timings_file:
+            json.dump(_durations, timings_file)
+
+
+def read_durations(path):
+    """ ✅ Durations written by one pytest process, without skipped tests. {nodeid: seconds} """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as timings_file:
+        durations = json.load(timings_file)
+    return {nodeid: entry["seconds"] for nodeid, entry in durations.items() if not entry["skipped"]}
+
+
+class TimingDB:
+    """
+    Historical test durations per (environment, node id), kept in a local sqlite file.
+    Only main.py writes to it, after the workers have finished.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS timings ("
+            " env TEXT NOT NULL, nodeid TEXT NOT NULL,"
+            " avg_seconds REAL NOT NULL, last_seconds REAL NOT NULL,"
+            " runs INTEGER NOT NULL, updated_at REAL NOT NULL,"
+            " PRIMARY KEY (env, nodeid))"
+        )
+
+    def record(self, env, durations):
+        """ ✅ Fold the latest durations into the moving average of each test. """
+        now = time.time()
+        with self.connection:
+            for nodeid, seconds in durations.items():
+                row = self.connection.execute(
+                    "SELECT avg_seconds, runs FROM timings WHERE env = ? AND nodeid = ?", (env, nodeid)
+                ).fetchone()
+                if row:
+                    avg_seconds = (1 - SMOOTHING) * row[0] + SMOOTHING * seconds
+                    runs = row[1] + 1
+                else:
+                    avg_seconds, runs = seconds, 1
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO timings VALUES (?, ?, ?, ?, ?, ?)",
+                    (env, nodeid, avg_seconds, seconds, runs, now),
+                )
+
+    def estimates(self, env, node_ids):
+        """ ✅ Expected seconds per test; unknown tests get the median of the known ones. """
+        known = dict(self.connection.execute("SELECT nodeid, avg_seconds FROM timings WHERE env = ?", (env,)))
+        relevant = [known[nodeid] for nodeid in node_ids if nodeid in known]
+        default = statistics.median(relevant) if relevant else DEFAULT_ESTIMATE
+        return {nodeid: known.get(nodeid, default) for nodeid in node_ids}, len(relevant)
+
+    def close(self):
+        self.connection.close()
@@ -1,51 +1,94 @@
 import os
-import shutil
+import threading
 import pytest
 from datetime import datetime
-from Utilities.logger import logger  # Import centralized logger
+from Utilities.logger import logger, get_output_dir, get_worker_id  # Import centralized logger
+from Utilities.screenshots import (screenshot_writer, screenshot_store, wait_for_screenshot, flush_screenshots,
+                                   rotate_dir, compress_archives)
+from Utilities.capture_policy import get_capture_policy
+from Utilities.config import load_config
 
 # ✅ Fetch environment dynamically (Default to DEV)
 ENV = os.getenv("ENVIRONMENT", "DEV").upper()
 
 # ✅ Define Screenshot Paths
-SCREENSHOT_DIR = os.path.join(os.getcwd(), "Screenshots", ENV)  # Store per environment
-ARCHIVE_DIR = os.path.join(SCREENSHOT_DIR, "archive")  # Archive folder
+SCREENSHOT_DIR = os.path.join(os.getcwd(), get_output_dir("Screenshots"))  # Store per environment (and worker)
+ARCHIVE_DIR = os.path.join(os.getcwd(), get_output_dir(os.path.join("Screenshots", "archive")))  # One zip per run
+
+
+# ✅ Browser download folder
+def get_download_dir():
+    """Folder the browser saves downloads to: ~/Downloads, or a private folder per parallel worker."""
+    if get_worker_id():
+        download_dir = os.path.join(os.getcwd(), get_output_dir("Downloads"))
+        os.makedirs(download_dir, exist_ok=True)
+        return download_dir
+    return os.path.expanduser("~/Downloads")
 
 
 # ✅ Archive old Screenshots before running tests
+_archived = False
+
+
 def archive_old_screenshots():
-    """Moves old Screenshots to an archive folder before new test execution."""
-    os.makedirs(ARCHIVE_DIR, exist_ok=True)  # Ensure archive directory exists
+    """
+    Moves the previous run's Screenshots into a timestamped archive folder before new test execution.
+    The move is a single rename; zipping and pruning the archive happen on a background thread.
+    Runs once per process, however many times it is called.
+    """
+    global _archived
+    if _archived:
+        return None
+    _archived = True
 
-    for file in os.listdir(SCREENSHOT_DIR):
-        if file.endswith(".png") and not file.startswith("archive"):
-            old_screenshot = os.path.join(SCREENSHOT_DIR, file)
-            new_archive_path = os.path.join(ARCHIVE_DIR, file)
+    try:
+        archived = rotate_dir(SCREENSHOT_DIR, ARCHIVE_DIR)
+    except OSError as e:
+        logger.error(f"❌ Failed to archive old Screenshots: {e}")
+        archived = None
+    if archived:
+        logger.info(f"📂 Archived old Screenshots to {archived}")
 
-            try:
-                shutil.move(old_screenshot, new_archive_path)  # Move file to archive
-                logger.info(f"📂 Archived old screenshot: {file}")
-            except Exception as e:
-                logger.error(f"❌ Failed to archive {file}: {e}")
+    # ✅ Zip and prune in the background instead of blocking the first test
+    threading.Thread(target=compress_archives, args=(ARCHIVE_DIR, screenshot_store),
+                     name="screenshot-archiver", daemon=True).start()
+    return archived
+
+
+# ✅ Write captured screenshot bytes in the background
+def write_screenshot(data, screenshot_path):
+    """Queues a captured screenshot for the writer pool (deduplicated and re-encoded by the store)."""
+    return screenshot_writer.submit(data, screenshot_path, write=screenshot_store.save)
 
 
 # ✅ Capture Screenshot with Correct Naming Convention
-def take_screenshot(driver, test_name):
-    """Captures a screenshot and saves it with correct format inside the environment folder."""
+def take_screenshot(driver, test_name, force_write=False):
+    """
+    Captures a screenshot and saves it with correct format inside the environment folder.
+    Only the capture blocks; the file is written in the background. The path is returned at once,
+    use wait_for_screenshot(path) before reading the file. In the 'buffer' screenshot mode the
+    capture is held in memory and only written if the test fails, unless `force_write` is set.
+    """
 
     # ✅ Ensure Screenshot directory exists
     os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 
-    # ✅ Generate filename format: ENV_testname_YYYY-MM-DD_HH-MM-SS.png
+    # ✅ Generate filename format: ENV_testname_YYYY-MM-DD_HH-MM-SS.webp (.png without Pillow)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    screenshot_filename = f"{test_name}_{timestamp}.png"
+    screenshot_filename = f"{test_name}_{timestamp}{screenshot_store.extension}"
 
     # ✅ Define the full path
     screenshot_path = os.path.join(SCREENSHOT_DIR, screenshot_filename)
 
     try:
-        driver.save_screenshot(screenshot_path)
-        logger.info(f"✅ Screenshot saved: {screenshot_path}")
+        data = driver.get_screenshot_as_png()
+        policy = get_capture_policy()
+        if policy.buffering and not force_write:
+            policy.buffer(data, screenshot_path)
+            logger.info(f"✅ Screenshot buffered: {screenshot_path}")
+            return screenshot_path
+        write_screenshot(data, screenshot_path)
+        logger.info(f"✅ Screenshot queued: {screenshot_path}")
         return screenshot_path  # Return path for pytest attachment
     except Exception as e:
         logger.error(f"❌ Failed to take screenshot: {e}")
@@ -55,38 +98,26 @@ def take_screenshot(driver, test_name):
 # ✅ Fetch Environment-Specific Test Data
 def get_test_data(env=None):
     """
-    Dynamically fetches test data from system environment variables based on the set environment.
+    Returns the validated, read-only test data for the selected environment (see Utilities.config).
 
     :param env: Environment variable (DEV, UAT, PROD)
-    :return: Dictionary of test data for the selected environment
+    :return: Mapping of test data for the selected environment, loaded once per process
     """
-    if not env:
-        env = os.getenv("ENVIRONMENT", "DEV").upper()  # Read from system env
+    return load_config(env.upper() if env else None)
 
-    prefix = f"{env}_"  # Prefix for environment variables
 
-    # Fetch all matching environment variables dynamically
-    test_data = {
-        key[len(prefix):].lower(): value
-        for key, value in os.environ.items()
-        if key.startswith(prefix) and value
-    }
-
-    if not test_data:
-        logger.error(f"❌ No environment variables found for {env}. Please check your settings.")
-        raise ValueError(f"❌ Missing environment variables for {env}")
-
-    logger.info(f"✅ Test data loaded for {env} environment: {test_data}")
-    return test_data
+# ✅ Session-wide configuration, loaded and validated once
+@pytest.fixture(scope="session")
+def env_config(request):
+    """Pytest fixture with the frozen test data for the --env parameter."""
+    return get_test_data(request.config.getoption("--env"))
 
 
 # ✅ Pytest Fixture to Inject Test Data into Tests
 @pytest.fixture(scope="function")
-def test_data(request):
-    """Pytest fixture to load test data dynamically from system environment based on --env parameter."""
-    env = request.config.getoption("--env")  # Capture the --env parameter from pytest
-    return get_test_data(env)
-
+def test_data(env_config):
+    """Pytest fixture giving each test the shared read-only test data (no environment scan per test)."""
+    return env_config
 
 
 
@@ -1,53 +1,69 @@
-import openpyxl
-
-# Global dictionary to store headers from each sheet
-global_headers = {}
-
-def extract_headers(file_path):
-    """Extract headers from all sheets in an Excel file by detecting bold formatting, regardless of row position."""
-    global global_headers
-    global_headers.clear()  # Clear previous data
-
-    # Load the Excel file
-    workbook = openpyxl.load_workbook(file_path, data_only=True)
-
-    for sheet_name in workbook.sheetnames:
-        sheet = workbook[sheet_name]
-
-        headers = []
-        found_headers = False  # Flag to stop after finding the first header row
-
-        # Iterate through all rows and columns
-        for row in sheet.iter_rows():
-            row_headers = []  # Temporary storage for possible headers
-            bold_count = 0
-
-            for cell in row:
-                if cell.value and cell.font and cell.font.bold:  # Detect bold cells
-                    bold_count += 1
-                    row_headers.append(cell.value)
-                elif cell.value:
-                    row_headers.append(cell.value)
-                else:
-                    row_headers.append("")  # Keep column structure
-
-            # If at least 50% of the row is bold, consider it as the header row
-            if bold_count >= (len(row_headers) * 0.5):
-                headers = row_headers
-                found_headers = True
-                break  # Stop searching once headers are found
-
-        if found_headers:
-            global_headers[sheet_name] = headers
-
-    return global_headers
-
-# Call function to populate global_headers
-file_path = "C:/Users/Adithya G/formyself/Boost-Qa/Testdata/20250114-PNC.xlsx"
-extract_headers(file_path)
-
-# Print the extracted headers without extra quotes
-print("Extracted Headers:")
-for sheet, headers in global_headers.items():
-    print(f"\nSheet: {sheet}")
-    print("Headers:", ', '.join(filter(None, headers)))  # Removes empty columns from display
+import os
+import openpyxl
+
+PARSER_VERSION = 1  # Bump when the output of extract_headers changes (invalidates Utilities.parse_cache)
+# Only the first rows of a sheet are searched for the bold header row
+HEADER_SCAN_ROWS = 50
+
+# Global dictionary to store headers from each sheet
+global_headers = {}
+
+
+def find_header_row(sheet, max_rows=HEADER_SCAN_ROWS):
+    """Return the first row (as a list of values) where at least half of the cells are bold, or None."""
+    for row in sheet.iter_rows(max_row=max_rows):
+        row_headers = []  # Temporary storage for possible headers
+        bold_count = 0
+
+        for cell in row:
+            if cell.value and cell.font and cell.font.bold:  # Detect bold cells
+                bold_count += 1
+                row_headers.append(cell.value)
+            elif cell.value:
+                row_headers.append(cell.value)
+            else:
+                row_headers.append("")  # Keep column structure
+
+        # If at least 50% of the row is bold, consider it as the header row
+        if bold_count and bold_count >= (len(row_headers) * 0.5):
+            return row_headers  # Stop reading the sheet once headers are found
+
+    return None
+
+
+def extract_headers(file_path, max_rows=HEADER_SCAN_ROWS):
+    """Extract headers from all sheets in an Excel file by detecting bold formatting, regardless of row position."""
+    global global_headers
+    global_headers.clear()  # Clear previous data
+
+    # Stream the Excel file: read-only mode only loads the rows we actually scan
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        for sheet_name in workbook.sheetnames:
+            headers = find_header_row(workbook[sheet_name], max_rows)
+            if headers is not None:
+                global_headers[sheet_name] = headers
+    finally:
+        workbook.close()  # Read-only workbooks keep the file open until closed
+
+    return global_headers
+
+
+def extract_header_maps(file_path, max_rows=HEADER_SCAN_ROWS):
+    """Return {sheet: {header: column index}} (0-based, empty header cells skipped) for every sheet with headers."""
+    return {
+        sheet_name: {header: index for index, header in enumerate(headers) if header}
+        for sheet_name, headers in extract_headers(file_path, max_rows).items()
+    }
+
+
+if __name__ == "__main__":
+    # Call function to populate global_headers
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Testdata", "20250114-PNC.xlsx")
+    extract_headers(file_path)
+
+    # Print the extracted headers without extra quotes
+    print("Extracted Headers:")
+    for sheet, headers in global_headers.items():
+        print(f"\nSheet: {sheet}")
+        print("Headers:", ', '.join(filter(None, headers)))  # Removes empty columns from display
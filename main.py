@@ -1,9 +1,14 @@
 import os
 import subprocess
 import argparse
+import time
 from datetime import datetime
 import sys
 
+from Utilities.parallel import (collect_node_ids, select_shard, schedule_longest_first, run_workers,
+                                merge_junit_reports, merge_html_reports)
+from Utilities.timing_db import TimingDB, DEFAULT_DB_PATH, read_durations
+
 # ✅ Setup argument parser
 parser = argparse.ArgumentParser(description="Run Pytest tests with environment and reporting options.")
 parser.add_argument("--env", type=str, default="DEV", choices=["DEV", "UAT", "PROD"],
@@ -12,12 +17,17 @@ parser.add_argument("--tests", type=str, default="Testcases/",
                     help="Specify the test file or directory to run. Defaults to 'Testcases/'.")
 parser.add_argument("--headless", action="store_true",
                     help="Run tests in headless mode")
+parser.add_argument("--workers", type=int, default=1,
+                    help="Number of parallel pytest processes. Defaults to 1 (serial run).")
+parser.add_argument("--shard", type=str, default=None,
+                    help="Run only shard i of n (e.g. 2/4) of the collected tests, for splitting across CI machines.")
+parser.add_argument("--timings-db", type=str, default=DEFAULT_DB_PATH,
+                    help=f"sqlite file with historical test durations used to balance workers. Defaults to '{DEFAULT_DB_PATH}'.")
 
 args = parser.parse_args()
 
 env = args.env.upper()  # Ensure uppercase for consistency
 tests_to_run = args.tests
-headless_flag = "--headless" if args.headless else ""  # ✅ Enable headless mode if passed
 
 # ✅ Explicitly set the environment variable in the OS
 os.environ["ENVIRONMENT"] = env  # This ensures that all Python modules read the correct ENV
@@ -29,6 +39,21 @@ os.makedirs(REPORTS_DIR, exist_ok=True)
 
 timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 report_folder = os.path.join(REPORTS_DIR, f"test_report_{env}_{timestamp}")
+os.makedirs(report_folder, exist_ok=True)
+html_report = os.path.join(report_folder, "report.html")
+junit_report = os.path.join(report_folder, "junit.xml")
+
+# ✅ Pytest command shared by every run (no shell, so every argument reaches pytest)
+pytest_cmd = [
+    PYTHON_EXECUTABLE, "-m", "pytest",
+    "-v",  # 👈 Add verbose flag to see test execution details
+    "--tb=short",
+    "--capture=sys",
+    f"--env={env}",
+    "-p", "Utilities.timing_db",  # ✅ Records per-test durations for the timing database
+]
+if args.headless:
+    pytest_cmd.append("--headless")  # ✅ Enable headless mode if passed
 
 # ✅ Display the test execution details
 print(f"🚀 Running tests in environment: {env}")
@@ -36,20 +61,57 @@ print(f"📂 Test location: {tests_to_run}")
 print(f"📄 Report will be generated in: {report_folder}")
 print(f"🖥️ Headless Mode: {'Enabled' if args.headless else 'Disabled'}")
 
-# ✅ Run Pytest with dynamic parameters
-exit_code = subprocess.run(
-    [
-        PYTHON_EXECUTABLE, "-m", "pytest",
-        tests_to_run,
-        "-v",  # 👈 Add verbose flag to see test execution details
-        "--tb=short",
-        "--capture=sys",
-        "--html-report", report_folder,
-        f"--env={env}",
-        headless_flag
-    ],
-    shell=True,
-).returncode
+timing_db = TimingDB(args.timings_db)
+
+if args.workers <= 1 and not args.shard:
+    # ✅ Serial run, same as before
+    timings_file = os.path.join(report_folder, "timings.json")
+    started = time.monotonic()
+    exit_code = subprocess.run(
+        pytest_cmd + [tests_to_run, f"--html={html_report}", "--self-contained-html", f"--junitxml={junit_report}"],
+        env=dict(os.environ, BOOST_TIMINGS_FILE=timings_file),
+    ).returncode
+    actual = time.monotonic() - started
+
+    durations = read_durations(timings_file)
+    estimates, known = timing_db.estimates(env, list(durations))
+    if known:
+        print(f"⏱️ Predicted {sum(estimates.values()):.0f}s, actual {actual:.0f}s")
+    timing_db.record(env, durations)
+else:
+    # ✅ Parallel/sharded run: collect once, bin-pack test groups by past duration, one process per worker
+    node_ids = collect_node_ids(pytest_cmd, tests_to_run)
+    if args.shard:
+        node_ids = select_shard(node_ids, args.shard)
+        print(f"🧩 Shard {args.shard}: {len(node_ids)} tests")
+
+    if not node_ids:
+        print("⚠️ No tests collected, nothing to run.")
+        exit_code = 5
+    else:
+        estimates, known = timing_db.estimates(env, node_ids)
+        chunks, predicted = schedule_longest_first(node_ids, estimates, args.workers)
+        print(f"🧵 Running {len(node_ids)} tests on {len(chunks)} worker(s) "
+              f"({known} with timing history, predicted wall-clock {max(predicted):.0f}s)")
+
+        started = time.monotonic()
+        results = run_workers(pytest_cmd, chunks, report_folder)
+        actual = time.monotonic() - started
+
+        # ✅ Predicted vs actual, per worker and for the whole run
+        for (worker, result), worker_predicted in zip(results.items(), predicted):
+            print(f"⏱️ Worker {worker}: predicted {worker_predicted:.0f}s, actual {result['seconds']:.0f}s")
+        print(f"⏱️ Wall-clock: predicted {max(predicted):.0f}s, actual {actual:.0f}s")
+
+        for result in results.values():
+            timing_db.record(env, read_durations(result["timings"]))
+
+        merged = merge_junit_reports({worker: result["junit"] for worker, result in results.items()}, junit_report)
+        merge_html_reports(merged, {worker: result["html"] for worker, result in results.items()}, html_report,
+                           title=f"Test report {env} {timestamp}")
+        exit_code = next((result["exit_code"] for result in results.values() if result["exit_code"] != 0), 0)
+
+timing_db.close()
 
 
 # ✅ Print success/failure message